@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Async Ingestion Engine
+======================
+
+Asyncio counterpart of the thread-based batch import: a single event
+loop keeps hundreds of XML-RPC calls in flight over a bounded pool of
+keep-alive aiohttp connections, instead of a handful of threads each
+blocked on a ServerProxy call.
+
+The engine is library code for import scripts written as coroutines;
+``OdooImporter`` keeps using the thread-based connection pool.
+
+Usage::
+
+    async def import_partners(batch):
+        ids = await client.execute_kw('res.partner', 'create', [batch])
+        return {'imported': len(ids), 'errors': 0}
+    
+    async with AsyncOdooClient(connection_config) as client:
+        processor = AsyncBatchProcessor(import_config, max_concurrent_batches=50)
+        results = await processor.process_parallel_batches(partners, import_partners)
+"""
+
+import asyncio
+import logging
+import time
+import xmlrpc.client
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import aiohttp
+
+from batch_processor import BatchProcessor
+from connection_manager import ConnectionConfig
+
+
+class AsyncOdooClient:
+    """
+    Async Odoo XML-RPC Client
+    =========================
+    
+    Sends ``execute_kw`` calls over an aiohttp session. At most
+    ``max_in_flight`` calls (``config.max_in_flight`` unless given) run at
+    once; further callers wait for a slot, which is what applies
+    backpressure to the batch workers. Calls whose connection could not
+    be opened are retried with exponential backoff. Dropped connections
+    and timeouts are not retried, since the call may already have been
+    applied.
+    """
+    
+    def __init__(self, config: ConnectionConfig, max_in_flight: Optional[int] = None):
+        self.config = config
+        self.max_in_flight = max_in_flight or config.max_in_flight
+        self.logger = logging.getLogger(__name__)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._uid = None
+        self._stats = {
+            'requests': 0,
+            'retries': 0,
+            'in_flight': 0,
+            'peak_in_flight': 0
+        }
+    
+    async def __aenter__(self) -> 'AsyncOdooClient':
+        await self.open()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def open(self) -> None:
+        """Create the HTTP session and authenticate"""
+        connector = aiohttp.TCPConnector(
+            limit=self.max_in_flight,
+            limit_per_host=self.max_in_flight,
+            keepalive_timeout=30
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+        )
+        await self.authenticate()
+    
+    async def close(self) -> None:
+        """Close the HTTP session and its sockets"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def _call(self, service: str, method: str, params: tuple) -> Any:
+        """Send one XML-RPC call, waiting for a free slot first"""
+        body = xmlrpc.client.dumps(params, method, allow_none=True).encode()
+        
+        async with self._slots:
+            self._stats['requests'] += 1
+            self._stats['in_flight'] += 1
+            self._stats['peak_in_flight'] = max(self._stats['peak_in_flight'], self._stats['in_flight'])
+            try:
+                async with self._session.post(
+                    f'{self.config.url}/xmlrpc/2/{service}',
+                    data=body,
+                    headers={'Content-Type': 'text/xml'}
+                ) as response:
+                    if response.status != 200:
+                        raise ConnectionError(f"HTTP {response.status} from Odoo")
+                    data = await response.read()
+            finally:
+                self._stats['in_flight'] -= 1
+        
+        result, _ = xmlrpc.client.loads(data)
+        return result[0] if result else None
+    
+    async def authenticate(self) -> int:
+        """
+        Authenticate with Odoo server
+        
+        Returns:
+            int: User ID
+        """
+        uid = await self._call(
+            'common', 'authenticate',
+            (self.config.db, self.config.username, self.config.password, {})
+        )
+        if not uid:
+            raise ConnectionError("Authentication failed - invalid credentials")
+        
+        self._uid = uid
+        self.logger.info(f"Authenticated as user ID: {self._uid}")
+        return uid
+    
+    async def execute_kw(self, model: str, method: str, args: list, kwargs: dict = None) -> Any:
+        """
+        Execute Odoo model method, retrying when Odoo cannot be reached
+        
+        Args:
+            model: Odoo model name (e.g., 'res.partner')
+            method: Method to execute (e.g., 'create')
+            args: Method arguments
+            kwargs: Method keyword arguments
+        
+        Returns:
+            Method execution result
+        """
+        params = (
+            self.config.db, self._uid, self.config.password,
+            model, method, args, kwargs or {}
+        )
+        
+        attempts = max(1, self.config.max_retries)
+        for attempt in range(attempts):
+            try:
+                return await self._call('object', 'execute_kw', params)
+            except aiohttp.ClientConnectorError as e:
+                # The request never left, so sending it again cannot duplicate it
+                if attempt == attempts - 1:
+                    raise ConnectionError(
+                        f"Failed after {attempts} attempts. Last error: {e}"
+                    ) from e
+                self.logger.warning(f"Connection error on attempt {attempt + 1}: {e}")
+                self._stats['retries'] += 1
+                await asyncio.sleep(self.config.retry_delay * (2 ** attempt))
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get request, retry and concurrency counters"""
+        return self._stats.copy()
+
+
+class AsyncBatchProcessor(BatchProcessor):
+    """
+    Async Batch Processor
+    =====================
+    
+    Runs an async ``processor_func`` over batches with a fixed number of
+    worker tasks, so at most ``max_concurrent_batches`` batches are in
+    progress at a time. A batch that does not finish within
+    ``batch_timeout`` seconds is cancelled and counted as failed.
+    
+    Results follow the ``BatchProcessor`` contract: the processor
+    returns ``imported``/``errors`` (or ``successful``/``failed``) counts
+    and ``process_parallel_batches`` returns processed/successful/failed
+    totals.
+    """
+    
+    def __init__(self, config, max_concurrent_batches: int = 50, batch_timeout: float = 300.0):
+        super().__init__(config)
+        self.max_concurrent_batches = max_concurrent_batches
+        self.batch_timeout = batch_timeout
+    
+    async def process_parallel_batches(
+        self,
+        data: List[Any],
+        processor_func: Callable[[List[Any]], Awaitable[Dict[str, int]]],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Process batches concurrently on the event loop
+        
+        Args:
+            data: List of data items to process
+            processor_func: Coroutine function processing one batch
+            progress_callback: Optional callback for progress updates
+        
+        Returns:
+            Processing results summary
+        """
+        if not data:
+            return {'processed': 0, 'successful': 0, 'failed': 0}
+        
+        self._reset_stats()
+        self._stats['start_time'] = datetime.now()
+        self._stats['total_records'] = len(data)
+        
+        batches = list(self._create_batches(data, self.batch_size))
+        self._stats['total_batches'] = len(batches)
+        
+        workers = min(self.max_concurrent_batches, len(batches))
+        self.logger.info(f"Starting async processing of {len(batches)} batches with {workers} workers")
+        
+        results = {'processed': 0, 'successful': 0, 'failed': 0}
+        pending = iter(enumerate(batches))
+        
+        async def worker() -> None:
+            for batch_index, batch in pending:
+                batch_result = await self._safe_process_batch_async(batch_index, batch, processor_func)
+                
+                for key in results:
+                    results[key] += batch_result.get(key, 0)
+                self._stats['successful_records'] += batch_result.get('successful', 0)
+                self._stats['failed_records'] += batch_result.get('failed', 0)
+                
+                if progress_callback:
+                    progress_callback(results['processed'], len(data))
+        
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        
+        self._stats['end_time'] = datetime.now()
+        self._log_final_stats()
+        
+        return results
+    
+    async def _safe_process_batch_async(
+        self,
+        batch_index: int,
+        batch: List[Any],
+        processor_func: Callable[[List[Any]], Awaitable[Dict[str, int]]]
+    ) -> Dict[str, int]:
+        """Run one batch with a timeout, never raising"""
+        start = time.monotonic()
+        try:
+            result = await asyncio.wait_for(processor_func(batch), timeout=self.batch_timeout)
+        except asyncio.TimeoutError:
+            self.logger.error(
+                f"Batch {batch_index} timed out after {self.batch_timeout}s; "
+                "records sent before the timeout may have been imported"
+            )
+            self._stats['failed_batches'] += 1
+            self._stats['timed_out_batches'] += 1
+            return {'processed': len(batch), 'successful': 0, 'failed': len(batch)}
+        except Exception as e:
+            self.logger.error(f"Batch {batch_index} failed: {e}")
+            self._stats['failed_batches'] += 1
+            return {'processed': len(batch), 'successful': 0, 'failed': len(batch)}
+        
+        self._stats['successful_batches'] += 1
+        self.logger.debug(f"Batch {batch_index} completed in {time.monotonic() - start:.2f}s")
+        return self._normalize_result(batch, result)
+    
+    def _reset_stats(self):
+        """Reset processing statistics"""
+        super()._reset_stats()
+        self._stats['timed_out_batches'] = 0
@@ -232,25 +232,26 @@ class BatchProcessor:
         """Safely process a batch with error handling"""
         try:
             result = processor_func(batch)
-            
-            # Ensure result has required keys
-            if not isinstance(result, dict):
-                self.logger.warning("Processor function returned non-dict result")
-                return {'processed': len(batch), 'successful': 0, 'failed': len(batch)}
-            
-            # Normalize result keys
-            normalized = {
-                'processed': len(batch),
-                'successful': result.get('imported', result.get('successful', 0)),
-                'failed': result.get('errors', result.get('failed', 0))
-            }
-            
-            return normalized
+            return self._normalize_result(batch, result)
             
         except Exception as e:
             self.logger.error(f"Batch processing error: {e}")
             return {'processed': len(batch), 'successful': 0, 'failed': len(batch)}
     
+    def _normalize_result(self, batch: List[Any], result: Any) -> Dict[str, int]:
+        """Map a processor function result to processed/successful/failed counts"""
+        # Ensure result has required keys
+        if not isinstance(result, dict):
+            self.logger.warning("Processor function returned non-dict result")
+            return {'processed': len(batch), 'successful': 0, 'failed': len(batch)}
+        
+        # Normalize result keys
+        return {
+            'processed': len(batch),
+            'successful': result.get('imported', result.get('successful', 0)),
+            'failed': result.get('errors', result.get('failed', 0))
+        }
+    
     def process_with_chunking(
         self,
         data: List[Any],
@@ -10,6 +10,7 @@ Agent: Connection Management Specialist
 """
 
 import xmlrpc.client
+import http.client
 import logging
 import time
 from contextlib import contextmanager
@@ -29,6 +30,118 @@ class ConnectionConfig:
     timeout: float = 30.0
     max_retries: int = 3
     retry_delay: float = 2.0
+    pool_size: int = 5
+    idle_probe_after: float = 60.0
+    use_gzip: bool = False
+    max_in_flight: int = 200
+
+
+class TransportStats:
+    """Thread-safe socket and request counters shared by transports"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sockets_opened = 0
+        self.requests = 0
+    
+    def record_socket(self):
+        with self._lock:
+            self.sockets_opened += 1
+    
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get counters, including the average number of requests per socket"""
+        with self._lock:
+            return {
+                'sockets_opened': self.sockets_opened,
+                'requests': self.requests,
+                'requests_per_socket': round(self.requests / self.sockets_opened, 2) if self.sockets_opened else 0.0
+            }
+
+
+class _CountingHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection that reports every socket it opens"""
+    
+    def __init__(self, *args, on_connect=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_connect = on_connect
+    
+    def connect(self):
+        super().connect()
+        if self._on_connect:
+            self._on_connect()
+
+
+class _CountingHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection that reports every socket it opens"""
+    
+    def __init__(self, *args, on_connect=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_connect = on_connect
+    
+    def connect(self):
+        super().connect()
+        if self._on_connect:
+            self._on_connect()
+
+
+class KeepAliveTransport(xmlrpc.client.Transport):
+    """
+    Keep-Alive XML-RPC Transport
+    ============================
+    
+    Reuses one HTTP/1.1 socket for every request to the same host, so
+    the ``common`` and ``object`` endpoints of a connection share a single
+    TCP/TLS handshake. Requests are serialized with a lock, making the
+    transport safe to share between threads. A socket closed by the
+    server while idle is reopened transparently.
+    
+    With ``use_gzip``, request bodies above ``gzip_threshold`` bytes are
+    gzip-encoded; the server (or the proxy in front of it) must support
+    gzip request bodies. Gzip responses are accepted either way, as with
+    the standard transport.
+    """
+    
+    gzip_threshold = 1400
+    
+    def __init__(self, use_https: bool = True, timeout: float = 30.0,
+                 use_gzip: bool = False, stats: Optional[TransportStats] = None):
+        super().__init__()
+        self.use_https = use_https
+        self.timeout = timeout
+        self.encode_threshold = self.gzip_threshold if use_gzip else None
+        self.stats = stats or TransportStats()
+        # Reentrant: Transport.single_request calls close() on errors
+        self._request_lock = threading.RLock()
+    
+    def make_connection(self, host):
+        # Reuse the open connection for the same host (HTTP/1.1 keep-alive)
+        if self._connection and host == self._connection[0]:
+            return self._connection[1]
+        
+        chost, self._extra_headers, x509 = self.get_host_info(host)
+        if self.use_https:
+            connection = _CountingHTTPSConnection(
+                chost, timeout=self.timeout, on_connect=self.stats.record_socket, **(x509 or {})
+            )
+        else:
+            connection = _CountingHTTPConnection(
+                chost, timeout=self.timeout, on_connect=self.stats.record_socket
+            )
+        self._connection = host, connection
+        return connection
+    
+    def request(self, host, handler, request_body, verbose=False):
+        with self._request_lock:
+            self.stats.record_request()
+            return super().request(host, handler, request_body, verbose)
+    
+    def close(self):
+        with self._request_lock:
+            super().close()
 
 
 class OdooConnection:
@@ -37,17 +150,23 @@ class OdooConnection:
     ==============================
     
     Provides authenticated connection with automatic retry
-    and error handling capabilities.
+    and error handling capabilities. Health is tracked passively:
+    a call that ends on a socket error marks the connection unhealthy,
+    a successful call marks it healthy again.
     """
     
-    def __init__(self, config: ConnectionConfig):
+    def __init__(self, config: ConnectionConfig, transport_stats: Optional[TransportStats] = None):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self.transport_stats = transport_stats or TransportStats()
+        self._transport = None
         self._common = None
         self._models = None
         self._uid = None
         self._authenticated = False
         self._lock = threading.Lock()
+        self.healthy = True
+        self.last_used = time.monotonic()
     
     def authenticate(self) -> bool:
         """
@@ -61,10 +180,20 @@ class OdooConnection:
                 if self._authenticated:
                     return True
                 
+                # Both endpoints share one keep-alive socket; close any
+                # left over from an earlier login first
+                self._reset_transport()
+                self._transport = KeepAliveTransport(
+                    use_https=self.config.url.startswith('https'),
+                    timeout=self.config.timeout,
+                    use_gzip=self.config.use_gzip,
+                    stats=self.transport_stats
+                )
+                
                 # Create common endpoint connection
                 self._common = xmlrpc.client.ServerProxy(
                     f'{self.config.url}/xmlrpc/2/common',
-                    timeout=self.config.timeout,
+                    transport=self._transport,
                     allow_none=True
                 )
                 
@@ -87,7 +216,7 @@ class OdooConnection:
                 # Create models endpoint connection
                 self._models = xmlrpc.client.ServerProxy(
                     f'{self.config.url}/xmlrpc/2/object',
-                    timeout=self.config.timeout,
+                    transport=self._transport,
                     allow_none=True
                 )
                 
@@ -140,6 +269,8 @@ class OdooConnection:
                     kwargs
                 )
                 
+                self.healthy = True
+                self.last_used = time.monotonic()
                 return result
                 
             except xmlrpc.client.Fault as e:
@@ -160,11 +291,11 @@ class OdooConnection:
             except (ConnectionError, socket.timeout, socket.error) as e:
                 self.logger.warning(f"Connection error on attempt {attempt + 1}: {e}")
                 last_exception = e
+                self.healthy = False
                 
                 # Reset connection on network errors
                 self._authenticated = False
-                self._common = None
-                self._models = None
+                self._reset_transport()
                 
                 # Try to re-establish connection
                 if attempt < self.config.max_retries - 1:
@@ -179,6 +310,15 @@ class OdooConnection:
         # All retries failed
         raise ConnectionError(f"Failed after {self.config.max_retries} attempts. Last error: {last_exception}")
     
+    def idle_time(self) -> float:
+        """
+        Seconds since the last successful call
+        
+        Returns:
+            float: Idle time in seconds
+        """
+        return time.monotonic() - self.last_used
+    
     def test_connection(self) -> bool:
         """
         Test connection health
@@ -194,12 +334,19 @@ class OdooConnection:
             self.logger.error(f"Connection test failed: {e}")
             return False
     
+    def _reset_transport(self):
+        """Drop the endpoint proxies and close their socket"""
+        if self._transport is not None:
+            self._transport.close()
+        self._transport = None
+        self._common = None
+        self._models = None
+    
     def close(self):
         """Close connection and cleanup resources"""
         with self._lock:
             self._authenticated = False
-            self._common = None
-            self._models = None
+            self._reset_transport()
             self._uid = None
             self.logger.debug("Connection closed")
 
@@ -210,7 +357,12 @@ class OdooConnectionManager:
     ====================================
     
     Manages multiple connections with connection pooling,
-    health checks, and automatic reconnection.
+    passive health tracking, and automatic reconnection.
+    
+    Pooled connections are not probed on every checkout: connections
+    that hit a socket error are dropped when returned, and only those
+    idle for longer than ``idle_probe_after`` seconds are probed before
+    being handed out again.
     """
     
     def __init__(self, config):
@@ -221,12 +373,65 @@ class OdooConnectionManager:
             password=config.password,
             timeout=config.connection_timeout,
             max_retries=config.max_retries,
-            retry_delay=config.retry_delay
+            retry_delay=config.retry_delay,
+            pool_size=config.pool_size,
+            idle_probe_after=config.idle_probe_after,
+            use_gzip=config.use_gzip
         )
         self.logger = logging.getLogger(__name__)
         self._pool = []
         self._pool_lock = threading.Lock()
-        self._max_pool_size = 5
+        self._max_pool_size = self.config.pool_size
+        self._transport_stats = TransportStats()
+        self._stats = {
+            'checkouts': 0,
+            'created': 0,
+            'reused': 0,
+            'probes': 0,
+            'probe_failures': 0,
+            'discarded': 0,
+            'checkout_time_total': 0.0,
+            'checkout_time_max': 0.0
+        }
+    
+    def _checkout(self) -> OdooConnection:
+        """
+        Take a pooled connection, probing it only if it sat idle too long,
+        or create a new one
+        
+        Returns:
+            OdooConnection: Authenticated connection instance
+        """
+        connection = None
+        with self._pool_lock:
+            if self._pool:
+                # Most recently returned first, so the least idle is reused
+                connection = self._pool.pop()
+        
+        if connection is not None and connection.idle_time() > self.config.idle_probe_after:
+            with self._pool_lock:
+                self._stats['probes'] += 1
+            if not connection.test_connection():
+                self.logger.info("Idle pooled connection unhealthy, creating new one")
+                with self._pool_lock:
+                    self._stats['probe_failures'] += 1
+                connection.close()
+                connection = None
+        
+        if connection is not None:
+            with self._pool_lock:
+                self._stats['reused'] += 1
+            return connection
+        
+        connection = OdooConnection(self.config, self._transport_stats)
+        if not connection.authenticate():
+            connection.close()
+            raise ConnectionError("Failed to authenticate new connection")
+        
+        with self._pool_lock:
+            self._stats['created'] += 1
+        self.logger.debug("Created new Odoo connection")
+        return connection
     
     @contextmanager
     def get_connection(self):
@@ -236,40 +441,33 @@ class OdooConnectionManager:
         Yields:
             OdooConnection: Authenticated connection instance
         """
-        connection = None
+        # The pool never blocks; checkout time is the idle probe or the
+        # connect and login of a new connection
+        start = time.monotonic()
+        connection = self._checkout()
+        elapsed = time.monotonic() - start
+        with self._pool_lock:
+            self._stats['checkouts'] += 1
+            self._stats['checkout_time_total'] += elapsed
+            self._stats['checkout_time_max'] = max(self._stats['checkout_time_max'], elapsed)
         
         try:
-            # Try to get connection from pool
-            with self._pool_lock:
-                if self._pool:
-                    connection = self._pool.pop()
-                    
-                    # Test connection health
-                    if not connection.test_connection():
-                        self.logger.info("Pooled connection unhealthy, creating new one")
-                        connection.close()
-                        connection = None
-            
-            # Create new connection if needed
-            if connection is None:
-                connection = OdooConnection(self.config)
-                if not connection.authenticate():
-                    raise ConnectionError("Failed to authenticate new connection")
-                
-                self.logger.debug("Created new Odoo connection")
-            
             yield connection
             
         finally:
-            # Return connection to pool if healthy
-            if connection:
-                with self._pool_lock:
-                    if len(self._pool) < self._max_pool_size and connection.test_connection():
-                        self._pool.append(connection)
-                        self.logger.debug("Returned connection to pool")
-                    else:
-                        connection.close()
-                        self.logger.debug("Closed connection (pool full or unhealthy)")
+            # Return connection to pool unless it failed on the network
+            with self._pool_lock:
+                pooled = connection.healthy and len(self._pool) < self._max_pool_size
+                if pooled:
+                    self._pool.append(connection)
+                else:
+                    self._stats['discarded'] += 1
+            
+            if pooled:
+                self.logger.debug("Returned connection to pool")
+            else:
+                connection.close()
+                self.logger.debug("Closed connection (pool full or unhealthy)")
     
     def test_connection_config(self) -> Dict[str, Any]:
         """
@@ -308,10 +506,20 @@ class OdooConnectionManager:
             self._pool.clear()
             self.logger.info("Connection pool cleaned up")
     
-    def get_pool_stats(self) -> Dict[str, int]:
+    def get_pool_stats(self) -> Dict[str, Any]:
         """Get connection pool statistics"""
         with self._pool_lock:
+            checkouts = self._stats['checkouts']
             return {
                 'pooled_connections': len(self._pool),
-                'max_pool_size': self._max_pool_size
+                'max_pool_size': self._max_pool_size,
+                'checkouts': checkouts,
+                'created': self._stats['created'],
+                'reused': self._stats['reused'],
+                'probes': self._stats['probes'],
+                'probe_failures': self._stats['probe_failures'],
+                'discarded': self._stats['discarded'],
+                'avg_checkout_ms': round(self._stats['checkout_time_total'] / checkouts * 1000, 2) if checkouts else 0.0,
+                'max_checkout_ms': round(self._stats['checkout_time_max'] * 1000, 2),
+                **self._transport_stats.snapshot()
             }
\ No newline at end of file
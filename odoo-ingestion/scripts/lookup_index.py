@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Lookup Indexes
+==============
+
+In-memory key -> record ID maps for the lookups repeated during an
+import (product SKU, partner email, country code). Each map is read once
+with paged ``search_read`` calls fetching a single field, then kept up to
+date as the importers create records, so resolving an order line or
+checking whether a customer exists no longer costs a ``search`` RPC.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_PAGE_SIZE = 5000
+
+
+class LookupIndex:
+    """
+    Key -> ID index for one field of one model
+    ==========================================
+
+    When several records share a key, the one with the lowest ID wins.
+    Once loaded, the index is authoritative: a key that is not in it
+    resolves to None without an RPC. Records created during the import
+    must therefore be registered with ``add``; records created by other
+    processes after the load are not seen.
+    """
+
+    def __init__(self, model: str, field: str, normalize: Optional[Callable[[str], str]] = None,
+                 page_size: int = DEFAULT_PAGE_SIZE):
+        self.model = model
+        self.field = field
+        self.normalize = normalize or (lambda key: key)
+        self.page_size = page_size
+        self.logger = logging.getLogger(__name__)
+        self._ids: Dict[str, int] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'rpc_calls': 0}
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index has been read from Odoo"""
+        return self._loaded
+
+    def load(self, conn) -> int:
+        """
+        Read all keys in pages ordered by ID
+
+        Args:
+            conn: Odoo connection
+
+        Returns:
+            int: Number of keys indexed
+        """
+        with self._lock:
+            if self._loaded:
+                return len(self._ids)
+
+            last_id = 0
+            while True:
+                rows = conn.execute_kw(
+                    self.model, 'search_read',
+                    [[[self.field, '!=', False], ['id', '>', last_id]]],
+                    {'fields': [self.field], 'order': 'id', 'limit': self.page_size}
+                )
+                self._stats['rpc_calls'] += 1
+                for row in rows:
+                    self._ids.setdefault(self.normalize(row[self.field]), row['id'])
+                if len(rows) < self.page_size:
+                    break
+                last_id = rows[-1]['id']
+
+            self._loaded = True
+            self.logger.info(f"Indexed {len(self._ids)} {self.model}.{self.field} values")
+            return len(self._ids)
+
+    def get(self, conn, key: str) -> Optional[int]:
+        """
+        Resolve a key to a record ID, loading the index on first use
+
+        Args:
+            conn: Odoo connection
+            key: Lookup key
+
+        Returns:
+            Record ID, or None if no record matches
+        """
+        if not key:
+            return None
+
+        self.load(conn)
+        with self._lock:
+            record_id = self._ids.get(self.normalize(key))
+            self._stats['hits' if record_id is not None else 'misses'] += 1
+        return record_id
+
+    def add(self, key: str, record_id: int):
+        """Register a record created during the import"""
+        if key:
+            with self._lock:
+                self._ids.setdefault(self.normalize(key), record_id)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get size and hit/miss/RPC counters"""
+        with self._lock:
+            return {'size': len(self._ids), **self._stats}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class LookupIndexes:
+    """
+    Shared Import Lookup Indexes
+    ============================
+
+    One instance can be passed to several ``OdooImporter`` objects so that
+    product, partner and order imports share the loaded maps. Each index
+    is loaded on first use.
+    """
+
+    def __init__(self, page_size: int = DEFAULT_PAGE_SIZE):
+        self.products = LookupIndex('product.product', 'default_code', page_size=page_size)
+        self.partners = LookupIndex('res.partner', 'email', page_size=page_size)
+        self.countries = LookupIndex('res.country', 'code', normalize=str.upper, page_size=page_size)
+
+    def product_id(self, conn, sku: str) -> Optional[int]:
+        """Get product ID by SKU"""
+        return self.products.get(conn, sku)
+
+    def partner_id(self, conn, email: str) -> Optional[int]:
+        """Get partner ID by email"""
+        return self.partners.get(conn, email)
+
+    def country_id(self, conn, code: str) -> Optional[int]:
+        """Get country ID by ISO code"""
+        return self.countries.get(conn, code)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get size and hit/miss counters per index"""
+        return {
+            'products': self.products.get_stats(),
+            'partners': self.partners.get_stats(),
+            'countries': self.countries.get_stats(),
+        }
@@ -35,6 +35,7 @@ from odoo_ingestion.scripts.data_models import (
 )
 from odoo_ingestion.scripts.batch_processor import BatchProcessor
 from odoo_ingestion.scripts.error_handler import ErrorHandler
+from odoo_ingestion.scripts.lookup_index import LookupIndexes
 from odoo_ingestion.scripts.progress_tracker import ProgressTracker
 
 
@@ -49,6 +50,10 @@ class ImportConfig:
     max_retries: int = 3
     retry_delay: float = 2.0
     connection_timeout: float = 30.0
+    pool_size: int = 5
+    idle_probe_after: float = 60.0
+    use_gzip: bool = False
+    lookup_page_size: int = 5000
     log_level: str = "INFO"
     progress_file: str = "data/import_progress.json"
     backup_dir: str = "data/backups"
@@ -63,9 +68,12 @@ class OdooImporter:
     
     Orchestrates the entire import process with robust error handling,
     batch processing, and progress tracking capabilities.
+    
+    SKU, email and country lookups go through ``lookup_indexes``; pass the
+    same ``LookupIndexes`` to several importers to load them only once.
     """
     
-    def __init__(self, config: ImportConfig):
+    def __init__(self, config: ImportConfig, lookup_indexes: Optional[LookupIndexes] = None):
         self.config = config
         self.setup_logging()
         self.setup_directories()
@@ -76,6 +84,14 @@ class OdooImporter:
         self.error_handler = ErrorHandler(config)
         self.progress_tracker = ProgressTracker(config)
         
+        # Category IDs by name, filled as product batches resolve them
+        self._category_ids: Dict[str, int] = {}
+        
+        # SKU, email and country code -> ID maps, loaded on first lookup
+        self.lookup_indexes = lookup_indexes or LookupIndexes(
+            page_size=getattr(config, 'lookup_page_size', 5000)
+        )
+        
         # Import statistics
         self.stats = {
             'start_time': None,
@@ -306,154 +322,249 @@ class OdooImporter:
         return templates
     
     def _process_product_batch(self, conn, batch: List[Tuple[str, List[Dict]]]) -> Dict[str, int]:
-        """Process a batch of product templates"""
+        """
+        Process a batch of product templates with few RPCs
+        
+        Categories and existing templates are looked up with one
+        ``search_read`` each, missing categories and templates are created
+        with one list-``create`` each and variants of multi-variant
+        templates with one more, so new templates cost a constant number of
+        calls. Updates of existing templates (``ODOO_UPDATE_EXISTING``) still
+        cost about one ``write`` per template, see ``_write_grouped``. A
+        rejected list-create is retried record by record so that one bad
+        row only fails its own template.
+        """
         results = {'imported': 0, 'errors': 0, 'skipped': 0}
+        failed: Dict[str, str] = {}
+        
+        try:
+            category_ids = self._resolve_categories(
+                conn, [variants[0].get('category', 'default') for _, variants in batch]
+            )
+            existing = self._execute(
+                conn, 'product.template', 'search_read',
+                [[['name', 'in', list({variants[0]['name'] for _, variants in batch})]]],
+                {'fields': ['name']}
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to prefetch product batch: {e}")
+            for template_name, variants in batch:
+                self.error_handler.log_error('product_batch', template_name, str(e), variants)
+                results['errors'] += len(variants)
+            return results
+        
+        existing_ids = {}
+        for template in existing:
+            existing_ids.setdefault(template['name'], template['id'])
+        update_existing = self._should_update_existing()
         
+        template_ids: Dict[str, int] = {}
+        to_create = []
+        to_update = []
         for template_name, variants in batch:
-            try:
-                # Get main product info from first variant
-                main_product = variants[0]
-                
-                # Check if template already exists
-                existing_templates = conn.execute_kw(
-                    self.config.db, conn.uid, self.config.password,
-                    'product.template', 'search',
-                    [[['name', '=', main_product['name']]]]
-                )
-                
-                if existing_templates and not self._should_update_existing():
-                    results['skipped'] += len(variants)
-                    continue
-                
-                # Get or create product category
-                category_id = self._get_or_create_category(conn, main_product.get('category', 'default'))
-                
-                # Create product template
-                template_data = {
-                    'name': main_product['name'],
-                    'categ_id': category_id,
-                    'type': 'product',
-                    'invoice_policy': 'order',
-                    'purchase_method': 'purchase',
-                    'list_price': float(main_product.get('list_price', 0.0)),
-                    'standard_price': float(main_product.get('standard_cost', 0.0)),
-                    'description': main_product.get('description', ''),
-                    'active': main_product.get('status', 'active') == 'active',
-                }
-                
-                if existing_templates:
-                    # Update existing template
-                    template_id = existing_templates[0]
-                    conn.execute_kw(
-                        self.config.db, conn.uid, self.config.password,
-                        'product.template', 'write',
-                        [[template_id], template_data]
-                    )
-                else:
-                    # Create new template
-                    template_id = conn.execute_kw(
-                        self.config.db, conn.uid, self.config.password,
-                        'product.template', 'create', [template_data]
-                    )
-                
-                # Create variants if multiple exist
-                if len(variants) > 1:
-                    self._create_product_variants(conn, template_id, variants)
-                else:
-                    # Update single variant
-                    self._update_product_variant(conn, template_id, variants[0])
-                
+            main_product = variants[0]
+            values = self._template_values(main_product, category_ids[main_product.get('category', 'default').title()])
+            if len(variants) == 1:
+                # The template's default_code is stored on its only variant
+                values['default_code'] = main_product.get('sku', '')
+            
+            template_id = existing_ids.get(main_product['name'])
+            if template_id is None:
+                to_create.append((template_name, values))
+            elif update_existing:
+                template_ids[template_name] = template_id
+                values.pop('name')
+                to_update.append((template_name, template_id, values))
+            else:
+                results['skipped'] += len(variants)
+        
+        created, errors = self._create_records(conn, 'product.template', to_create)
+        template_ids.update(created)
+        failed.update(errors)
+        failed.update(self._write_grouped(conn, 'product.template', to_update))
+        
+        # Templates with several variants get one product.product per row
+        variant_rows = [
+            (template_name, self._variant_values(template_ids[template_name], variant))
+            for template_name, variants in batch
+            if len(variants) > 1 and template_name in template_ids and template_name not in failed
+            for variant in variants
+        ]
+        _, errors = self._create_records(conn, 'product.product', variant_rows)
+        failed.update(errors)
+        self._index_variants(conn, [
+            template_id for template_name, template_id in template_ids.items()
+            if template_name not in failed
+        ])
+        
+        for template_name, variants in batch:
+            if template_name in failed:
+                self.error_handler.log_error('product_batch', template_name, failed[template_name], variants)
+                results['errors'] += len(variants)
+            elif template_name in template_ids:
                 results['imported'] += len(variants)
                 self.logger.debug(f"Processed template: {template_name} with {len(variants)} variants")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to process template {template_name}: {e}")
-                self.error_handler.log_error('product_batch', template_name, str(e), variants)
-                results['errors'] += len(variants)
         
         return results
     
-    def _get_or_create_category(self, conn, category_name: str) -> int:
-        """Get existing category ID or create new one"""
-        # Search for existing category
-        category_ids = conn.execute_kw(
-            self.config.db, conn.uid, self.config.password,
-            'product.category', 'search',
-            [[['name', '=', category_name.title()]]]
-        )
+    def _index_variants(self, conn, template_ids: List[int]):
+        """
+        Register the SKUs of the templates' variants in a loaded SKU index
+        
+        Single-variant templates create their product.product implicitly,
+        so the variant IDs are read back with one ``search_read``. Nothing
+        is read while the index is unloaded, since loading picks them up.
+        """
+        if not template_ids or not self.lookup_indexes.products.loaded:
+            return
+        
+        try:
+            variants = self._execute(
+                conn, 'product.product', 'search_read',
+                [[['product_tmpl_id', 'in', template_ids], ['default_code', '!=', False]]],
+                {'fields': ['default_code']}
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to index variants of {len(template_ids)} templates: {e}")
+            return
         
-        if category_ids:
-            return category_ids[0]
+        for variant in variants:
+            self.lookup_indexes.products.add(variant['default_code'], variant['id'])
+    
+    def _execute(self, conn, model: str, method: str, args: list, kwargs: dict = None) -> Any:
+        """Call a model method through the pooled connection"""
+        return conn.execute_kw(model, method, args, kwargs or {})
+    
+    def _resolve_categories(self, conn, category_names: List[str]) -> Dict[str, int]:
+        """
+        Map category names to IDs, creating missing categories in one call
+        
+        Resolved IDs are remembered for later batches.
+        """
+        names = {name.title() for name in category_names} - set(self._category_ids)
+        if names:
+            for category in self._execute(
+                conn, 'product.category', 'search_read',
+                [[['name', 'in', sorted(names)]]], {'fields': ['name']}
+            ):
+                self._category_ids.setdefault(category['name'], category['id'])
+            
+            missing = sorted(names - set(self._category_ids))
+            if missing:
+                new_ids = self._execute(
+                    conn, 'product.category', 'create',
+                    [[{'name': name, 'parent_id': False} for name in missing]]
+                )
+                self._category_ids.update(zip(missing, new_ids))
         
-        # Create new category
-        category_data = {
-            'name': category_name.title(),
-            'parent_id': False
+        return self._category_ids
+    
+    def _template_values(self, product: Dict, category_id: int) -> Dict[str, Any]:
+        """Build product.template values from a product row"""
+        return {
+            'name': product['name'],
+            'categ_id': category_id,
+            'type': 'product',
+            'invoice_policy': 'order',
+            'purchase_method': 'purchase',
+            'list_price': float(product.get('list_price', 0.0)),
+            'standard_price': float(product.get('standard_cost', 0.0)),
+            'description': product.get('description', ''),
+            'active': product.get('status', 'active') == 'active',
+        }
+    
+    def _variant_values(self, template_id: int, variant: Dict) -> Dict[str, Any]:
+        """Build product.product values from a variant row"""
+        variant_data = {
+            'product_tmpl_id': template_id,
+            'default_code': variant.get('sku', ''),
+            'standard_price': float(variant.get('standard_cost', 0.0)),
+            'list_price': float(variant.get('list_price', 0.0)),
         }
         
-        return conn.execute_kw(
-            self.config.db, conn.uid, self.config.password,
-            'product.category', 'create', [category_data]
-        )
+        # Add variant attributes (color, size, etc.)
+        if variant.get('color'):
+            variant_data['attribute_color'] = variant['color']
+        if variant.get('size'):
+            variant_data['attribute_size'] = variant['size']
+        
+        return variant_data
     
-    def _create_product_variants(self, conn, template_id: int, variants: List[Dict]):
-        """Create product variants for a template"""
-        for variant in variants:
+    def _create_records(self, conn, model: str, rows: List[Tuple[str, Dict]]) -> Tuple[Dict[str, int], Dict[str, str]]:
+        """
+        Create records with a single list-create
+        
+        If Odoo rejects the list (an XML-RPC fault, so nothing was
+        committed), the rows are created one by one to isolate the bad
+        ones. Any other failure may come after Odoo committed the list, so
+        all rows are reported as failed instead of being sent again.
+        
+        Args:
+            conn: Odoo connection
+            model: Model name
+            rows: (key, values) pairs; several rows may share a key
+            
+        Returns:
+            Tuple of (created ID per key, error message per failed key)
+        """
+        if not rows:
+            return {}, {}
+        
+        created: Dict[str, int] = {}
+        errors: Dict[str, str] = {}
+        try:
+            ids = self._execute(conn, model, 'create', [[values for _, values in rows]])
+            for (key, _), record_id in zip(rows, ids):
+                created.setdefault(key, record_id)
+            return created, errors
+        except xmlrpc.client.Fault as e:
+            self.logger.warning(f"List create of {len(rows)} {model} records failed, retrying one by one: {e}")
+        except Exception as e:
+            self.logger.error(f"List create of {len(rows)} {model} records may not have been applied: {e}")
+            return created, {key: str(e) for key, _ in rows}
+        
+        for key, values in rows:
+            if key in errors:
+                continue
             try:
-                # Create variant-specific attributes
-                variant_data = {
-                    'product_tmpl_id': template_id,
-                    'default_code': variant.get('sku', ''),
-                    'standard_price': float(variant.get('standard_cost', 0.0)),
-                    'list_price': float(variant.get('list_price', 0.0)),
-                }
-                
-                # Add variant attributes (color, size, etc.)
-                if variant.get('color'):
-                    variant_data['attribute_color'] = variant['color']
-                if variant.get('size'):
-                    variant_data['attribute_size'] = variant['size']
-                
-                conn.execute_kw(
-                    self.config.db, conn.uid, self.config.password,
-                    'product.product', 'create', [variant_data]
-                )
-                
+                created.setdefault(key, self._execute(conn, model, 'create', [values]))
             except Exception as e:
-                self.logger.error(f"Failed to create variant {variant.get('sku', 'unknown')}: {e}")
-                raise
+                self.logger.error(f"Failed to create {model} for {key}: {e}")
+                errors[key] = str(e)
+        return created, errors
     
-    def _update_product_variant(self, conn, template_id: int, product_data: Dict):
-        """Update single product variant data"""
-        try:
-            # Get the product variant
-            product_ids = conn.execute_kw(
-                self.config.db, conn.uid, self.config.password,
-                'product.product', 'search',
-                [[['product_tmpl_id', '=', template_id]]]
-            )
-            
-            if not product_ids:
-                return
-            
-            product_id = product_ids[0]
-            
-            # Update variant data
-            variant_data = {
-                'default_code': product_data.get('sku', ''),
-                'standard_price': float(product_data.get('standard_cost', 0.0)),
-                'list_price': float(product_data.get('list_price', 0.0)),
-            }
-            
-            conn.execute_kw(
-                self.config.db, conn.uid, self.config.password,
-                'product.product', 'write',
-                [[product_id], variant_data]
-            )
+    def _write_grouped(self, conn, model: str, updates: List[Tuple[str, int, Dict]]) -> Dict[str, str]:
+        """
+        Apply updates with one write per group of identical values
+        
+        Odoo's ``write`` sets the same values on every record, so only rows
+        whose values match exactly can share a call. Template rows carry
+        their own prices and description, so in practice most updates still
+        go out one record at a time; the grouping only pays off for rows
+        that repeat the same values.
+        
+        Args:
+            conn: Odoo connection
+            model: Model name
+            updates: (key, record ID, values) triples
             
-        except Exception as e:
-            self.logger.error(f"Failed to update variant for template {template_id}: {e}")
-            raise
+        Returns:
+            Error message per failed key
+        """
+        groups: Dict[str, Tuple[Dict, List[Tuple[str, int]]]] = {}
+        for key, record_id, values in updates:
+            group_key = json.dumps(values, sort_keys=True, default=str)
+            groups.setdefault(group_key, (values, []))[1].append((key, record_id))
+        
+        errors: Dict[str, str] = {}
+        for values, members in groups.values():
+            try:
+                self._execute(conn, model, 'write', [[record_id for _, record_id in members], values])
+            except Exception as e:
+                self.logger.error(f"Failed to update {len(members)} {model} records: {e}")
+                for key, _ in members:
+                    errors[key] = str(e)
+        return errors
     
     def _update_inventory_levels(self, conn, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update inventory levels for imported products"""
@@ -469,18 +580,10 @@ class OdooImporter:
                 if 'inventory_on_hand' not in product:
                     continue
                 
-                # Find product by SKU
-                product_ids = conn.execute_kw(
-                    self.config.db, conn.uid, self.config.password,
-                    'product.product', 'search',
-                    [[['default_code', '=', product.get('sku', '')]]]
-                )
-                
-                if not product_ids:
+                product_id = self._get_product_id_by_sku(conn, product.get('sku', ''))
+                if not product_id:
                     continue
                 
-                product_id = product_ids[0]
-                
                 # Create inventory adjustment
                 inventory_data = {
                     'name': f"Import Adjustment - {product.get('sku', '')}",
@@ -519,13 +622,7 @@ class OdooImporter:
         for partner_data in partners:
             try:
                 # Check if partner exists
-                existing_partners = conn.execute_kw(
-                    self.config.db, conn.uid, self.config.password,
-                    'res.partner', 'search',
-                    [[['email', '=', partner_data.get('email', '')]]]
-                )
-                
-                if existing_partners:
+                if self._get_partner_id(conn, partner_data.get('email', '')):
                     results['skipped'] += 1
                     continue
                 
@@ -547,6 +644,7 @@ class OdooImporter:
                     self.config.db, conn.uid, self.config.password,
                     'res.partner', 'create', [partner_vals]
                 )
+                self.lookup_indexes.partners.add(partner_vals['email'], partner_id)
                 
                 results['imported'] += 1
                 self.logger.debug(f"Created partner: {partner_data.get('name')} (ID: {partner_id})")
@@ -611,30 +709,15 @@ class OdooImporter:
     
     def _get_country_id(self, conn, country_code: str) -> int:
         """Get country ID by code"""
-        country_ids = conn.execute_kw(
-            self.config.db, conn.uid, self.config.password,
-            'res.country', 'search',
-            [[['code', '=', country_code.upper()]]]
-        )
-        return country_ids[0] if country_ids else 1  # Default to first country
+        return self.lookup_indexes.country_id(conn, country_code) or 1  # Default to first country
     
     def _get_partner_id(self, conn, email: str) -> Optional[int]:
         """Get partner ID by email"""
-        partner_ids = conn.execute_kw(
-            self.config.db, conn.uid, self.config.password,
-            'res.partner', 'search',
-            [[['email', '=', email]]]
-        )
-        return partner_ids[0] if partner_ids else None
+        return self.lookup_indexes.partner_id(conn, email)
     
     def _get_product_id_by_sku(self, conn, sku: str) -> Optional[int]:
         """Get product ID by SKU"""
-        product_ids = conn.execute_kw(
-            self.config.db, conn.uid, self.config.password,
-            'product.product', 'search',
-            [[['default_code', '=', sku]]]
-        )
-        return product_ids[0] if product_ids else None
+        return self.lookup_indexes.product_id(conn, sku)
     
     def _should_update_existing(self) -> bool:
         """Check if existing records should be updated"""
@@ -677,6 +760,10 @@ def load_config_from_env() -> ImportConfig:
         max_retries=int(os.getenv('MAX_RETRIES', '3')),
         retry_delay=float(os.getenv('RETRY_DELAY', '2.0')),
         connection_timeout=float(os.getenv('CONNECTION_TIMEOUT', '30.0')),
+        pool_size=int(os.getenv('POOL_SIZE', '5')),
+        idle_probe_after=float(os.getenv('IDLE_PROBE_AFTER', '60.0')),
+        use_gzip=os.getenv('USE_GZIP', 'false').lower() == 'true',
+        lookup_page_size=int(os.getenv('LOOKUP_PAGE_SIZE', '5000')),
         log_level=os.getenv('LOG_LEVEL', 'INFO'),
         progress_file=os.getenv('PROGRESS_FILE', 'data/import_progress.json'),
         backup_dir=os.getenv('BACKUP_DIR', 'data/backups'),
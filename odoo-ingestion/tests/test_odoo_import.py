@@ -12,18 +12,25 @@ Agent: Testing Specialist
 import pytest
 import json
 import tempfile
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from pathlib import Path
 from datetime import datetime
 import xmlrpc.client
+import asyncio
+import aiohttp
+import threading
+import socketserver
+from xmlrpc.server import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
 
 # Import modules to test
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from connection_manager import OdooConnectionManager, OdooConnection, ConnectionConfig
+from connection_manager import OdooConnectionManager, OdooConnection, ConnectionConfig, KeepAliveTransport
 from data_models import ProductTemplate, Partner, SaleOrder, ImportProgress
 from batch_processor import BatchProcessor
+from async_engine import AsyncOdooClient, AsyncBatchProcessor
+from lookup_index import LookupIndex, LookupIndexes
 from error_handler import ErrorHandler, ErrorRecord, ErrorCategory, ErrorSeverity
 from progress_tracker import ProgressTracker, OperationProgress
 from odoo_import import OdooImporter, ImportConfig, load_config_from_env
@@ -63,6 +70,26 @@ class TestOdooConnection:
         assert connection._uid == 123
         assert connection._authenticated is True
     
+    @patch('connection_manager.KeepAliveTransport')
+    @patch('xmlrpc.client.ServerProxy')
+    def test_reauthentication_closes_previous_transport(self, mock_server_proxy, mock_transport):
+        """Test that logging in again does not leak the old keep-alive socket"""
+        mock_common = Mock()
+        mock_common.version.return_value = {'server_version': '17.0'}
+        mock_common.authenticate.return_value = 123
+        mock_server_proxy.return_value = mock_common
+        first, second = Mock(), Mock()
+        mock_transport.side_effect = [first, second]
+        
+        connection = OdooConnection(self.config)
+        assert connection.authenticate() is True
+        connection._authenticated = False
+        assert connection.authenticate() is True
+        
+        first.close.assert_called_once()
+        second.close.assert_not_called()
+        assert connection._transport is second
+    
     @patch('xmlrpc.client.ServerProxy')
     def test_authentication_failure(self, mock_server_proxy):
         """Test authentication failure"""
@@ -124,6 +151,146 @@ class TestOdooConnection:
         assert result == [{'id': 1, 'name': 'Test Product'}]
 
 
+class TestOdooConnectionManager:
+    """Test connection pooling and passive health tracking"""
+    
+    def setup_method(self):
+        self.config = ImportConfig(
+            url="https://test.odoo.com",
+            db="test_db",
+            username="test_user",
+            password="test_pass",
+            pool_size=2,
+            idle_probe_after=60.0
+        )
+    
+    def _make_connection(self):
+        connection = Mock()
+        connection.healthy = True
+        connection.authenticate.return_value = True
+        connection.idle_time.return_value = 0.0
+        return connection
+    
+    @patch('connection_manager.OdooConnection')
+    def test_reuse_without_probe(self, mock_connection_class):
+        """Test that a recently used connection is reused without a health probe"""
+        connection = self._make_connection()
+        mock_connection_class.return_value = connection
+        
+        manager = OdooConnectionManager(self.config)
+        with manager.get_connection():
+            pass
+        with manager.get_connection() as conn:
+            assert conn is connection
+        
+        stats = manager.get_pool_stats()
+        assert stats['created'] == 1
+        assert stats['reused'] == 1
+        assert stats['probes'] == 0
+        assert stats['max_pool_size'] == 2
+        connection.test_connection.assert_not_called()
+    
+    @patch('connection_manager.OdooConnection')
+    def test_idle_connection_probed(self, mock_connection_class):
+        """Test that a connection idle past the threshold is probed and replaced if bad"""
+        stale = self._make_connection()
+        fresh = self._make_connection()
+        stale.test_connection.return_value = False
+        mock_connection_class.side_effect = [stale, fresh]
+        
+        manager = OdooConnectionManager(self.config)
+        with manager.get_connection():
+            pass
+        stale.idle_time.return_value = 120.0
+        with manager.get_connection() as conn:
+            assert conn is fresh
+        
+        stats = manager.get_pool_stats()
+        assert stats['probes'] == 1
+        assert stats['probe_failures'] == 1
+        stale.close.assert_called_once()
+    
+    @patch('connection_manager.OdooConnection')
+    def test_unhealthy_connection_discarded(self, mock_connection_class):
+        """Test that a connection marked unhealthy is not returned to the pool"""
+        connection = self._make_connection()
+        mock_connection_class.return_value = connection
+        
+        manager = OdooConnectionManager(self.config)
+        with pytest.raises(ConnectionError):
+            with manager.get_connection() as conn:
+                conn.healthy = False
+                raise ConnectionError("Network error")
+        
+        stats = manager.get_pool_stats()
+        assert stats['pooled_connections'] == 0
+        assert stats['discarded'] == 1
+        connection.close.assert_called_once()
+
+
+class TestKeepAliveTransport:
+    """Test socket reuse of the keep-alive transport"""
+    
+    def setup_method(self):
+        class Handler(SimpleXMLRPCRequestHandler):
+            protocol_version = "HTTP/1.1"
+            rpc_paths = ("/", "/xmlrpc/2/common", "/xmlrpc/2/object")
+        
+        self.server = SimpleXMLRPCServer(("127.0.0.1", 0), requestHandler=Handler, logRequests=False)
+        self.server.register_function(lambda a, b: a + b, "add")
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+    
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def test_requests_share_one_socket(self):
+        """Test that endpoints sharing a transport reuse a single socket"""
+        transport = KeepAliveTransport(use_https=False, timeout=5.0)
+        common = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/common", transport=transport)
+        models = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/object", transport=transport)
+        
+        assert common.add(1, 2) == 3
+        assert models.add(3, 4) == 7
+        assert models.add(5, 6) == 11
+        
+        stats = transport.stats.snapshot()
+        assert stats['sockets_opened'] == 1
+        assert stats['requests'] == 3
+        assert stats['requests_per_socket'] == 3.0
+        transport.close()
+    
+    def test_use_gzip_only_controls_request_encoding(self):
+        """Test that gzip responses are accepted whether or not requests are compressed"""
+        plain = KeepAliveTransport(use_https=False, use_gzip=False)
+        compressed = KeepAliveTransport(use_https=False, use_gzip=True)
+        
+        assert plain.encode_threshold is None
+        assert compressed.encode_threshold == KeepAliveTransport.gzip_threshold
+        assert plain.accept_gzip_encoding and compressed.accept_gzip_encoding
+    
+    def test_shared_between_threads(self):
+        """Test that concurrent callers get their own results"""
+        transport = KeepAliveTransport(use_https=False, timeout=5.0)
+        proxy = xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/object", transport=transport)
+        results = {}
+        
+        def call(i):
+            results[i] = proxy.add(i, i)
+        
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert results == {i: 2 * i for i in range(8)}
+        assert transport.stats.snapshot()['sockets_opened'] == 1
+        transport.close()
+
+
 class TestDataModels:
     """Test data model functionality"""
     
@@ -257,6 +424,129 @@ class TestBatchProcessor:
         assert results['successful'] + results['failed'] == results['processed']
 
 
+class TestAsyncBatchProcessor:
+    """Test async batch processing"""
+    
+    def setup_method(self):
+        self.config = Mock()
+        self.config.batch_size = 10
+        self.processor = AsyncBatchProcessor(self.config, max_concurrent_batches=3, batch_timeout=1.0)
+    
+    def test_bounded_concurrency(self):
+        """Test that no more than max_concurrent_batches run at once"""
+        running = 0
+        peak = 0
+        
+        async def processor_func(batch):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {'imported': len(batch), 'errors': 0}
+        
+        results = asyncio.run(self.processor.process_parallel_batches(list(range(95)), processor_func))
+        
+        assert results == {'processed': 95, 'successful': 95, 'failed': 0}
+        assert peak == 3
+        assert self.processor.get_stats()['successful_batches'] == 10
+    
+    def test_timeout_and_errors_fail_batch(self):
+        """Test that slow or failing batches are counted as failed"""
+        processor = AsyncBatchProcessor(self.config, max_concurrent_batches=3, batch_timeout=0.05)
+        
+        async def processor_func(batch):
+            if batch[0] == 0:
+                await asyncio.sleep(1)
+            if batch[0] == 10:
+                raise ValueError("bad batch")
+            return {'imported': len(batch), 'errors': 0}
+        
+        results = asyncio.run(processor.process_parallel_batches(list(range(30)), processor_func))
+        
+        assert results == {'processed': 30, 'successful': 10, 'failed': 20}
+        stats = processor.get_stats()
+        assert stats['failed_batches'] == 2
+        assert stats['timed_out_batches'] == 1
+
+
+class TestAsyncOdooClient:
+    """Test the async client against a local XML-RPC server"""
+    
+    def setup_method(self):
+        class Handler(SimpleXMLRPCRequestHandler):
+            protocol_version = "HTTP/1.1"
+            rpc_paths = ("/xmlrpc/2/common", "/xmlrpc/2/object")
+        
+        class Server(socketserver.ThreadingMixIn, SimpleXMLRPCServer):
+            daemon_threads = True
+        
+        def execute_kw(db, uid, password, model, method, args, kwargs):
+            return {'model': model, 'method': method, 'uid': uid, 'args': args}
+        
+        self.server = Server(("127.0.0.1", 0), requestHandler=Handler, logRequests=False, allow_none=True)
+        self.server.register_function(lambda db, login, password, context: 7, "authenticate")
+        self.server.register_function(execute_kw, "execute_kw")
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.config = ConnectionConfig(
+            url=f"http://127.0.0.1:{self.server.server_address[1]}",
+            db="test_db",
+            username="test_user",
+            password="test_pass",
+            timeout=5.0
+        )
+    
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def test_concurrent_execute_kw(self):
+        """Test that concurrent calls stay within max_in_flight"""
+        async def run():
+            async with AsyncOdooClient(self.config, max_in_flight=4) as client:
+                results = await asyncio.gather(*(
+                    client.execute_kw('res.partner', 'create', [{'name': f'P{i}'}]) for i in range(20)
+                ))
+                return results, client.get_stats()
+        
+        results, stats = asyncio.run(run())
+        
+        assert results[3] == {'model': 'res.partner', 'method': 'create', 'uid': 7, 'args': [{'name': 'P3'}]}
+        assert stats['requests'] == 21
+        assert stats['peak_in_flight'] <= 4
+    
+    def test_max_in_flight_from_config(self):
+        """Test that the cap defaults to the configured max_in_flight"""
+        self.config.max_in_flight = 3
+        assert AsyncOdooClient(self.config).max_in_flight == 3
+    
+    def test_only_unsent_calls_are_retried(self):
+        """Test that refused connections are retried but dropped ones are not"""
+        self.config.retry_delay = 0.0
+        refused = aiohttp.ClientConnectorError(Mock(), OSError(111, 'Connection refused'))
+        
+        async def run(side_effect):
+            client = AsyncOdooClient(self.config)
+            client._call = AsyncMock(side_effect=side_effect)
+            try:
+                return await client.execute_kw('res.partner', 'create', [{'name': 'P'}])
+            finally:
+                self.calls = client._call.await_count
+        
+        assert asyncio.run(run([refused, 42])) == 42
+        assert self.calls == 2
+        
+        with pytest.raises(aiohttp.ServerDisconnectedError):
+            asyncio.run(run([aiohttp.ServerDisconnectedError(), 42]))
+        assert self.calls == 1
+        
+        self.config.max_retries = 0
+        with pytest.raises(ConnectionError):
+            asyncio.run(run([refused]))
+        assert self.calls == 1
+
+
 class TestErrorHandler:
     """Test error handling functionality"""
     
@@ -456,6 +746,243 @@ class TestOdooImporter:
             assert len(grouped["Test Product_hoodies"]) == 2
             assert len(grouped["Other Product_tshirts"]) == 1
 
+    
+    def _make_importer(self):
+        with patch('pathlib.Path.mkdir'), patch.object(OdooImporter, 'setup_logging'):
+            importer = OdooImporter(self.config)
+        importer.error_handler = Mock()
+        return importer
+    
+    def test_product_batch_uses_constant_rpcs(self):
+        """Test that a product batch costs the same number of calls regardless of size"""
+        calls = []
+        
+        def execute_kw(model, method, args, kwargs):
+            calls.append((model, method))
+            if (model, method) == ('product.category', 'search_read'):
+                return [{'id': 5, 'name': 'Hoodies'}]
+            if (model, method) == ('product.template', 'search_read'):
+                return [{'id': 9, 'name': 'Old Tee'}]
+            if method == 'create':
+                return list(range(100, 100 + len(args[0])))
+            return []
+        
+        conn = Mock()
+        conn.execute_kw.side_effect = execute_kw
+        products = [
+            {"sku": "H-S", "name": "Hoodie", "category": "hoodies", "size": "S"},
+            {"sku": "H-M", "name": "Hoodie", "category": "hoodies", "size": "M"},
+            {"sku": "J-1", "name": "Jogger", "category": "pants"},
+            {"sku": "C-1", "name": "Cap", "category": "hats"},
+            {"sku": "T-1", "name": "Old Tee", "category": "tshirts"},
+        ]
+        
+        importer = self._make_importer()
+        batch = list(importer._group_products_by_template(products).items())
+        with patch.dict('os.environ', {'ODOO_UPDATE_EXISTING': 'false'}):
+            results = importer._process_product_batch(conn, batch)
+        
+        assert results == {'imported': 4, 'errors': 0, 'skipped': 1}
+        assert calls == [
+            ('product.category', 'search_read'),
+            ('product.category', 'create'),
+            ('product.template', 'search_read'),
+            ('product.template', 'create'),
+            ('product.product', 'create'),
+        ]
+        template_rows = conn.execute_kw.call_args_list[3][0][2][0]
+        assert [row['name'] for row in template_rows] == ['Hoodie', 'Jogger', 'Cap']
+        assert template_rows[1]['default_code'] == 'J-1'
+        variant_rows = conn.execute_kw.call_args_list[4][0][2][0]
+        assert [row['default_code'] for row in variant_rows] == ['H-S', 'H-M']
+    
+    def test_product_batch_isolates_bad_rows(self):
+        """Test that a rejected list-create only fails the offending template"""
+        def execute_kw(model, method, args, kwargs):
+            if method == 'search_read':
+                return [{'id': 5, 'name': 'Hoodies'}] if model == 'product.category' else []
+            if len(args[0]) > 1 and isinstance(args[0], list):
+                raise xmlrpc.client.Fault(1, 'ValidationError')
+            if args[0].get('name') == 'Broken':
+                raise xmlrpc.client.Fault(1, 'ValidationError')
+            return 42
+        
+        conn = Mock()
+        conn.execute_kw.side_effect = execute_kw
+        products = [
+            {"sku": "A", "name": "Hoodie", "category": "hoodies"},
+            {"sku": "B", "name": "Broken", "category": "hoodies"},
+        ]
+        
+        importer = self._make_importer()
+        batch = list(importer._group_products_by_template(products).items())
+        results = importer._process_product_batch(conn, batch)
+        
+        assert results == {'imported': 1, 'errors': 1, 'skipped': 0}
+        importer.error_handler.log_error.assert_called_once()
+    
+    def test_product_batch_does_not_resend_after_connection_error(self):
+        """Test that a list-create lost on the network is not retried row by row"""
+        calls = []
+        
+        def execute_kw(model, method, args, kwargs):
+            calls.append((model, method))
+            if method == 'search_read':
+                return [{'id': 5, 'name': 'Hoodies'}] if model == 'product.category' else []
+            raise ConnectionError("Connection reset by peer")
+        
+        conn = Mock()
+        conn.execute_kw.side_effect = execute_kw
+        products = [
+            {"sku": "A", "name": "Hoodie", "category": "hoodies"},
+            {"sku": "B", "name": "Jogger", "category": "hoodies"},
+        ]
+        
+        importer = self._make_importer()
+        batch = list(importer._group_products_by_template(products).items())
+        results = importer._process_product_batch(conn, batch)
+        
+        assert results == {'imported': 0, 'errors': 2, 'skipped': 0}
+        assert calls.count(('product.template', 'create')) == 1
+    
+    def test_product_batch_indexes_created_variants(self):
+        """Test that SKUs created by a batch resolve from a loaded index"""
+        def execute_kw(model, method, args, kwargs):
+            if (model, method) == ('product.category', 'search_read'):
+                return [{'id': 5, 'name': 'Hoodies'}]
+            if (model, method) == ('product.product', 'search_read'):
+                if args[0][0][0] == 'product_tmpl_id':
+                    return [{'id': 300, 'default_code': 'J-1'}]
+                return [{'id': 1, 'default_code': 'OLD'}]
+            if method == 'create':
+                return list(range(100, 100 + len(args[0])))
+            return []
+        
+        conn = Mock()
+        conn.execute_kw.side_effect = execute_kw
+        importer = self._make_importer()
+        assert importer._get_product_id_by_sku(conn, 'J-1') is None
+        
+        batch = list(importer._group_products_by_template(
+            [{"sku": "J-1", "name": "Jogger", "category": "hoodies"}]
+        ).items())
+        importer._process_product_batch(conn, batch)
+        
+        assert importer._get_product_id_by_sku(conn, 'J-1') == 300
+        variant_lookup = conn.execute_kw.call_args_list[-1][0]
+        assert variant_lookup[2] == [[['product_tmpl_id', 'in', [100]], ['default_code', '!=', False]]]
+    
+    def test_lookups_share_preloaded_indexes(self):
+        """Test that orders resolve partners and SKUs from indexes loaded once"""
+        calls = []
+        
+        def execute_kw(*args):
+            # Order creation still passes db, uid and password positionally
+            model, method = args[-4:-2] if len(args) == 4 else args[3:5]
+            calls.append((model, method))
+            if (model, method) == ('res.partner', 'search_read'):
+                return [{'id': 7, 'email': 'jo@example.com'}]
+            if (model, method) == ('product.product', 'search_read'):
+                return [{'id': 11, 'default_code': 'H-S'}, {'id': 12, 'default_code': 'H-M'}]
+            if method == 'create':
+                return 99
+            return []
+        
+        conn = Mock()
+        conn.execute_kw.side_effect = execute_kw
+        orders = [
+            {"order_id": n, "customer_email": "jo@example.com",
+             "order_lines": [{"sku": "H-S", "quantity": 1}, {"sku": "H-M", "quantity": 2}]}
+            for n in range(3)
+        ]
+        
+        indexes = LookupIndexes()
+        first = self._make_importer_with(indexes)
+        second = self._make_importer_with(indexes)
+        first._import_orders(conn, {'orders': orders[:1]})
+        results = second._import_orders(conn, {'orders': orders[1:]})
+        
+        assert results == {'imported': 2, 'errors': 0, 'skipped': 0}
+        lookups = [call for call in calls if call[1] != 'create']
+        assert lookups == [('res.partner', 'search_read'), ('product.product', 'search_read')]
+        assert indexes.get_stats()['products']['hits'] == 6
+    
+    def _make_importer_with(self, lookup_indexes):
+        with patch('pathlib.Path.mkdir'), patch.object(OdooImporter, 'setup_logging'):
+            importer = OdooImporter(self.config, lookup_indexes=lookup_indexes)
+        importer.error_handler = Mock()
+        return importer
+
+
+class TestLookupIndex:
+    """Test preloaded lookup indexes"""
+    
+    def test_load_pages_by_id(self):
+        """Test keyset paging with a single requested field"""
+        pages = [
+            [{'id': 1, 'code': 'us'}, {'id': 2, 'code': 'FR'}],
+            [{'id': 5, 'code': 'IE'}],
+        ]
+        conn = Mock()
+        conn.execute_kw.side_effect = lambda *args: pages.pop(0)
+        index = LookupIndex('res.country', 'code', normalize=str.upper, page_size=2)
+        
+        assert index.load(conn) == 3
+        assert index.get(conn, 'us') == 1
+        assert index.get(conn, 'ie') == 5
+        second_call = conn.execute_kw.call_args_list[1][0]
+        assert second_call[2] == [[['code', '!=', False], ['id', '>', 2]]]
+        assert second_call[3]['fields'] == ['code']
+        assert conn.execute_kw.call_count == 2
+    
+    def test_misses_are_answered_from_the_loaded_index(self):
+        """Test that unknown keys cost no RPC and created records are indexed"""
+        conn = Mock()
+        conn.execute_kw.return_value = [{'id': 3, 'default_code': 'OLD'}]
+        index = LookupIndex('product.product', 'default_code')
+        
+        assert index.get(conn, 'OLD') == 3
+        assert index.get(conn, 'GONE') is None
+        assert index.get(conn, 'GONE') is None
+        index.add('MADE', 7)
+        assert index.get(conn, 'MADE') == 7
+        assert index.get(conn, '') is None
+        assert conn.execute_kw.call_count == 1
+        assert index.get_stats() == {'size': 2, 'hits': 2, 'misses': 2, 'rpc_calls': 1}
+    
+    def test_new_partners_cost_one_create_each(self):
+        """Test that importing new customers needs no per-row existence search"""
+        calls = []
+        
+        def execute_kw(*args):
+            # Partner creation still passes db, uid and password positionally
+            model, method = args[-4:-2] if len(args) == 4 else args[3:5]
+            calls.append((model, method))
+            if method == 'search_read':
+                return [{'id': 1, 'code': 'US'}] if model == 'res.country' else []
+            return 50 + len(calls)
+        
+        conn = Mock()
+        conn.execute_kw.side_effect = execute_kw
+        partners = [
+            {"name": "A", "email": "a@example.com", "country": "us"},
+            {"name": "B", "email": "b@example.com", "country": "us"},
+            {"name": "A again", "email": "a@example.com", "country": "us"},
+        ]
+        config = ImportConfig(url="https://test.odoo.com", db="test_db", username="u", password="p")
+        with patch('pathlib.Path.mkdir'), patch.object(OdooImporter, 'setup_logging'):
+            importer = OdooImporter(config)
+        
+        results = importer._import_partners(conn, {'partners': partners})
+        
+        assert results == {'imported': 2, 'errors': 0, 'skipped': 1}
+        assert calls == [
+            ('res.partner', 'search_read'),
+            ('res.country', 'search_read'),
+            ('res.partner', 'create'),
+            ('res.partner', 'create'),
+        ]
+
 
 class TestConfigLoading:
     """Test configuration loading"""
@@ -0,0 +1,98 @@
+"""Compare XML-RPC and JSON-RPC response decoding for large partner reads.
+
+Builds a synthetic ``search_read`` response of ``res.partner`` rows, encodes
+it the way Odoo does for each protocol and measures decode time and peak
+Python memory with each transport's ``decode``.
+
+Usage:
+    uv run python benchmarks/bench_transport_decode.py [rows]
+"""
+
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+import xmlrpc.client
+from typing import Any, AsyncIterator
+
+from odoo_mcp.transport import JsonRpcTransport, XmlRpcTransport
+
+
+def make_partners(rows: int) -> list[dict[str, Any]]:
+    """Generate partner records shaped like a typical search_read result."""
+    return [
+        {
+            "id": i,
+            "name": f"Customer {i}",
+            "display_name": f"Customer {i}",
+            "email": f"customer{i}@example.com",
+            "phone": f"+353 1 555 {i:04d}",
+            "street": f"{i} Main Street",
+            "city": "Dublin",
+            "zip": f"D{i % 24:02d}",
+            "country_id": [103, "Ireland"],
+            "is_company": i % 5 == 0,
+            "customer_rank": i % 3,
+            "write_date": "2025-01-26 10:00:00",
+        }
+        for i in range(1, rows + 1)
+    ]
+
+
+class FakeStream:
+    """Stand-in for aiohttp's StreamReader."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    async def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        for start in range(0, len(self.body), size):
+            yield self.body[start:start + size]
+
+
+class FakeResponse:
+    """Stand-in for aiohttp's ClientResponse."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.content = FakeStream(body)
+
+    async def read(self) -> bytes:
+        return self.body
+
+
+async def measure(transport: Any, body: bytes) -> tuple[float, int]:
+    """Decode body once and return (seconds, peak bytes)."""
+    response = FakeResponse(body)
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = await transport.decode(response)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+async def main(rows: int) -> None:
+    partners = make_partners(rows)
+    xml_body = xmlrpc.client.dumps((partners,), methodresponse=True).encode()
+    json_body = json.dumps({"jsonrpc": "2.0", "id": 1, "result": partners}).encode()
+    del partners
+
+    print(f"Decoding {rows} res.partner rows")
+    print(f"{'protocol':<10}{'body':>12}{'time':>12}{'peak mem':>12}")
+    for transport, body in (
+        (XmlRpcTransport(), xml_body),
+        (JsonRpcTransport(), json_body),
+    ):
+        elapsed, peak = await measure(transport, body)
+        print(
+            f"{transport.name:<10}{len(body) / 1e6:>10.1f}MB"
+            f"{elapsed * 1000:>10.0f}ms{peak / 1e6:>10.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
@@ -0,0 +1,156 @@
+"""Server-side aggregation through Odoo's read_group."""
+
+from typing import Any, Dict, List, Optional
+
+from .connection import OdooAsyncClient
+from .errors import ValidationError
+
+DATE_GRANULARITIES = frozenset({"day", "week", "month", "quarter", "year"})
+AGGREGATES = frozenset({"sum", "avg", "min", "max", "count", "count_distinct"})
+
+
+def parse_groupby(groupby: List[str]) -> List[str]:
+    """Validate group-by specs.
+
+    Each spec is a field name, optionally with a date granularity
+    (e.g., ``date_order:month``).
+
+    Args:
+        groupby: Group-by specs
+
+    Returns:
+        The validated specs
+
+    Raises:
+        ValidationError: If a granularity is unknown
+    """
+    for spec in groupby:
+        field, _, granularity = spec.partition(":")
+        if not field or (granularity and granularity not in DATE_GRANULARITIES):
+            raise ValidationError(
+                f"Invalid groupby '{spec}'; use field or field:"
+                + "|".join(sorted(DATE_GRANULARITIES)),
+                {"groupby": spec},
+            )
+    return groupby
+
+
+def parse_measures(measures: List[str]) -> List[tuple[str, str]]:
+    """Validate measure specs.
+
+    Each spec is ``field`` (summed) or ``field:aggregate``.
+
+    Args:
+        measures: Measure specs
+
+    Returns:
+        List of (field, aggregate) pairs
+
+    Raises:
+        ValidationError: If an aggregate is unknown
+    """
+    parsed = []
+    for spec in measures:
+        field, _, aggregate = spec.partition(":")
+        aggregate = aggregate or "sum"
+        if not field or aggregate not in AGGREGATES:
+            raise ValidationError(
+                f"Invalid measure '{spec}'; use field:"
+                + "|".join(sorted(AGGREGATES)),
+                {"measure": spec},
+            )
+        parsed.append((field, aggregate))
+    return parsed
+
+
+def _group_value(value: Any) -> Any:
+    """Reduce a group key to a compact cell value."""
+    if value is False:
+        return None
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        # many2one groups come back as [id, display_name]; keep the id so
+        # records sharing a name stay apart and can be drilled into
+        return {"id": value[0], "name": value[1]}
+    return value
+
+
+def _measure_specs(parsed: List[tuple[str, str]]) -> List[tuple[str, str]]:
+    """Build read_group field specs and the result key of each measure.
+
+    A field aggregated once is requested as ``field:aggregate`` and comes
+    back under its own name. A field aggregated several ways is requested
+    under one alias per aggregate (``alias:aggregate(field)``), since the
+    plain form would return the same key for each of them.
+
+    Args:
+        parsed: (field, aggregate) pairs
+
+    Returns:
+        List of (read_group spec, result key) pairs
+    """
+    counts: Dict[str, int] = {}
+    for field, _ in parsed:
+        counts[field] = counts.get(field, 0) + 1
+
+    specs = []
+    for field, aggregate in parsed:
+        if counts[field] == 1:
+            specs.append((f"{field}:{aggregate}", field))
+        else:
+            alias = f"{field}__{aggregate}"
+            specs.append((f"{alias}:{aggregate}({field})", alias))
+    return specs
+
+
+async def aggregate(
+    client: OdooAsyncClient,
+    model: str,
+    domain: List[Any],
+    groupby: List[str],
+    measures: List[str],
+    order: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Aggregate records in Odoo and return a compact table.
+
+    Args:
+        client: Connected Odoo client
+        model: Model name
+        domain: Search domain
+        groupby: Group-by specs (``field`` or ``field:granularity``)
+        measures: Measure specs (``field`` or ``field:aggregate``)
+        order: Optional ordering of groups (e.g., 'amount_total desc')
+        limit: Optional maximum number of groups
+
+    Returns:
+        Dictionary with ``columns`` and ``rows``; each row holds the group
+        values (``{"id", "name"}`` for relational groups), then one value
+        per measure, then the record count
+    """
+    groupby = parse_groupby(groupby)
+    parsed = parse_measures(measures)
+    if len(set(parsed)) != len(parsed):
+        raise ValidationError("Duplicate measure", {"measures": measures})
+
+    specs = _measure_specs(parsed)
+    fields = [spec for spec, _ in specs]
+    kwargs: Dict[str, Any] = {"lazy": False}
+    if order:
+        kwargs["orderby"] = order
+    if limit is not None:
+        kwargs["limit"] = limit
+
+    groups = await client.execute_kw(
+        model, "read_group", [domain, fields, groupby], kwargs
+    )
+
+    columns = [*groupby, *(f"{field}:{aggregate}" for field, aggregate in parsed), "count"]
+    rows = [
+        [
+            *(_group_value(group.get(spec)) for spec in groupby),
+            *(group.get(key) for _, key in specs),
+            group.get("__count", 0),
+        ]
+        for group in groups
+    ]
+    return {"columns": columns, "rows": rows}
@@ -0,0 +1,192 @@
+"""Batched execution of multiple Odoo calls in one MCP request."""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set
+
+from .connection import ConnectionPoolManager
+from .errors import OdooMCPError, ValidationError, format_error_response
+
+REF_KEY = "$ref"
+
+
+def find_references(value: Any) -> Set[str]:
+    """Collect the operation ids referenced inside a value.
+
+    A reference is a dict of the form ``{"$ref": "op_id"}`` or
+    ``{"$ref": "op_id.field"}`` and may appear anywhere inside args or kwargs.
+
+    Args:
+        value: Arguments structure to scan
+
+    Returns:
+        Set of referenced operation ids
+    """
+    refs: Set[str] = set()
+    if isinstance(value, dict):
+        if REF_KEY in value:
+            refs.add(str(value[REF_KEY]).split(".", 1)[0])
+        else:
+            for item in value.values():
+                refs |= find_references(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            refs |= find_references(item)
+    return refs
+
+
+def _extract_field(result: Any, field: str) -> Any:
+    """Pick a field out of a read result.
+
+    Many2one values (``[id, name]``) are reduced to their id so the output can
+    be fed directly into another call's ids or domain.
+    """
+    def pick(record: Any) -> Any:
+        if not isinstance(record, dict):
+            raise ValidationError(
+                f"Cannot extract field '{field}' from non-record result",
+                {"field": field},
+            )
+        item = record.get(field)
+        if isinstance(item, list) and len(item) == 2 and isinstance(item[0], int):
+            return item[0]
+        return item
+
+    if isinstance(result, list):
+        return [pick(record) for record in result]
+    return pick(result)
+
+
+def resolve_references(value: Any, results: Dict[str, Any]) -> Any:
+    """Replace references inside a value with earlier operation results.
+
+    Args:
+        value: Arguments structure containing references
+        results: Results of completed operations keyed by operation id
+
+    Returns:
+        Value with every reference substituted
+    """
+    if isinstance(value, dict):
+        if REF_KEY in value:
+            op_id, _, field = str(value[REF_KEY]).partition(".")
+            result = results[op_id]
+            return _extract_field(result, field) if field else result
+        return {key: resolve_references(item, results) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_references(item, results) for item in value]
+    return value
+
+
+def _normalize_operations(operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate operations and build their dependency sets.
+
+    Args:
+        operations: Raw operations from the tool call
+
+    Returns:
+        Normalized operations with ``id`` and ``depends_on`` filled in
+
+    Raises:
+        ValidationError: If an operation is malformed or references are invalid
+    """
+    normalized: List[Dict[str, Any]] = []
+    seen: Set[str] = set()
+
+    for index, op in enumerate(operations):
+        if not isinstance(op, dict) or not op.get("model") or not op.get("method"):
+            raise ValidationError(
+                "Each operation needs a model and a method", {"index": index}
+            )
+        op_id = str(op.get("id", index))
+        if op_id in seen:
+            raise ValidationError("Duplicate operation id", {"id": op_id})
+        seen.add(op_id)
+
+        args = op.get("args", [])
+        kwargs = op.get("kwargs") or {}
+        depends_on = find_references(args) | find_references(kwargs)
+        normalized.append({
+            "id": op_id,
+            "model": op["model"],
+            "method": op["method"],
+            "args": args,
+            "kwargs": kwargs,
+            "depends_on": depends_on,
+        })
+
+    # References may only point backwards, which also rules out cycles
+    earlier: Set[str] = set()
+    for op in normalized:
+        unknown = op["depends_on"] - earlier
+        if unknown:
+            raise ValidationError(
+                "Operation references unknown or later operations",
+                {"id": op["id"], "references": sorted(unknown)},
+            )
+        earlier.add(op["id"])
+
+    return normalized
+
+
+async def run_batch(
+    connection_pool: ConnectionPoolManager,
+    instance_id: str,
+    operations: List[Dict[str, Any]],
+    max_concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Run a batch of operations, concurrently where they are independent.
+
+    Each operation waits only for the operations it references. Independent
+    operations run in parallel, bounded by ``max_concurrency`` (defaulting to
+    the instance's ``max_connections``).
+
+    Args:
+        connection_pool: Connection pool manager
+        instance_id: Odoo instance identifier
+        operations: List of ``{"id", "model", "method", "args", "kwargs"}``
+        max_concurrency: Maximum number of in-flight calls
+
+    Returns:
+        Per-operation outcomes in input order, each with either ``result``
+        or ``error``
+    """
+    normalized = _normalize_operations(operations)
+    limit = connection_pool.get_config(instance_id).max_connections
+    if max_concurrency:
+        limit = min(limit, max_concurrency)
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    results: Dict[str, Any] = {}
+    done: Dict[str, asyncio.Event] = {op["id"]: asyncio.Event() for op in normalized}
+    failed: Set[str] = set()
+
+    async def run(op: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            for dep in op["depends_on"]:
+                await done[dep].wait()
+            failed_deps = sorted(op["depends_on"] & failed)
+            if failed_deps:
+                raise ValidationError(
+                    "Dependency failed", {"depends_on": failed_deps}
+                )
+
+            args = resolve_references(op["args"], results)
+            kwargs = resolve_references(op["kwargs"], results)
+            async with semaphore:
+                async with connection_pool.get_connection(instance_id) as client:
+                    result = await client.execute_kw(
+                        op["model"], op["method"], args, kwargs
+                    )
+                    retries = client.last_retries
+            results[op["id"]] = result
+            outcome: Dict[str, Any] = {"id": op["id"], "result": result}
+            if retries:
+                outcome["retries"] = retries
+            return outcome
+        except (OdooMCPError, ValueError, KeyError, TypeError) as e:
+            failed.add(op["id"])
+            return {"id": op["id"], **format_error_response(e)}
+        finally:
+            done[op["id"]].set()
+
+    return list(await asyncio.gather(*(run(op) for op in normalized)))
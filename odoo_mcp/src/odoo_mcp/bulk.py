@@ -0,0 +1,243 @@
+"""Chunked bulk create and write with per-record outcomes."""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .connection import ConnectionPoolManager
+from .errors import (
+    ConnectionError,
+    OdooMCPError,
+    RateLimitError,
+    TimeoutError,
+    ValidationError,
+    format_error_response,
+)
+from .types import validate_record_data
+
+DEFAULT_CHUNK_SIZE = 100
+MAX_CHUNK_SIZE = 1000
+
+# Failures after which a create may or may not have been applied
+UNCERTAIN_ERRORS = (ConnectionError, RateLimitError, TimeoutError)
+
+
+def chunked(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into consecutive chunks.
+
+    Args:
+        items: Items to split
+        size: Maximum chunk length
+
+    Returns:
+        List of chunks
+    """
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def group_writes(updates: List[Dict[str, Any]]) -> List[tuple[Dict[str, Any], List[int]]]:
+    """Group per-record updates that set identical values.
+
+    Args:
+        updates: ``{"index", "id", "values"}`` dictionaries
+
+    Returns:
+        List of (values, indexes) pairs, in first-seen order
+    """
+    groups: Dict[str, tuple[Dict[str, Any], List[int]]] = {}
+    for update in updates:
+        key = json.dumps(update["values"], sort_keys=True, default=str)
+        groups.setdefault(key, (update["values"], []))[1].append(update["index"])
+    return list(groups.values())
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    if not 1 <= chunk_size <= MAX_CHUNK_SIZE:
+        raise ValidationError(
+            f"chunk_size must be between 1 and {MAX_CHUNK_SIZE}",
+            {"chunk_size": chunk_size},
+        )
+
+
+def _summary(outcomes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    failed = sum(1 for outcome in outcomes if "error" in outcome)
+    return {
+        "results": outcomes,
+        "succeeded": len(outcomes) - failed,
+        "failed": failed,
+    }
+
+
+async def _run_chunks(
+    connection_pool: ConnectionPoolManager,
+    instance_id: str,
+    jobs: List[Callable[[Any], Awaitable[None]]],
+    max_concurrency: Optional[int],
+) -> None:
+    """Run chunk jobs concurrently, each with its own client."""
+    limit = connection_pool.get_config(instance_id).max_connections
+    if max_concurrency:
+        limit = min(limit, max_concurrency)
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(job: Callable[[Any], Awaitable[None]]) -> None:
+        async with semaphore:
+            async with connection_pool.get_connection(instance_id) as client:
+                await job(client)
+
+    await asyncio.gather(*(run(job) for job in jobs))
+
+
+async def create_many(
+    connection_pool: ConnectionPoolManager,
+    instance_id: str,
+    model: str,
+    records: List[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Create records with Odoo's list-create, chunk by chunk.
+
+    Chunks are sent concurrently. When Odoo rejects a chunk, nothing in it
+    was committed, so its records are created one by one to isolate the bad
+    rows. A chunk lost to a connection failure is reported as failed without
+    resending, since it may already have been applied.
+
+    Args:
+        connection_pool: Connection pool manager
+        instance_id: Odoo instance identifier
+        model: Model name
+        records: Field values of each record to create
+        chunk_size: Records per ``create`` call
+        max_concurrency: Optional cap on concurrent calls
+
+    Returns:
+        Per-record outcomes in input order (``id`` or ``error``) with
+        success and failure counts
+    """
+    _check_chunk_size(chunk_size)
+    outcomes: List[Dict[str, Any]] = [{"index": i} for i in range(len(records))]
+
+    valid: List[int] = []
+    for index, values in enumerate(records):
+        if validate_record_data(values):
+            valid.append(index)
+        else:
+            outcomes[index].update(format_error_response(
+                ValidationError("Invalid record data", {"values": values})
+            ))
+
+    def make_job(indexes: List[int]) -> Callable[[Any], Awaitable[None]]:
+        async def job(client: Any) -> None:
+            try:
+                ids = await client.execute_kw(
+                    model, "create", [[records[i] for i in indexes]]
+                )
+            except OdooMCPError as e:
+                if len(indexes) == 1 or isinstance(e, UNCERTAIN_ERRORS):
+                    for index in indexes:
+                        outcomes[index].update(format_error_response(e))
+                    return
+                for index in indexes:
+                    try:
+                        outcomes[index]["id"] = await client.execute_kw(
+                            model, "create", [records[index]]
+                        )
+                    except OdooMCPError as single_error:
+                        outcomes[index].update(format_error_response(single_error))
+                return
+            # Older servers return a bare id for single-record creates
+            if not isinstance(ids, list):
+                ids = [ids]
+            for index, record_id in zip(indexes, ids):
+                outcomes[index]["id"] = record_id
+
+        return job
+
+    await _run_chunks(
+        connection_pool,
+        instance_id,
+        [make_job(chunk) for chunk in chunked(valid, chunk_size)],
+        max_concurrency,
+    )
+    return _summary(outcomes)
+
+
+async def write_many(
+    connection_pool: ConnectionPoolManager,
+    instance_id: str,
+    model: str,
+    updates: List[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Apply per-record values with as few ``write`` calls as possible.
+
+    Records receiving identical values share one ``write`` (split into
+    chunks of ``chunk_size`` ids); groups and chunks run concurrently. A
+    rejected chunk is retried record by record to isolate the bad ones.
+    Since concurrent writes to one record have no defined order, an id may
+    appear only once; repeats are rejected.
+
+    Args:
+        connection_pool: Connection pool manager
+        instance_id: Odoo instance identifier
+        model: Model name
+        updates: ``{"id", "values"}`` dictionaries
+        chunk_size: Maximum ids per ``write`` call
+        max_concurrency: Optional cap on concurrent calls
+
+    Returns:
+        Per-record outcomes in input order with success and failure counts
+    """
+    _check_chunk_size(chunk_size)
+    outcomes: List[Dict[str, Any]] = []
+    valid: List[Dict[str, Any]] = []
+    seen: Dict[int, int] = {}
+
+    for index, update in enumerate(updates):
+        record_id = update.get("id") if isinstance(update, dict) else None
+        values = update.get("values") if isinstance(update, dict) else None
+        outcomes.append({"index": index, "id": record_id})
+        if not isinstance(record_id, int) or not validate_record_data(values):
+            outcomes[index].update(format_error_response(
+                ValidationError("Each update needs an integer id and values", {"index": index})
+            ))
+        elif record_id in seen:
+            outcomes[index].update(format_error_response(
+                ValidationError(
+                    "Duplicate id; merge the values into one update",
+                    {"index": index, "first_index": seen[record_id]},
+                )
+            ))
+        else:
+            seen[record_id] = index
+            valid.append({"index": index, "id": record_id, "values": values})
+
+    def make_job(values: Dict[str, Any], indexes: List[int]) -> Callable[[Any], Awaitable[None]]:
+        async def job(client: Any) -> None:
+            ids = [outcomes[i]["id"] for i in indexes]
+            try:
+                await client.execute_kw(model, "write", [ids, values])
+            except OdooMCPError as e:
+                if len(indexes) == 1 or isinstance(e, UNCERTAIN_ERRORS):
+                    for index in indexes:
+                        outcomes[index].update(format_error_response(e))
+                    return
+                for index in indexes:
+                    try:
+                        await client.execute_kw(
+                            model, "write", [[outcomes[index]["id"]], values]
+                        )
+                    except OdooMCPError as single_error:
+                        outcomes[index].update(format_error_response(single_error))
+
+        return job
+
+    jobs = [
+        make_job(values, chunk)
+        for values, indexes in group_writes(valid)
+        for chunk in chunked(indexes, chunk_size)
+    ]
+    await _run_chunks(connection_pool, instance_id, jobs, max_concurrency)
+    return _summary(outcomes)
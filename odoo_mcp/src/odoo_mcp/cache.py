@@ -0,0 +1,263 @@
+"""In-memory caches for Odoo metadata and records."""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+MISSING: Any = object()
+
+# Methods whose results describe schema or permissions rather than data
+METADATA_METHODS = frozenset({"fields_get", "check_access_rights"})
+METADATA_MODELS = frozenset({"ir.model", "ir.model.fields"})
+READ_METHODS = frozenset({"read", "search", "search_read", "search_count"})
+
+# (model, record id, normalized field list)
+RecordKey = tuple[str, int, Optional[tuple[str, ...]]]
+
+
+def is_metadata_call(model: str, method: str) -> bool:
+    """Check whether a call only returns schema-type metadata.
+
+    Args:
+        model: Odoo model name
+        method: Method name
+
+    Returns:
+        True for fields_get, check_access_rights and reads of ir.model*
+    """
+    return method in METADATA_METHODS or (
+        model in METADATA_MODELS and method in READ_METHODS
+    )
+
+
+def call_key(
+    model: str, method: str, args: list[Any], kwargs: Dict[str, Any]
+) -> tuple[str, str, str]:
+    """Build a hashable key identifying a call.
+
+    Args and kwargs are serialized with sorted keys so equivalent calls
+    produce the same key regardless of dict ordering.
+
+    Args:
+        model: Odoo model name
+        method: Method name
+        args: Positional arguments
+        kwargs: Keyword arguments
+
+    Returns:
+        Tuple of (model, method, normalized arguments)
+    """
+    normalized = json.dumps([args, kwargs], sort_keys=True, default=str)
+    return (model, method, normalized)
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a TTL.
+
+    Values are returned as stored; callers must not mutate them.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently
+                used one is evicted
+            ttl: Default entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Look up a key, counting the hit or miss.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime in seconds (defaults to the cache TTL)
+        """
+        lifetime = self.ttl if ttl is None else ttl
+        if lifetime <= 0 or self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + lifetime, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Optional[Callable[[Any], bool]] = None) -> int:
+        """Remove entries.
+
+        Args:
+            predicate: Optional filter on keys; all entries are removed when
+                omitted
+
+        Returns:
+            Number of entries removed
+        """
+        if predicate is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Return size and hit/miss counters.
+
+        Returns:
+            Dictionary with size, maxsize, hits and misses
+        """
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def fields_key(fields: Optional[List[str]]) -> Optional[tuple[str, ...]]:
+    """Normalize a field list for use in a cache key.
+
+    Args:
+        fields: Requested fields, or None for all fields
+
+    Returns:
+        Sorted tuple of field names, or None
+    """
+    return tuple(sorted(set(fields))) if fields else None
+
+
+class RecordCache:
+    """Bounded LRU cache of single records, validated by ``write_date``.
+
+    A hit only costs a read of ``write_date``; the full record (which may
+    carry large binary fields) is fetched again only when the record changed.
+    Records without a ``write_date`` are never cached.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of records before the least recently used
+                one is evicted
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._entries: "OrderedDict[RecordKey, Dict[str, Any]]" = OrderedDict()
+
+    async def get(
+        self,
+        model: str,
+        record_id: int,
+        fields: Optional[List[str]],
+        read: Callable[[Optional[List[str]]], Awaitable[List[Dict[str, Any]]]],
+    ) -> Optional[Dict[str, Any]]:
+        """Return a record, from the cache when it has not changed.
+
+        Args:
+            model: Model name
+            record_id: Record ID
+            fields: Fields to read, or None for all fields
+            read: Coroutine function reading the record with the given fields
+
+        Returns:
+            The record, or None if it does not exist
+        """
+        key: RecordKey = (model, record_id, fields_key(fields))
+        entry = self._entries.get(key)
+        if entry is not None:
+            rows = await read(["write_date"])
+            if rows and rows[0].get("write_date") == entry["write_date"]:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            del self._entries[key]
+            self.stale += 1
+            if not rows:
+                return None
+        else:
+            self.misses += 1
+
+        requested = list(key[2]) if key[2] else None
+        if requested and "write_date" not in requested:
+            requested.append("write_date")
+        rows = await read(requested)
+        if not rows:
+            return None
+
+        record = rows[0]
+        if record.get("write_date") and self.maxsize > 0:
+            self._entries[key] = record
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return record
+
+    def invalidate(self, model: Optional[str] = None, ids: Optional[List[int]] = None) -> int:
+        """Remove cached records.
+
+        Args:
+            model: Only remove records of this model (all when omitted)
+            ids: Only remove these record IDs of the model
+
+        Returns:
+            Number of entries removed
+        """
+        id_set = set(ids) if ids is not None else None
+        keys = [
+            key for key in self._entries
+            if (model is None or key[0] == model)
+            and (id_set is None or key[1] in id_set)
+        ]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Return size and hit/miss/stale counters.
+
+        Returns:
+            Dictionary with size, maxsize, hits, misses and stale
+        """
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+        }
@@ -0,0 +1,110 @@
+"""Model catalog built from ir.model."""
+
+import asyncio
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional
+
+from .connection import OdooAsyncClient
+from .errors import OdooMCPError
+
+# Minimum similarity for a fuzzy (non-substring) match
+FUZZY_THRESHOLD = 0.6
+
+
+async def load_models(client: OdooAsyncClient) -> List[Dict[str, Any]]:
+    """Read the installed models.
+
+    Reads of ``ir.model`` go through the metadata cache, so this costs one
+    RPC per instance per cache TTL.
+
+    Args:
+        client: Connected Odoo client
+
+    Returns:
+        Models as ``{"model", "name"}`` dictionaries, ordered by model name
+    """
+    rows = await client.execute_kw(
+        "ir.model",
+        "search_read",
+        [[["transient", "=", False]]],
+        {"fields": ["model", "name"], "order": "model"},
+    )
+    return [{"model": row["model"], "name": row["name"]} for row in rows]
+
+
+def _normalize(text: str) -> str:
+    return text.lower().replace(".", " ").replace("_", " ").strip()
+
+
+def _score(query: str, entry: Dict[str, Any]) -> float:
+    """Rank how well a model matches a query (0 means no match)."""
+    best = 0.0
+    for candidate in (_normalize(entry["model"]), _normalize(entry["name"])):
+        if candidate == query:
+            score = 4.0
+        elif candidate.startswith(query):
+            score = 3.0
+        elif query in candidate:
+            score = 2.0
+        else:
+            ratio = SequenceMatcher(None, query, candidate).ratio()
+            score = ratio if ratio >= FUZZY_THRESHOLD else 0.0
+        best = max(best, score)
+    return best
+
+
+def search_models(
+    models: List[Dict[str, Any]], query: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Filter and rank models by technical name and description.
+
+    Exact matches come first, then prefix matches, substring matches and
+    finally close fuzzy matches. Dots and underscores are treated as spaces,
+    so ``sale order`` finds ``sale.order``.
+
+    Args:
+        models: Models from :func:`load_models`
+        query: Search text; all models are returned when empty
+
+    Returns:
+        Matching models, best match first
+    """
+    if not query:
+        return list(models)
+    normalized = _normalize(query)
+    scored = [(_score(normalized, entry), entry) for entry in models]
+    ranked = sorted(
+        (item for item in scored if item[0] > 0),
+        key=lambda item: (-item[0], item[1]["model"]),
+    )
+    return [entry for _, entry in ranked]
+
+
+async def count_records(
+    client: OdooAsyncClient, models: List[str]
+) -> Dict[str, Optional[int]]:
+    """Count the records of several models concurrently.
+
+    Models that cannot be counted (abstract models, missing access rights)
+    get ``None``.
+
+    Args:
+        client: Connected Odoo client
+        models: Model names
+
+    Returns:
+        Record count per model
+    """
+    results = await asyncio.gather(
+        *(client.execute_kw(model, "search_count", [[]]) for model in models),
+        return_exceptions=True,
+    )
+    counts: Dict[str, Optional[int]] = {}
+    for model, result in zip(models, results):
+        if isinstance(result, OdooMCPError):
+            counts[model] = None
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            counts[model] = result
+    return counts
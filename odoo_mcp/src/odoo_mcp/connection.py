@@ -1,14 +1,26 @@
 """Connection management for Odoo instances."""
 
 import asyncio
-import xmlrpc.client
+import time
+import weakref
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from typing import Any, AsyncIterator, Dict, Optional, Protocol
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Optional, Protocol
 
 import aiohttp
 
-from .errors import AuthenticationError, ConnectionError, parse_odoo_error
+from .cache import MISSING, RecordCache, TTLCache, call_key, is_metadata_call
+from .errors import (
+    AuthenticationError,
+    ConnectionError,
+    ErrorHandler,
+    RateLimitError,
+    parse_odoo_error,
+)
+from .limiter import AdaptiveLimiter
+from .metrics import Metrics
+from .transport import RpcFault, Transport, get_transport
 
 
 @dataclass
@@ -21,6 +33,227 @@ class OdooConnectionConfig:
     password: str
     timeout: int = 30
     max_connections: int = 10
+    keep_alive: bool = True
+    keepalive_timeout: float = 15.0
+    max_connection_age: float = 300.0
+    auth_ttl: float = 3600.0
+    protocol: str = "xmlrpc"
+    metadata_cache_ttl: float = 300.0
+    metadata_cache_size: int = 256
+    record_cache_size: int = 1024
+    min_concurrency: int = 1
+    max_retries: int = 3
+    retry_deadline: float = 60.0
+
+
+# Read-only methods that are safe to send again after a failure
+IDEMPOTENT_METHODS = frozenset({
+    "read",
+    "search",
+    "search_read",
+    "search_count",
+    "fields_get",
+    "read_group",
+    "name_search",
+    "name_get",
+    "default_get",
+    "check_access_rights",
+})
+
+
+def is_retryable(method: str, error: Exception) -> bool:
+    """Decide whether a failed call may be sent again.
+    
+    Idempotent methods are always retryable. Other methods are only retried
+    when the connection could not be opened, since the request then never
+    reached Odoo.
+    
+    Args:
+        method: Odoo method name
+        error: Error raised by the failed attempt
+        
+    Returns:
+        True if the call can safely be retried
+    """
+    if method in IDEMPOTENT_METHODS:
+        return True
+    return isinstance(error.__cause__, aiohttp.ClientConnectorError)
+
+
+@dataclass
+class PoolStats:
+    """Connection reuse counters for one Odoo instance."""
+
+    handshakes: int = 0
+    handshakes_avoided: int = 0
+    recycled: int = 0
+    stale_retries: int = 0
+    retries: int = 0
+
+
+class PersistentConnector(aiohttp.TCPConnector):
+    """TCP connector that keeps sockets alive up to a maximum age.
+
+    aiohttp already closes sockets that sit idle longer than
+    ``keepalive_timeout``; this connector additionally retires sockets that
+    have been open longer than ``max_age`` seconds when they are released, so
+    long-lived connections are periodically re-established.
+    """
+
+    def __init__(self, *, max_age: float, stats: PoolStats, **kwargs: Any):
+        """Initialize the connector.
+
+        Args:
+            max_age: Maximum socket lifetime in seconds (0 disables the check)
+            stats: Counters updated as sockets are created and retired
+            **kwargs: Passed through to ``aiohttp.TCPConnector``
+        """
+        super().__init__(**kwargs)
+        self.max_age = max_age
+        self.stats = stats
+        self._created_at: "weakref.WeakKeyDictionary[Any, float]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def _create_connection(self, req: Any, traces: Any, timeout: Any) -> Any:
+        protocol = await super()._create_connection(req, traces, timeout)
+        self._created_at[protocol] = time.monotonic()
+        self.stats.handshakes += 1
+        return protocol
+
+    def _release(
+        self, key: Any, protocol: Any, *, should_close: bool = False
+    ) -> None:
+        created_at = self._created_at.get(protocol)
+        if (
+            not should_close
+            and self.max_age
+            and created_at is not None
+            and time.monotonic() - created_at > self.max_age
+        ):
+            should_close = True
+            self.stats.recycled += 1
+        super()._release(key, protocol, should_close=should_close)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return current socket counts.
+
+        Returns:
+            Dictionary with open, idle and in-use socket counts
+        """
+        idle = sum(len(conns) for conns in self._conns.values())
+        in_use = len(self._acquired)
+        return {"open": idle + in_use, "idle": idle, "in_use": in_use}
+
+
+class AuthCache:
+    """Authenticated session shared by all clients of one Odoo instance.
+    
+    The uid is cached for ``ttl`` seconds. Concurrent callers that find the
+    cache empty share a single in-flight login instead of each sending their
+    own ``authenticate`` request.
+    """
+    
+    def __init__(self, ttl: float = 3600.0):
+        """Initialize the cache.
+        
+        Args:
+            ttl: Seconds a successful login stays valid
+        """
+        self.ttl = ttl
+        self.uid: Optional[int] = None
+        self.server_version: Optional[str] = None
+        self.logins = 0
+        self._expires_at = 0.0
+        self._pending: Optional[asyncio.Task[int]] = None
+    
+    async def get_uid(self, login: Callable[[], Awaitable[int]]) -> int:
+        """Return the cached uid, logging in if it is missing or expired.
+        
+        Args:
+            login: Coroutine function performing the actual authentication
+            
+        Returns:
+            User ID
+        """
+        if self.uid is not None and time.monotonic() < self._expires_at:
+            return self.uid
+        
+        if self._pending is None:
+            self._pending = asyncio.ensure_future(self._login(login))
+        # Shield so a cancelled caller does not abort the login for the others
+        return await asyncio.shield(self._pending)
+    
+    async def _login(self, login: Callable[[], Awaitable[int]]) -> int:
+        try:
+            uid = await login()
+            self.uid = uid
+            self._expires_at = time.monotonic() + self.ttl
+            self.logins += 1
+            return uid
+        finally:
+            self._pending = None
+    
+    def invalidate(self) -> None:
+        """Drop the cached session so the next caller logs in again."""
+        self.uid = None
+        self.server_version = None
+        self._expires_at = 0.0
+
+
+class SingleFlight:
+    """Coalesces identical concurrent calls into one in-flight request.
+    
+    The first caller for a key starts the request; callers arriving while
+    it is still running await the same result (or error) instead of sending
+    their own. Nothing is kept once the request completes.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize the coalescing table."""
+        self.calls = 0
+        self.coalesced = 0
+        self._pending: Dict[Hashable, asyncio.Future[Any]] = {}
+    
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a call, or join the identical one already in flight.
+        
+        Args:
+            key: Identity of the call
+            call: Coroutine function performing the request
+            
+        Returns:
+            Call result
+        """
+        pending = self._pending.get(key)
+        if pending is None:
+            self.calls += 1
+            pending = asyncio.ensure_future(call())
+            self._pending[key] = pending
+            pending.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        # Shield so a cancelled caller does not abort the request for the others
+        return await asyncio.shield(pending)
+    
+    def _forget(self, key: Hashable, done: "asyncio.Future[Any]") -> None:
+        if self._pending.get(key) is done:
+            del self._pending[key]
+        if not done.cancelled():
+            # Mark the error as retrieved when every caller has gone away
+            done.exception()
+    
+    def stats(self) -> Dict[str, int]:
+        """Return request and coalescing counters.
+        
+        Returns:
+            Dictionary of single-flight metrics
+        """
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._pending),
+        }
 
 
 class OdooConnection(Protocol):
@@ -36,18 +269,147 @@ class OdooConnection(Protocol):
 
 
 class OdooAsyncClient:
-    """Async client for Odoo XML-RPC operations."""
+    """Async client for Odoo external API operations."""
     
-    def __init__(self, session: aiohttp.ClientSession, config: OdooConnectionConfig):
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        config: OdooConnectionConfig,
+        stats: Optional[PoolStats] = None,
+        auth_cache: Optional[AuthCache] = None,
+        transport: Optional[Transport] = None,
+        metadata_cache: Optional[TTLCache] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        metrics: Optional[Metrics] = None,
+        instance_id: str = "default",
+    ):
         """Initialize the async client.
         
         Args:
             session: aiohttp session for making requests
             config: Connection configuration
+            stats: Optional pool counters to record stale-socket retries in
+            auth_cache: Optional session cache shared with other clients
+            transport: Wire protocol (defaults to the one in config)
+            metadata_cache: Optional cache for schema-type calls
+            limiter: Optional admission control shared with other clients
+            single_flight: Optional coalescing table shared with other clients
+            metrics: Optional metrics to record RPC timings and sizes in
+            instance_id: Instance label for recorded metrics
         """
         self.session = session
         self.config = config
+        self.stats = stats
+        self.auth_cache = auth_cache
+        self.transport = transport or get_transport(config.protocol)
+        self.metadata_cache = metadata_cache
+        self.limiter = limiter
+        self.single_flight = single_flight
+        self.metrics = metrics
+        self.instance_id = instance_id
+        self.last_retries = 0
         self._uid: Optional[int] = None
+        self._retry_handler = ErrorHandler(
+            max_retries=config.max_retries + 1,
+            jitter=True,
+            base_delay=0.2,
+            max_delay=5.0,
+            deadline=config.retry_deadline,
+            reraise=True,
+        )
+    
+    async def _call(self, service: str, method: str, params: tuple[Any, ...]) -> Any:
+        """Send one RPC call through the configured transport.
+        
+        A keep-alive socket may have been closed by the server while it sat
+        idle in the pool. Such a request fails before reaching Odoo, so it is
+        retried once on a fresh socket.
+        
+        Args:
+            service: Service name ('common' or 'object')
+            method: Service method
+            params: Positional parameters
+            
+        Returns:
+            Decoded result
+            
+        Raises:
+            RpcFault: If Odoo returned a fault
+            RateLimitError: If Odoo answered 429 Too Many Requests
+        """
+        if self.limiter is None:
+            return await self._send(service, method, params)
+        async with self.limiter.slot():
+            return await self._send(service, method, params)
+    
+    async def _send(self, service: str, method: str, params: tuple[Any, ...]) -> Any:
+        """POST one encoded call, retrying once on a stale keep-alive socket.
+        
+        A dropped socket is only replayed for read-only calls, since Odoo may
+        already have applied a write before the connection went away. Writes
+        are replayed only when the connection could not be opened at all.
+        
+        When metrics are set, the round trip is recorded under the called
+        model and method, with body sizes and encode/parse time.
+        """
+        model, called = service, method
+        if service == 'object' and method == 'execute_kw':
+            model, called = params[3], params[4]
+        replayable = service != 'object' or called in IDEMPOTENT_METHODS
+        start = time.perf_counter()
+        endpoint = self.transport.endpoint(self.config.url, service)
+        data = self.transport.encode(service, method, params).encode()
+        serialize_seconds = time.perf_counter() - start
+        received = 0
+        failed = True
+        retried = False
+        try:
+            while True:
+                try:
+                    async with self.session.post(
+                        endpoint,
+                        data=data,
+                        headers={'Content-Type': self.transport.content_type}
+                    ) as response:
+                        if response.status == 429:
+                            raise RateLimitError(
+                                "Odoo rate limit exceeded",
+                                {
+                                    "url": endpoint,
+                                    "retry_after": response.headers.get("Retry-After"),
+                                }
+                            )
+                        body = await self.transport.read(response)
+                    received = len(body)
+                    parse_start = time.perf_counter()
+                    try:
+                        result = self.transport.parse(body)
+                    finally:
+                        serialize_seconds += time.perf_counter() - parse_start
+                        del body
+                    failed = False
+                    return result
+                except (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError) as e:
+                    if retried or not self.config.keep_alive:
+                        raise
+                    if not replayable and not isinstance(e, aiohttp.ClientConnectorError):
+                        raise
+                    retried = True
+                    if self.stats is not None:
+                        self.stats.stale_retries += 1
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe_rpc(
+                    self.instance_id,
+                    model,
+                    called,
+                    time.perf_counter() - start,
+                    bytes_out=len(data),
+                    bytes_in=received,
+                    serialize_seconds=serialize_seconds,
+                    error=failed,
+                )
     
     async def authenticate(self) -> int:
         """Authenticate with Odoo and get user ID.
@@ -62,42 +424,35 @@ class OdooAsyncClient:
         if self._uid:
             return self._uid
         
-        endpoint = f"{self.config.url}/xmlrpc/2/common"
-        
-        # Build XML-RPC request
-        params = xmlrpc.client.dumps(
-            (self.config.database, self.config.username, self.config.password, {}),
-            'authenticate'
-        )
+        if self.auth_cache is not None:
+            self._uid = await self.auth_cache.get_uid(self._login)
+        else:
+            self._uid = await self._login()
+        return self._uid
+    
+    async def _login(self) -> int:
+        """Send an ``authenticate`` request to Odoo.
         
+        Returns:
+            User ID
+            
+        Raises:
+            AuthenticationError: If authentication fails
+            ConnectionError: If connection fails
+        """
         try:
-            async with self.session.post(
-                endpoint,
-                data=params,
-                headers={'Content-Type': 'text/xml'}
-            ) as response:
-                response_data = await response.read()
-                
-                # Parse XML-RPC response
-                try:
-                    result, method_name = xmlrpc.client.loads(response_data)
-                    if result and result[0]:
-                        self._uid = int(result[0])
-                        return self._uid
-                    else:
-                        raise AuthenticationError(
-                            "Authentication failed: Invalid credentials"
-                        )
-                except xmlrpc.client.Fault as fault:
-                    # Handle XML-RPC fault
-                    if "Invalid credentials" in fault.faultString:
-                        raise AuthenticationError(fault.faultString)
-                    else:
-                        raise ConnectionError(
-                            f"XML-RPC fault: {fault.faultString}",
-                            {"code": fault.faultCode}
-                        ) from fault
-                        
+            uid = await self._call(
+                'common',
+                'authenticate',
+                (self.config.database, self.config.username, self.config.password, {}),
+            )
+        except RpcFault as fault:
+            if "Invalid credentials" in fault.message:
+                raise AuthenticationError(fault.message)
+            raise ConnectionError(
+                f"RPC fault: {fault.message}",
+                {"code": fault.code}
+            ) from fault
         except asyncio.TimeoutError as e:
             raise ConnectionError(
                 "Connection timeout during authentication",
@@ -106,8 +461,42 @@ class OdooAsyncClient:
         except aiohttp.ClientError as e:
             raise ConnectionError(
                 f"Connection error: {str(e)}",
-                {"url": endpoint}
+                {"url": self.transport.endpoint(self.config.url, 'common')}
             ) from e
+        
+        if not uid:
+            raise AuthenticationError("Authentication failed: Invalid credentials")
+        return int(uid)
+    
+    async def server_version(self) -> Optional[str]:
+        """Get the Odoo server version, cached alongside the session.
+        
+        Returns:
+            Server version string (e.g., '17.0')
+            
+        Raises:
+            ConnectionError: If connection fails
+        """
+        if self.auth_cache is not None and self.auth_cache.server_version:
+            return self.auth_cache.server_version
+        
+        try:
+            info = await self._call('common', 'version', ())
+        except RpcFault as fault:
+            raise ConnectionError(
+                f"RPC fault: {fault.message}",
+                {"code": fault.code}
+            ) from fault
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise ConnectionError(
+                f"Connection error: {str(e)}",
+                {"url": self.transport.endpoint(self.config.url, 'common')}
+            ) from e
+        
+        version = info.get("server_version") if info else None
+        if self.auth_cache is not None:
+            self.auth_cache.server_version = version
+        return version
     
     async def execute_kw(
         self,
@@ -118,6 +507,17 @@ class OdooAsyncClient:
     ) -> Any:
         """Execute a method on an Odoo model.
         
+        Schema-type calls (``fields_get``, ``check_access_rights``, reads of
+        ``ir.model``) are served from the metadata cache when one is set.
+        
+        Connection failures, timeouts and rate limiting are retried with
+        decorrelated-jitter backoff within ``retry_deadline`` seconds, but only
+        for idempotent methods (see ``is_retryable``). The number of retries
+        used is left in ``last_retries``.
+        
+        Identical idempotent calls made concurrently through the same
+        ``single_flight`` table share one request and its result.
+        
         Args:
             model: Odoo model name (e.g., 'res.partner')
             method: Method name (e.g., 'search', 'read', 'create')
@@ -130,49 +530,129 @@ class OdooAsyncClient:
         Raises:
             Various OdooMCPError subclasses based on the error
         """
+        kwargs = kwargs or {}
+        
+        cache = self.metadata_cache if is_metadata_call(model, method) else None
+        flight = self.single_flight if method in IDEMPOTENT_METHODS else None
+        key = None
+        if cache is not None or flight is not None:
+            key = call_key(model, method, args, kwargs)
+        if cache is not None:
+            cached = cache.get(key, MISSING)
+            if cached is not MISSING:
+                return cached
+        
+        if flight is not None:
+            result = await flight.do(
+                key,
+                lambda: self._execute_with_retry(model, method, args, kwargs),
+            )
+        else:
+            result = await self._execute_with_retry(model, method, args, kwargs)
+        
+        if cache is not None:
+            cache.set(key, result)
+        return result
+    
+    async def _execute_with_retry(
+        self,
+        model: str,
+        method: str,
+        args: list[Any],
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """Execute a call, retrying transient failures when safe."""
+        self.last_retries = 0
+        
+        def on_retry(retry: int, error: Exception) -> None:
+            self.last_retries = retry
+            if self.stats is not None:
+                self.stats.retries += 1
+        
+        retrying = self._retry_handler.with_retry(
+            retryable_errors=(ConnectionError, RateLimitError),
+            should_retry=lambda error: is_retryable(method, error),
+            on_retry=on_retry,
+        )(self._execute_authenticated)
+        return await retrying(model, method, args, kwargs)
+    
+    async def _execute_authenticated(
+        self,
+        model: str,
+        method: str,
+        args: list[Any],
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """Execute a call, logging in first if needed.
+        
+        If Odoo rejects the cached session ("Access Denied"), the session is
+        invalidated and the call is retried once after logging in again.
+        
+        Args:
+            model: Odoo model name
+            method: Method name
+            args: Positional arguments for the method
+            kwargs: Keyword arguments for the method
+            
+        Returns:
+            Method result
+        """
         if not self._uid:
             await self.authenticate()
         
-        endpoint = f"{self.config.url}/xmlrpc/2/object"
-        kwargs = kwargs or {}
-        
-        # Build XML-RPC request
-        params = xmlrpc.client.dumps(
-            (
-                self.config.database,
-                self._uid,
-                self.config.password,
-                model,
-                method,
-                args,
-                kwargs
-            ),
-            'execute_kw'
-        )
+        try:
+            return await self._execute(model, method, args, kwargs)
+        except AuthenticationError:
+            self._uid = None
+            if self.auth_cache is not None:
+                self.auth_cache.invalidate()
+            await self.authenticate()
+            return await self._execute(model, method, args, kwargs)
+    
+    async def _execute(
+        self,
+        model: str,
+        method: str,
+        args: list[Any],
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """Send a single ``execute_kw`` request with the current uid.
         
+        Args:
+            model: Odoo model name
+            method: Method name
+            args: Positional arguments for the method
+            kwargs: Keyword arguments for the method
+            
+        Returns:
+            Method result
+            
+        Raises:
+            AuthenticationError: If Odoo rejects the session
+            Various OdooMCPError subclasses based on the error
+        """
         try:
-            async with self.session.post(
-                endpoint,
-                data=params,
-                headers={'Content-Type': 'text/xml'}
-            ) as response:
-                response_data = await response.read()
-                
-                # Parse XML-RPC response
-                try:
-                    result, method_name = xmlrpc.client.loads(response_data)
-                    return result[0] if result else None
-                except xmlrpc.client.Fault as fault:
-                    # Parse Odoo error and raise appropriate exception
-                    error_data = {
-                        "message": fault.faultString,
-                        "data": {
-                            "name": "xmlrpc.Fault",
-                            "debug": fault.faultString,
-                        }
-                    }
-                    raise parse_odoo_error(error_data) from fault
-                    
+            return await self._call(
+                'object',
+                'execute_kw',
+                (
+                    self.config.database,
+                    self._uid,
+                    self.config.password,
+                    model,
+                    method,
+                    args,
+                    kwargs
+                ),
+            )
+        except RpcFault as fault:
+            if "Access Denied" in fault.message:
+                raise AuthenticationError(
+                    fault.message, {"model": model, "method": method}
+                ) from fault
+            
+            # Parse Odoo error and raise appropriate exception
+            raise parse_odoo_error(fault.error_data) from fault
         except asyncio.TimeoutError as e:
             raise ConnectionError(
                 f"Timeout executing {method} on {model}",
@@ -181,7 +661,11 @@ class OdooAsyncClient:
         except aiohttp.ClientError as e:
             raise ConnectionError(
                 f"Connection error: {str(e)}",
-                {"url": endpoint, "model": model, "method": method}
+                {
+                    "url": self.transport.endpoint(self.config.url, 'object'),
+                    "model": model,
+                    "method": method,
+                }
             ) from e
 
 
@@ -190,10 +674,17 @@ class ConnectionPoolManager:
     
     def __init__(self) -> None:
         """Initialize the connection pool manager."""
-        self._pools: Dict[str, aiohttp.TCPConnector] = {}
         self._sessions: Dict[str, aiohttp.ClientSession] = {}
         self._configs: Dict[str, OdooConnectionConfig] = {}
         self._connectors: Dict[str, aiohttp.TCPConnector] = {}
+        self._stats: Dict[str, PoolStats] = {}
+        self._auth: Dict[str, AuthCache] = {}
+        self._transports: Dict[str, Transport] = {}
+        self._metadata: Dict[str, TTLCache] = {}
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+        self._single_flights: Dict[str, SingleFlight] = {}
+        self._records: Dict[str, RecordCache] = {}
+        self.metrics = Metrics()
         self._lock = asyncio.Lock()
         self._initialized = False
     
@@ -212,25 +703,179 @@ class ConnectionPoolManager:
             instance_id: Unique identifier for the instance
             config: Connection configuration
         """
+        transport = get_transport(config.protocol)
+        
         async with self._lock:
-            # Create connector with connection limits
-            connector = aiohttp.TCPConnector(
-                limit=config.max_connections,
-                limit_per_host=config.max_connections,
-                force_close=True,
-                enable_cleanup_closed=True
+            stats = PoolStats()
+            
+            # Create connector with connection limits; keep-alive sockets are
+            # reused across requests until idle or older than the max age
+            connector_options: Dict[str, Any] = {
+                "limit": config.max_connections,
+                "limit_per_host": config.max_connections,
+                "force_close": not config.keep_alive,
+                "enable_cleanup_closed": True,
+            }
+            if config.keep_alive:
+                connector_options["keepalive_timeout"] = config.keepalive_timeout
+            connector = PersistentConnector(
+                max_age=config.max_connection_age,
+                stats=stats,
+                **connector_options,
+            )
+            
+            # Count requests served by an already open socket
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_reuseconn.append(
+                self._make_reuse_hook(stats)
             )
             
             # Create session with timeout
             session = aiohttp.ClientSession(
                 connector=connector,
-                timeout=aiohttp.ClientTimeout(total=config.timeout)
+                timeout=aiohttp.ClientTimeout(total=config.timeout),
+                trace_configs=[trace_config],
             )
             
             # Store references
             self._connectors[instance_id] = connector
             self._sessions[instance_id] = session
             self._configs[instance_id] = config
+            self._stats[instance_id] = stats
+            self._auth[instance_id] = AuthCache(ttl=config.auth_ttl)
+            self._transports[instance_id] = transport
+            self._metadata[instance_id] = TTLCache(
+                maxsize=config.metadata_cache_size,
+                ttl=config.metadata_cache_ttl,
+            )
+            self._limiters[instance_id] = AdaptiveLimiter(
+                max_limit=config.max_connections,
+                min_limit=config.min_concurrency,
+            )
+            self._single_flights[instance_id] = SingleFlight()
+            self._records[instance_id] = RecordCache(maxsize=config.record_cache_size)
+    
+    @staticmethod
+    def _make_reuse_hook(stats: PoolStats) -> Any:
+        """Build a trace callback counting reused sockets.
+        
+        Args:
+            stats: Counters to update
+            
+        Returns:
+            aiohttp trace callback
+        """
+        async def on_reuse(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: Any,
+        ) -> None:
+            stats.handshakes_avoided += 1
+        
+        return on_reuse
+    
+    def get_config(self, instance_id: str) -> OdooConnectionConfig:
+        """Get the configuration of an instance.
+        
+        Args:
+            instance_id: Instance identifier
+            
+        Returns:
+            Connection configuration
+            
+        Raises:
+            ValueError: If instance not found
+        """
+        if instance_id not in self._configs:
+            raise ValueError(f"No connection for instance: {instance_id}")
+        return self._configs[instance_id]
+    
+    def get_pool_stats(self, instance_id: str) -> Dict[str, Any]:
+        """Get connection reuse statistics for an instance.
+        
+        Args:
+            instance_id: Instance identifier
+            
+        Returns:
+            Dictionary with socket counts and reuse counters
+            
+        Raises:
+            ValueError: If instance not found
+        """
+        if instance_id not in self._sessions:
+            raise ValueError(f"No connection for instance: {instance_id}")
+        
+        stats: Dict[str, Any] = {"instance_id": instance_id}
+        connector = self._connectors[instance_id]
+        if isinstance(connector, PersistentConnector):
+            stats.update(connector.snapshot())
+        stats.update(asdict(self._stats[instance_id]))
+        stats["logins"] = self._auth[instance_id].logins
+        stats["metadata_cache"] = self._metadata[instance_id].stats()
+        stats["limiter"] = self._limiters[instance_id].stats()
+        stats["single_flight"] = self._single_flights[instance_id].stats()
+        stats["record_cache"] = self._records[instance_id].stats()
+        return stats
+    
+    def invalidate_metadata(
+        self, instance_id: str, model: Optional[str] = None
+    ) -> int:
+        """Drop cached metadata for an instance.
+        
+        Args:
+            instance_id: Instance identifier
+            model: Only drop entries for this model (all when omitted)
+            
+        Returns:
+            Number of entries removed
+            
+        Raises:
+            ValueError: If instance not found
+        """
+        if instance_id not in self._metadata:
+            raise ValueError(f"No connection for instance: {instance_id}")
+        
+        cache = self._metadata[instance_id]
+        if model is None:
+            return cache.invalidate()
+        return cache.invalidate(lambda key: key[0] == model)
+    
+    def get_record_cache(self, instance_id: str) -> RecordCache:
+        """Get the record cache of an instance.
+        
+        Args:
+            instance_id: Instance identifier
+            
+        Returns:
+            Record cache
+            
+        Raises:
+            ValueError: If instance not found
+        """
+        if instance_id not in self._records:
+            raise ValueError(f"No connection for instance: {instance_id}")
+        return self._records[instance_id]
+    
+    def invalidate_records(
+        self,
+        instance_id: str,
+        model: Optional[str] = None,
+        ids: Optional[list[int]] = None,
+    ) -> int:
+        """Drop cached records for an instance.
+        
+        Args:
+            instance_id: Instance identifier
+            model: Only drop records of this model (all when omitted)
+            ids: Only drop these record IDs of the model
+            
+        Returns:
+            Number of entries removed
+            
+        Raises:
+            ValueError: If instance not found
+        """
+        return self.get_record_cache(instance_id).invalidate(model, ids)
     
     @asynccontextmanager
     async def get_connection(self, instance_id: str) -> AsyncIterator[OdooAsyncClient]:
@@ -250,7 +895,15 @@ class ConnectionPoolManager:
         
         client = OdooAsyncClient(
             session=self._sessions[instance_id],
-            config=self._configs[instance_id]
+            config=self._configs[instance_id],
+            stats=self._stats[instance_id],
+            auth_cache=self._auth[instance_id],
+            transport=self._transports[instance_id],
+            metadata_cache=self._metadata[instance_id],
+            limiter=self._limiters[instance_id],
+            single_flight=self._single_flights[instance_id],
+            metrics=self.metrics,
+            instance_id=instance_id,
         )
         
         yield client
@@ -270,6 +923,13 @@ class ConnectionPoolManager:
                 del self._sessions[instance_id]
                 del self._configs[instance_id]
                 del self._connectors[instance_id]
+                del self._stats[instance_id]
+                del self._auth[instance_id]
+                del self._transports[instance_id]
+                del self._metadata[instance_id]
+                del self._limiters[instance_id]
+                del self._single_flights[instance_id]
+                del self._records[instance_id]
     
     async def cleanup(self) -> None:
         """Clean up all connections."""
@@ -282,4 +942,11 @@ class ConnectionPoolManager:
             self._sessions.clear()
             self._configs.clear()
             self._connectors.clear()
+            self._stats.clear()
+            self._auth.clear()
+            self._transports.clear()
+            self._metadata.clear()
+            self._limiters.clear()
+            self._single_flights.clear()
+            self._records.clear()
             self._initialized = False
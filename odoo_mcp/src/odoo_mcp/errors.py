@@ -2,9 +2,11 @@
 
 import asyncio
 import logging
+import random
+import time
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, Type, Union, TypeVar, ParamSpec
+from typing import Any, Callable, Dict, NoReturn, Optional, Type, Union, TypeVar, ParamSpec
 
 
 class ErrorCode(Enum):
@@ -92,28 +94,72 @@ class TimeoutError(OdooMCPError):
 class ErrorHandler:
     """Centralized error handling with retry logic."""
     
-    def __init__(self, max_retries: int = 3, backoff_factor: float = 2.0):
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 2.0,
+        jitter: bool = False,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        deadline: Optional[float] = None,
+        reraise: bool = False,
+    ):
         """Initialize error handler.
         
         Args:
             max_retries: Maximum number of retry attempts
             backoff_factor: Exponential backoff factor
+            jitter: Use decorrelated-jitter backoff instead of plain
+                exponential backoff
+            base_delay: Smallest jittered delay in seconds
+            max_delay: Largest jittered delay in seconds
+            deadline: Total time budget in seconds; no retry is started
+                that would sleep past it
+            reraise: Re-raise the last error unchanged (with ``retries``
+                added to its details) instead of wrapping it
         """
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.reraise = reraise
         self.logger = logging.getLogger(__name__)
     
+    def next_delay(self, attempt: int, previous: float) -> float:
+        """Compute the sleep before the next attempt.
+        
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            previous: Previous delay (0 before the first retry)
+            
+        Returns:
+            Delay in seconds
+        """
+        if not self.jitter:
+            return self.backoff_factor ** attempt
+        # Decorrelated jitter: spread retries out so concurrent callers
+        # failing together do not retry in lockstep
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))  # noqa: S311
+    
     def with_retry(
         self,
         retryable_errors: tuple[Type[Exception], ...] = (
             asyncio.TimeoutError,
             ConnectionError,
-        )
+        ),
+        should_retry: Optional[Callable[[Exception], bool]] = None,
+        on_retry: Optional[Callable[[int, Exception], None]] = None,
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-        """Decorator for automatic retry with exponential backoff.
+        """Decorator for automatic retry with backoff.
         
         Args:
             retryable_errors: Tuple of exception types to retry
+            should_retry: Optional extra check; errors it rejects are
+                raised immediately
+            on_retry: Optional callback receiving the retry number and error
             
         Returns:
             Decorated function
@@ -122,25 +168,32 @@ class ErrorHandler:
             @wraps(func)
             async def wrapper(*args: Any, **kwargs: Any) -> Any:
                 last_error = None
+                started = time.monotonic()
+                delay = 0.0
                 
                 for attempt in range(self.max_retries):
                     try:
                         return await func(*args, **kwargs)
                     except retryable_errors as e:
                         last_error = e
+                        if should_retry is not None and not should_retry(e):
+                            raise
                         if attempt < self.max_retries - 1:
-                            delay = self.backoff_factor ** attempt
+                            delay = self.next_delay(attempt, delay)
+                            if (
+                                self.deadline is not None
+                                and time.monotonic() - started + delay > self.deadline
+                            ):
+                                self._give_up(e, attempt)
                             self.logger.warning(
                                 f"Retry {attempt + 1}/{self.max_retries} "
                                 f"after {delay}s: {str(e)}"
                             )
+                            if on_retry is not None:
+                                on_retry(attempt + 1, e)
                             await asyncio.sleep(delay)
                         else:
-                            raise OdooMCPError(
-                                f"Max retries exceeded: {str(e)}",
-                                ErrorCode.CONNECTION_ERROR,
-                                {"original_error": str(e)}
-                            )
+                            self._give_up(e, attempt)
                 
                 # This should not be reached, but just in case
                 if last_error:
@@ -148,6 +201,18 @@ class ErrorHandler:
                     
             return wrapper
         return decorator
+    
+    def _give_up(self, error: Exception, attempt: int) -> NoReturn:
+        """Raise the final error after the last allowed attempt."""
+        if self.reraise:
+            if isinstance(error, OdooMCPError):
+                error.details["retries"] = attempt
+            raise error
+        raise OdooMCPError(
+            f"Max retries exceeded: {str(error)}",
+            ErrorCode.CONNECTION_ERROR,
+            {"original_error": str(error)}
+        )
 
 
 def with_retry(
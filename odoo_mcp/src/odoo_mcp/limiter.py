@@ -0,0 +1,106 @@
+"""Adaptive admission control for requests to one Odoo instance."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+from .errors import RateLimitError, TimeoutError
+
+# Failures that mean the server is overloaded rather than the request is bad
+OVERLOAD_ERRORS = (asyncio.TimeoutError, RateLimitError, TimeoutError)
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that adapts with additive-increase/multiplicative-decrease.
+
+    Every successful request raises the limit by ``1 / limit`` (about one
+    extra slot per window of requests), up to ``max_limit``. A timeout or
+    rate-limit response halves it, down to ``min_limit``. Requests that
+    started before the last decrease do not trigger another one, so a burst
+    of failures from the same overloaded window only backs off once.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        decrease_factor: float = 0.5,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            max_limit: Upper bound and starting value for the limit
+            min_limit: Lower bound for the limit
+            decrease_factor: Multiplier applied on overload
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._epoch = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one request slot, waiting while the limit is reached."""
+        started = time.monotonic()
+        async with self._condition:
+            self.waiting += 1
+            try:
+                await self._condition.wait_for(
+                    lambda: self.in_flight < int(self.limit)
+                )
+            finally:
+                self.waiting -= 1
+            self.in_flight += 1
+
+        waited = time.monotonic() - started
+        self.admitted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        epoch = self._epoch
+
+        try:
+            yield
+        except OVERLOAD_ERRORS:
+            self._on_overload(epoch)
+            raise
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    def _on_overload(self, epoch: int) -> None:
+        self.throttled += 1
+        if epoch == self._epoch:
+            self._epoch += 1
+            self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+
+    def stats(self) -> Dict[str, float]:
+        """Return the current limit, queue depth and wait-time metrics.
+
+        Returns:
+            Dictionary of limiter metrics
+        """
+        return {
+            "limit": int(self.limit),
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "admitted": self.admitted,
+            "throttled": self.throttled,
+            "avg_wait_ms": (
+                round(self.total_wait / self.admitted * 1000, 2)
+                if self.admitted else 0.0
+            ),
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+        }
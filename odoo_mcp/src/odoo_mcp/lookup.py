@@ -0,0 +1,157 @@
+"""Name-to-id resolution with local indexes for small reference models."""
+
+from typing import Any, Dict, List, Optional
+
+from .cache import MISSING
+from .connection import OdooAsyncClient
+from .errors import ValidationError
+
+# Reference models indexed locally, with the fields names are matched on
+REFERENCE_MODELS: Dict[str, List[str]] = {
+    "res.country": ["name", "code"],
+    "product.category": ["complete_name", "name"],
+    "uom.uom": ["name"],
+    "crm.team": ["name"],
+}
+
+# Models with more rows than this fall back to name_search
+MAX_INDEX_SIZE = 5000
+
+OPERATORS = frozenset({"=", "=ilike", "ilike"})
+
+
+class NameIndex:
+    """In-memory index of one model's record names."""
+
+    def __init__(self, rows: List[Dict[str, Any]], fields: List[str]):
+        """Build the index.
+
+        Args:
+            rows: Records with ``id``, ``display_name`` and the match fields
+            fields: Fields names are matched on
+        """
+        self.entries = [
+            (
+                row["id"],
+                row.get("display_name") or row.get(fields[0]) or "",
+                [str(row[field]) for field in fields if row.get(field)],
+            )
+            for row in rows
+        ]
+
+    def lookup(self, name: str, operator: str, limit: int) -> List[Dict[str, Any]]:
+        """Find records by name.
+
+        ``ilike`` results are ordered exact match first, then prefix
+        matches, then other substring matches.
+
+        Args:
+            name: Name to look up
+            operator: ``=``, ``=ilike`` or ``ilike``
+            limit: Maximum number of matches
+
+        Returns:
+            Matches as ``{"id", "name"}`` dictionaries
+        """
+        needle = name.lower()
+        ranked = []
+        for record_id, display_name, keys in self.entries:
+            if operator == "=":
+                rank = 0 if name in keys else None
+            else:
+                lowered = [key.lower() for key in keys]
+                if needle in lowered:
+                    rank = 0
+                elif operator == "=ilike":
+                    rank = None
+                elif any(key.startswith(needle) for key in lowered):
+                    rank = 1
+                elif any(needle in key for key in lowered):
+                    rank = 2
+                else:
+                    rank = None
+            if rank is not None:
+                ranked.append((rank, display_name, record_id))
+        ranked.sort()
+        return [{"id": record_id, "name": display_name} for _, display_name, record_id in ranked[:limit]]
+
+
+def index_key(model: str) -> tuple[str, str, str]:
+    """Metadata cache key under which a model's name index is kept."""
+    return (model, "name_index", "")
+
+
+async def load_index(client: OdooAsyncClient, model: str) -> Optional[NameIndex]:
+    """Get a model's name index, reading it on first use.
+
+    The index is kept in the instance's metadata cache, so it expires with
+    the metadata TTL and is cleared by ``odoo_cache_invalidate``.
+
+    Args:
+        client: Connected Odoo client
+        model: Reference model name
+
+    Returns:
+        The index, or None when the model has too many records to index
+    """
+    cache = client.metadata_cache
+    key = index_key(model)
+    if cache is not None:
+        cached = cache.get(key, MISSING)
+        if cached is not MISSING:
+            index: Optional[NameIndex] = cached
+            return index
+
+    fields = REFERENCE_MODELS[model]
+    rows = await client.execute_kw(
+        model,
+        "search_read",
+        [[]],
+        {"fields": ["display_name", *fields], "limit": MAX_INDEX_SIZE + 1},
+    )
+    index = NameIndex(rows, fields) if len(rows) <= MAX_INDEX_SIZE else None
+    if cache is not None:
+        cache.set(key, index)
+    return index
+
+
+async def resolve(
+    client: OdooAsyncClient,
+    model: str,
+    name: str,
+    operator: str = "ilike",
+    limit: int = 10,
+) -> List[Dict[str, Any]]:
+    """Resolve a name to record ids.
+
+    Small reference models are answered from a local index; other models
+    use Odoo's ``name_search``.
+
+    Args:
+        client: Connected Odoo client
+        model: Model name
+        name: Name to look up
+        operator: ``=``, ``=ilike`` or ``ilike``
+        limit: Maximum number of matches
+
+    Returns:
+        Matches as ``{"id", "name"}`` dictionaries
+
+    Raises:
+        ValidationError: If the operator is not supported
+    """
+    if operator not in OPERATORS:
+        raise ValidationError(
+            f"Unsupported operator '{operator}'; use " + ", ".join(sorted(OPERATORS)),
+            {"operator": operator},
+        )
+
+    if model in REFERENCE_MODELS:
+        index = await load_index(client, model)
+        if index is not None:
+            return index.lookup(name, operator, limit)
+
+    pairs = await client.execute_kw(
+        model, "name_search", [name], {"operator": operator, "limit": limit}
+    )
+    return [{"id": record_id, "name": display_name} for record_id, display_name in pairs]
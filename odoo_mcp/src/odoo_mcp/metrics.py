@@ -0,0 +1,278 @@
+"""Latency histograms and counters for MCP tools and Odoo RPC calls."""
+
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+# Histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Histogram:
+    """Fixed-bucket histogram of durations."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        """Initialize the histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds (an overflow bucket is added)
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one duration.
+
+        Args:
+            value: Duration in seconds
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of its bucket.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value (the maximum seen for the overflow bucket), or
+            None when nothing was recorded
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def cumulative(self) -> List[tuple[str, int]]:
+        """Cumulative counts per bucket, Prometheus style (``le`` labels)."""
+        rows = []
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            rows.append((f"{bound:g}", seen))
+        rows.append(("+Inf", self.count))
+        return rows
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarize the histogram.
+
+        Returns:
+            Count, sum, mean, max and estimated quantiles in seconds
+        """
+        summary: Dict[str, Any] = {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            "max": round(self.max, 6),
+        }
+        for q in QUANTILES:
+            value = self.quantile(q)
+            summary[f"p{round(q * 100)}"] = round(value, 6) if value is not None else None
+        return summary
+
+
+@dataclass
+class CallStats:
+    """Measurements for one tool or one (instance, model, method)."""
+
+    latency: Histogram = field(default_factory=Histogram)
+    errors: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    serialize_seconds: float = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarize the measurements."""
+        return {
+            "latency": self.latency.snapshot(),
+            "errors": self.errors,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "serialize_seconds": round(self.serialize_seconds, 6),
+        }
+
+
+class Metrics:
+    """Per-tool and per-RPC measurements for the server.
+
+    RPC latency covers one HTTP round trip (network plus Odoo compute plus
+    serialization); ``serialize_seconds`` isolates the time spent encoding
+    requests and parsing responses, so the remainder is network and Odoo.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.tools: Dict[str, CallStats] = {}
+        self.rpc: Dict[tuple[str, str, str], CallStats] = {}
+        self.started = time.time()
+
+    def observe_tool(self, name: str, seconds: float, error: bool = False) -> None:
+        """Record one tool call.
+
+        Args:
+            name: Tool name
+            seconds: Wall-clock duration
+            error: Whether the call raised
+        """
+        stats = self.tools.setdefault(name, CallStats())
+        stats.latency.observe(seconds)
+        if error:
+            stats.errors += 1
+
+    def observe_rpc(
+        self,
+        instance_id: str,
+        model: str,
+        method: str,
+        seconds: float,
+        bytes_out: int = 0,
+        bytes_in: int = 0,
+        serialize_seconds: float = 0.0,
+        error: bool = False,
+    ) -> None:
+        """Record one RPC round trip.
+
+        Args:
+            instance_id: Odoo instance identifier
+            model: Model name (the service name for non-model calls)
+            method: Method name
+            seconds: Round-trip duration
+            bytes_out: Request body size
+            bytes_in: Response body size
+            serialize_seconds: Time spent encoding and parsing
+            error: Whether the call failed
+        """
+        stats = self.rpc.setdefault((instance_id, model, method), CallStats())
+        stats.latency.observe(seconds)
+        stats.bytes_out += bytes_out
+        stats.bytes_in += bytes_in
+        stats.serialize_seconds += serialize_seconds
+        if error:
+            stats.errors += 1
+
+    def reset(self) -> None:
+        """Drop all measurements."""
+        self.tools.clear()
+        self.rpc.clear()
+        self.started = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarize all measurements.
+
+        Returns:
+            Dictionary with ``tools`` keyed by name and ``rpc`` rows labelled
+            by instance, model and method, slowest total time first
+        """
+        rpc = [
+            {"instance_id": instance_id, "model": model, "method": method, **stats.snapshot()}
+            for (instance_id, model, method), stats in self.rpc.items()
+        ]
+        rpc.sort(key=lambda row: -row["latency"]["sum"])
+        return {
+            "since": self.started,
+            "tools": {
+                name: {"latency": stats.latency.snapshot(), "errors": stats.errors}
+                for name, stats in sorted(self.tools.items())
+            },
+            "rpc": rpc,
+        }
+
+    def render_prometheus(self) -> str:
+        """Render the measurements in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histogram(name: str, labels: str, hist: Histogram) -> None:
+            for bound, count in hist.cumulative():
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {hist.sum:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {hist.count}")
+
+        tools = [(f'tool="{_escape(name)}"', stats) for name, stats in sorted(self.tools.items())]
+        rpc = [
+            (
+                f'instance="{_escape(instance_id)}",model="{_escape(model)}",method="{_escape(method)}"',
+                stats,
+            )
+            for (instance_id, model, method), stats in sorted(self.rpc.items())
+        ]
+
+        family("odoo_mcp_tool_duration_seconds", "histogram", "MCP tool call duration.")
+        for labels, stats in tools:
+            histogram("odoo_mcp_tool_duration_seconds", labels, stats.latency)
+        family("odoo_mcp_tool_errors_total", "counter", "MCP tool calls that raised.")
+        for labels, stats in tools:
+            lines.append(f"odoo_mcp_tool_errors_total{{{labels}}} {stats.errors}")
+
+        family("odoo_mcp_rpc_duration_seconds", "histogram", "Odoo RPC round-trip duration.")
+        for labels, stats in rpc:
+            histogram("odoo_mcp_rpc_duration_seconds", labels, stats.latency)
+        family("odoo_mcp_rpc_errors_total", "counter", "Odoo RPC calls that failed.")
+        for labels, stats in rpc:
+            lines.append(f"odoo_mcp_rpc_errors_total{{{labels}}} {stats.errors}")
+        family("odoo_mcp_rpc_request_bytes_total", "counter", "Odoo RPC request body bytes.")
+        for labels, stats in rpc:
+            lines.append(f"odoo_mcp_rpc_request_bytes_total{{{labels}}} {stats.bytes_out}")
+        family("odoo_mcp_rpc_response_bytes_total", "counter", "Odoo RPC response body bytes.")
+        for labels, stats in rpc:
+            lines.append(f"odoo_mcp_rpc_response_bytes_total{{{labels}}} {stats.bytes_in}")
+        family(
+            "odoo_mcp_rpc_serialize_seconds_total",
+            "counter",
+            "Time spent encoding Odoo RPC requests and parsing responses.",
+        )
+        for labels, stats in rpc:
+            lines.append(f"odoo_mcp_rpc_serialize_seconds_total{{{labels}}} {stats.serialize_seconds:.6f}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsMiddleware(Middleware):
+    """FastMCP middleware timing every tool call."""
+
+    def __init__(self, metrics: Metrics):
+        """Initialize the middleware.
+
+        Args:
+            metrics: Metrics to record into
+        """
+        self.metrics = metrics
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: CallNext) -> Any:
+        """Time a tool call and count failures."""
+        name = getattr(context.message, "name", "unknown")
+        start = time.perf_counter()
+        try:
+            result = await call_next(context)
+        except Exception:
+            self.metrics.observe_tool(name, time.perf_counter() - start, error=True)
+            raise
+        self.metrics.observe_tool(name, time.perf_counter() - start)
+        return result
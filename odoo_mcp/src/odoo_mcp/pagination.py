@@ -0,0 +1,144 @@
+"""Keyset pagination over Odoo search_read."""
+
+import base64
+import binascii
+import hashlib
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .connection import OdooAsyncClient
+from .errors import ValidationError
+
+# Upper bounds keeping a single tool response bounded in size
+MAX_PAGE_SIZE = 2000
+MAX_RECORDS_PER_CALL = 10000
+
+
+def query_fingerprint(
+    model: str, domain: List[Any], fields: Optional[List[str]]
+) -> str:
+    """Hash the parts of a query a cursor is bound to.
+
+    Args:
+        model: Model name
+        domain: Search domain
+        fields: Field list
+
+    Returns:
+        Short hex digest
+    """
+    raw = json.dumps([model, domain, fields or []], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def encode_cursor(after_id: int, fingerprint: str) -> str:
+    """Build an opaque continuation token.
+
+    Args:
+        after_id: Last id returned so far
+        fingerprint: Query fingerprint
+
+    Returns:
+        URL-safe token
+    """
+    raw = json.dumps({"after": after_id, "q": fingerprint}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, fingerprint: str) -> int:
+    """Read the last id out of a continuation token.
+
+    Args:
+        cursor: Token returned by a previous page
+        fingerprint: Fingerprint of the current query
+
+    Returns:
+        Id to continue after
+
+    Raises:
+        ValidationError: If the token is malformed or belongs to another query
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        after_id = int(data["after"])
+    except (ValueError, KeyError, TypeError, binascii.Error) as e:
+        raise ValidationError("Invalid cursor", {"cursor": cursor}) from e
+
+    if data.get("q") != fingerprint:
+        raise ValidationError(
+            "Cursor does not match this model, domain and fields",
+            {"cursor": cursor},
+        )
+    return after_id
+
+
+async def fetch_page(
+    client: OdooAsyncClient,
+    model: str,
+    domain: List[Any],
+    fields: Optional[List[str]],
+    page_size: int,
+    after_id: int = 0,
+    descending: bool = False,
+) -> List[Dict[str, Any]]:
+    """Fetch one page of records with ``id > after_id``.
+
+    Filtering on the primary key instead of using OFFSET keeps every page
+    an index range scan, so page latency stays flat deep into large tables.
+
+    Args:
+        client: Connected Odoo client
+        model: Model name
+        domain: Search domain
+        fields: Fields to read (``id`` is always included)
+        page_size: Maximum records per page
+        after_id: Id to continue after
+        descending: Walk from the newest id down (``id < after_id``)
+
+    Returns:
+        Records ordered by id
+    """
+    page_domain = list(domain)
+    if after_id:
+        page_domain.append(["id", "<" if descending else ">", after_id])
+
+    order = "id desc" if descending else "id asc"
+    kwargs: Dict[str, Any] = {"limit": page_size, "order": order}
+    if fields:
+        kwargs["fields"] = sorted(set(fields) | {"id"})
+    records: List[Dict[str, Any]] = await client.execute_kw(
+        model, "search_read", [page_domain], kwargs
+    )
+    return records
+
+
+async def iter_pages(
+    client: OdooAsyncClient,
+    model: str,
+    domain: List[Any],
+    fields: Optional[List[str]],
+    page_size: int,
+    after_id: int = 0,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Walk all matching records page by page.
+
+    Args:
+        client: Connected Odoo client
+        model: Model name
+        domain: Search domain
+        fields: Fields to read
+        page_size: Maximum records per page
+        after_id: Id to start after
+
+    Yields:
+        Non-empty pages of records ordered by id
+    """
+    while True:
+        page = await fetch_page(client, model, domain, fields, page_size, after_id)
+        if not page:
+            return
+        yield page
+        if len(page) < page_size:
+            return
+        after_id = page[-1]["id"]
@@ -0,0 +1,132 @@
+"""Reporting period parsing."""
+
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, List, Optional
+
+from .errors import ValidationError
+
+CUSTOM_RANGE = re.compile(r"^(\d{4}-\d{2}-\d{2})\.\.(\d{4}-\d{2}-\d{2})$")
+
+NAMED_PERIODS = (
+    "today",
+    "yesterday",
+    "this_week",
+    "last_week",
+    "this_month",
+    "last_month",
+    "this_quarter",
+    "last_quarter",
+    "this_year",
+    "last_year",
+    "ytd",
+    "last_7_days",
+    "last_30_days",
+)
+
+
+@dataclass(frozen=True)
+class Period:
+    """A half-open date range ``[start, end)``."""
+
+    start: date
+    end: date
+
+    @property
+    def days(self) -> int:
+        """Number of days in the period."""
+        return (self.end - self.start).days
+
+    def is_closed(self, today: Optional[date] = None) -> bool:
+        """Check whether the period lies entirely in the past.
+
+        Args:
+            today: Reference date (defaults to the current date)
+
+        Returns:
+            True if no later data can fall inside the period
+        """
+        return self.end <= (today or date.today())
+
+    def domain(self, field: str) -> List[Any]:
+        """Build a search domain restricting a date or datetime field.
+
+        Args:
+            field: Field name (e.g., 'date_order')
+
+        Returns:
+            Domain selecting values inside the period
+        """
+        return [
+            [field, ">=", f"{self.start.isoformat()} 00:00:00"],
+            [field, "<", f"{self.end.isoformat()} 00:00:00"],
+        ]
+
+
+def _quarter_start(day: date) -> date:
+    return date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
+
+
+def _add_months(day: date, months: int) -> date:
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def parse_period(period: str, today: Optional[date] = None) -> Period:
+    """Translate a period name or custom range into dates.
+
+    Accepted values are the names in ``NAMED_PERIODS`` (``ytd`` runs up to
+    and including today) and custom ranges written ``YYYY-MM-DD..YYYY-MM-DD``
+    with both ends included.
+
+    Args:
+        period: Period specification
+        today: Reference date (defaults to the current date)
+
+    Returns:
+        The matching period
+
+    Raises:
+        ValidationError: If the period is unknown or the range is invalid
+    """
+    today = today or date.today()
+    tomorrow = today + timedelta(days=1)
+    week_start = today - timedelta(days=today.weekday())
+    month_start = today.replace(day=1)
+    quarter_start = _quarter_start(today)
+    year_start = date(today.year, 1, 1)
+
+    ranges = {
+        "today": (today, tomorrow),
+        "yesterday": (today - timedelta(days=1), today),
+        "this_week": (week_start, week_start + timedelta(days=7)),
+        "last_week": (week_start - timedelta(days=7), week_start),
+        "this_month": (month_start, _add_months(month_start, 1)),
+        "last_month": (_add_months(month_start, -1), month_start),
+        "this_quarter": (quarter_start, _add_months(quarter_start, 3)),
+        "last_quarter": (_add_months(quarter_start, -3), quarter_start),
+        "this_year": (year_start, date(today.year + 1, 1, 1)),
+        "last_year": (date(today.year - 1, 1, 1), year_start),
+        "ytd": (year_start, tomorrow),
+        "last_7_days": (tomorrow - timedelta(days=7), tomorrow),
+        "last_30_days": (tomorrow - timedelta(days=30), tomorrow),
+    }
+    if period in ranges:
+        return Period(*ranges[period])
+
+    match = CUSTOM_RANGE.match(period)
+    if match:
+        try:
+            start = date.fromisoformat(match.group(1))
+            last = date.fromisoformat(match.group(2))
+        except ValueError as e:
+            raise ValidationError(f"Invalid date in period '{period}'", {"period": period}) from e
+        if last >= start:
+            return Period(start, last + timedelta(days=1))
+
+    raise ValidationError(
+        f"Invalid period '{period}'; use one of {', '.join(NAMED_PERIODS)} "
+        "or YYYY-MM-DD..YYYY-MM-DD",
+        {"period": period},
+    )
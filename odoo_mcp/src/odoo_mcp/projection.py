@@ -0,0 +1,65 @@
+"""Lean default field selection for reads."""
+
+from typing import Any, Dict, List, Optional
+
+from .connection import OdooAsyncClient
+
+# Pass as the field list to read every field
+ALL_FIELDS = "all"
+
+# Field types left out of default reads because of their payload size
+HEAVY_TYPES = frozenset({"binary", "html"})
+
+# Cheap non-stored fields kept in every default read
+ALWAYS_INCLUDED = frozenset({"id", "display_name"})
+
+
+def lean_fields(fields_meta: Dict[str, Dict[str, Any]]) -> tuple[List[str], List[str]]:
+    """Split a model's fields into a lean default set and the rest.
+
+    Binary and html fields are left out because of their size, non-stored
+    computed fields because Odoo recomputes them on every read.
+
+    Args:
+        fields_meta: ``fields_get`` result with ``type`` and ``store``
+
+    Returns:
+        Tuple of (included, excluded) field names, both sorted
+    """
+    included = []
+    excluded = []
+    for name, meta in fields_meta.items():
+        heavy = meta.get("type") in HEAVY_TYPES or meta.get("store") is False
+        if heavy and name not in ALWAYS_INCLUDED:
+            excluded.append(name)
+        else:
+            included.append(name)
+    return sorted(included), sorted(excluded)
+
+
+async def project_fields(
+    client: OdooAsyncClient, model: str, fields: Optional[List[str]]
+) -> tuple[Optional[List[str]], List[str]]:
+    """Resolve the fields to read for a call.
+
+    An explicit field list is used as given and ``["all"]`` reads every
+    field. Without a list, the lean default set is derived from cached
+    ``fields_get`` metadata.
+
+    Args:
+        client: Connected Odoo client
+        model: Model name
+        fields: Requested fields, ``["all"]``, or None for the lean default
+
+    Returns:
+        Tuple of (fields to read or None for all, excluded field names)
+    """
+    if fields == [ALL_FIELDS]:
+        return None, []
+    if fields:
+        return fields, []
+
+    meta = await client.execute_kw(
+        model, "fields_get", [], {"attributes": ["type", "store"]}
+    )
+    return lean_fields(meta)
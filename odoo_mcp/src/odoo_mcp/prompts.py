@@ -1,12 +1,260 @@
 """MCP prompts for common Odoo operations."""
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from .cache import TTLCache
 from .connection import ConnectionPoolManager
+from .errors import OdooMCPError
+from .periods import Period, parse_period
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
 
+logger = logging.getLogger(__name__)
+
+# Overall time budget for the data behind one prompt
+PREFETCH_TIMEOUT = 20.0
+
+# Report data lifetimes: periods still open can change, closed ones cannot
+OPEN_PERIOD_TTL = 60.0
+CLOSED_PERIOD_TTL = 3600.0
+REPORT_CACHE_SIZE = 128
+
+
+@dataclass
+class Query:
+    """One Odoo call a prompt depends on."""
+
+    model: str
+    method: str
+    args: list[Any]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    default: Any = None
+
+
+@dataclass
+class PrefetchResult:
+    """Data fetched for a prompt, with the queries that failed."""
+
+    data: Dict[str, Any]
+    errors: Dict[str, str]
+
+    def unavailable(self, name: str, label: str) -> str:
+        """Describe a failed query for the rendered prompt.
+
+        Args:
+            name: Query name
+            label: Human-readable description of the data
+
+        Returns:
+            Markdown note, or an empty string if the query succeeded
+        """
+        if name not in self.errors:
+            return ""
+        return f"_{label} unavailable: {self.errors[name]}_\n"
+
+
+async def prefetch(
+    connection_pool: ConnectionPoolManager,
+    instance_id: str,
+    queries: Dict[str, Query],
+    timeout: float = PREFETCH_TIMEOUT,
+) -> PrefetchResult:
+    """Run a prompt's queries concurrently.
+
+    Each query uses its own pooled client. Queries that fail, or are still
+    running when ``timeout`` expires, get their ``default`` value and an
+    entry in ``errors`` so the prompt can still be rendered.
+
+    Args:
+        connection_pool: Connection pool manager
+        instance_id: Odoo instance identifier
+        queries: Queries keyed by name
+        timeout: Overall time budget in seconds
+
+    Returns:
+        Results and errors keyed by query name
+    """
+    async def run(query: Query) -> Any:
+        async with connection_pool.get_connection(instance_id) as client:
+            return await client.execute_kw(
+                query.model, query.method, query.args, query.kwargs
+            )
+
+    tasks = {name: asyncio.ensure_future(run(query)) for name, query in queries.items()}
+    if tasks:
+        await asyncio.wait(tasks.values(), timeout=timeout)
+
+    result = PrefetchResult(data={}, errors={})
+    for name, task in tasks.items():
+        query = queries[name]
+        if not task.done():
+            task.cancel()
+            result.errors[name] = f"timed out after {timeout:g}s"
+        elif task.exception() is not None:
+            error = task.exception()
+            if not isinstance(error, OdooMCPError):
+                # Unexpected responses must not take the whole prompt down
+                logger.warning("Prompt query %s failed", name, exc_info=error)
+            result.errors[name] = str(error) or type(error).__name__
+        else:
+            result.data[name] = task.result()
+            continue
+        result.data[name] = query.default
+    return result
+
+
+# Products with less on hand than this are reported as low stock
+LOW_STOCK_THRESHOLD = 10
+
+# Move states that still change stock in the future
+PENDING_MOVE_STATES = ["confirmed", "waiting", "partially_available", "assigned"]
+
+
+def _warehouse_domain(field: str, warehouse: str) -> list[Any]:
+    """Restrict a location field to one warehouse, by name or code."""
+    if warehouse == "all":
+        return []
+    return [
+        "|",
+        [f"{field}.warehouse_id.name", "=", warehouse],
+        [f"{field}.warehouse_id.code", "=", warehouse],
+    ]
+
+
+def _inventory_queries(warehouse: str, include_forecast: bool) -> Dict[str, Query]:
+    """Build the aggregated queries behind the inventory prompt.
+
+    The number of queries is fixed; only the number of returned groups
+    grows with the catalog.
+
+    Args:
+        warehouse: Warehouse name or code, or 'all'
+        include_forecast: Also aggregate pending incoming and outgoing moves
+
+    Returns:
+        Queries keyed by name
+    """
+    queries = {
+        # On-hand quantity per product and internal location
+        "quants": Query(
+            "stock.quant",
+            "read_group",
+            [
+                [["location_id.usage", "=", "internal"], *_warehouse_domain("location_id", warehouse)],
+                ["quantity:sum"],
+                ["product_id", "location_id"],
+            ],
+            {"lazy": False},
+            default=[],
+        ),
+        "locations": Query(
+            "stock.location",
+            "search_read",
+            [[["usage", "=", "internal"]]],
+            {"fields": ["warehouse_id"]},
+            default=[],
+        ),
+        "storable": Query(
+            "product.product",
+            "search_count",
+            [[["type", "=", "product"]]],
+        ),
+    }
+    if include_forecast:
+        for name, inside, outside in (
+            ("incoming", "location_dest_id", "location_id"),
+            ("outgoing", "location_id", "location_dest_id"),
+        ):
+            queries[name] = Query(
+                "stock.move",
+                "read_group",
+                [
+                    [
+                        ["state", "in", PENDING_MOVE_STATES],
+                        [f"{inside}.usage", "=", "internal"],
+                        [f"{outside}.usage", "!=", "internal"],
+                        *_warehouse_domain(inside, warehouse),
+                    ],
+                    ["product_qty:sum"],
+                    ["product_id"],
+                ],
+                {"lazy": False},
+                default=[],
+            )
+    return queries
+
+
+def _summarize_inventory(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn aggregated stock groups into per-product and per-warehouse figures.
+
+    Args:
+        data: Results of the queries from :func:`_inventory_queries`
+
+    Returns:
+        Dictionary with ``on_hand``, ``forecast`` and ``names`` per product
+        id, ``warehouses`` totals, ``low_stock`` product ids (lowest first)
+        and ``negative_forecast`` product ids
+    """
+    warehouse_of = {
+        location["id"]: location["warehouse_id"][1] if location["warehouse_id"] else "No warehouse"
+        for location in data.get("locations") or []
+    }
+
+    on_hand: Dict[int, float] = {}
+    names: Dict[int, str] = {}
+    warehouses: Dict[str, Dict[str, Any]] = {}
+    stocked: Dict[str, set[int]] = {}
+    for group in data.get("quants") or []:
+        if not group.get("product_id"):
+            continue
+        product_id, names[product_id] = group["product_id"]
+        quantity = group.get("quantity") or 0.0
+        on_hand[product_id] = on_hand.get(product_id, 0.0) + quantity
+
+        location = group.get("location_id")
+        name = warehouse_of.get(location[0], "No warehouse") if location else "No warehouse"
+        totals = warehouses.setdefault(name, {"products": 0, "quantity": 0.0})
+        totals["quantity"] += quantity
+        if quantity > 0 and product_id not in stocked.setdefault(name, set()):
+            stocked[name].add(product_id)
+            totals["products"] += 1
+
+    def moves(name: str) -> Dict[int, float]:
+        totals: Dict[int, float] = {}
+        for group in data.get(name) or []:
+            if group.get("product_id"):
+                product_id, names[product_id] = group["product_id"]
+                totals[product_id] = group.get("product_qty") or 0.0
+        return totals
+
+    forecast: Dict[int, float] = {}
+    if "incoming" in data or "outgoing" in data:
+        incoming, outgoing = moves("incoming"), moves("outgoing")
+        for product_id in {*on_hand, *incoming, *outgoing}:
+            forecast[product_id] = (
+                on_hand.get(product_id, 0.0)
+                + incoming.get(product_id, 0.0)
+                - outgoing.get(product_id, 0.0)
+            )
+
+    low_stock = sorted(
+        (product_id for product_id, quantity in on_hand.items() if quantity < LOW_STOCK_THRESHOLD),
+        key=lambda product_id: (on_hand[product_id], names[product_id]),
+    )
+    return {
+        "on_hand": on_hand,
+        "forecast": forecast,
+        "names": names,
+        "warehouses": warehouses,
+        "low_stock": low_stock,
+        "negative_forecast": [p for p, quantity in forecast.items() if quantity < 0],
+    }
+
 
 class PromptRegistry:
     """Registry for MCP prompts."""
@@ -20,8 +268,41 @@ class PromptRegistry:
         """
         self.mcp = mcp
         self.connection_pool = connection_pool
+        self._report_cache = TTLCache(maxsize=REPORT_CACHE_SIZE)
         self._register_prompts()
 
+    async def _fetch_report(
+        self,
+        instance_id: str,
+        queries: Dict[str, "Query"],
+        period: Optional[Period],
+        cache_key: Optional[tuple[Any, ...]],
+    ) -> "PrefetchResult":
+        """Prefetch report data, reusing a recent result for the same period.
+
+        Complete results are cached for ``OPEN_PERIOD_TTL`` while the period
+        is still open and ``CLOSED_PERIOD_TTL`` once it lies in the past.
+
+        Args:
+            instance_id: Odoo instance identifier
+            queries: Queries keyed by name
+            period: Reporting period, or None if the report is not dated
+            cache_key: Cache key, or None to skip caching
+
+        Returns:
+            Fetched data and errors
+        """
+        if cache_key is not None:
+            cached: Optional[PrefetchResult] = self._report_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        fetched = await prefetch(self.connection_pool, instance_id, queries)
+        if cache_key is not None and period is not None and not fetched.errors:
+            ttl = CLOSED_PERIOD_TTL if period.is_closed() else OPEN_PERIOD_TTL
+            self._report_cache.set(cache_key, fetched, ttl=ttl)
+        return fetched
+
     def _register_prompts(self) -> None:
         """Register all prompts."""
 
@@ -33,69 +314,79 @@ class PromptRegistry:
         ) -> str:
             """Analyze current inventory levels and provide insights.
 
+            Stock is aggregated server-side from ``stock.quant`` (and pending
+            ``stock.move`` for the forecast), so the whole catalog is covered
+            in a fixed number of calls.
+
             Args:
                 instance_id: Odoo instance to analyze
-                warehouse: Specific warehouse or 'all'
+                warehouse: Warehouse name or code, or 'all'
                 include_forecast: Include demand forecast analysis
 
             Returns:
                 Formatted inventory analysis report
             """
-            async with self.connection_pool.get_connection(instance_id) as client:
-                # Get product inventory
-                products = await client.execute_kw(
-                    "product.product",
-                    "search_read",
-                    [[]],
-                    {
-                        "fields": [
-                            "name",
-                            "qty_available",
-                            "virtual_available",
-                            "list_price",
-                        ],
-                        "limit": 50,
-                        "order": "qty_available asc",
-                    },
-                )
-
-                # Build analysis
-                report = "# Inventory Analysis Report\n\n"
-                report += f"**Instance**: {instance_id}\n"
-                report += f"**Warehouse**: {warehouse}\n\n"
-
-                report += "## Low Stock Alert (Bottom 10 Products)\n\n"
-                low_stock_threshold = 10
-                low_stock = [
-                    p for p in products if p["qty_available"] < low_stock_threshold
-                ][:10]
-
-                if low_stock:
-                    report += "| Product | On Hand | Forecasted | Price |\n"
-                    report += "|---------|---------|------------|-------|\n"
-                    for product in low_stock:
-                        report += f"| {product['name'][:30]} | {product['qty_available']} | {product['virtual_available']} | ${product['list_price']:.2f} |\n"
+            fetched = await prefetch(
+                self.connection_pool,
+                instance_id,
+                _inventory_queries(warehouse, include_forecast),
+            )
+            summary = _summarize_inventory(fetched.data)
+
+            # Build analysis
+            report = "# Inventory Analysis Report\n\n"
+            report += f"**Instance**: {instance_id}\n"
+            report += f"**Warehouse**: {warehouse}\n\n"
+
+            report += "## Stock by Warehouse\n\n"
+            report += fetched.unavailable("quants", "Stock levels")
+            report += fetched.unavailable("locations", "Warehouse locations")
+            if summary["warehouses"]:
+                report += "| Warehouse | Products in Stock | Units On Hand |\n"
+                report += "|-----------|-------------------|---------------|\n"
+                for name, stats in sorted(summary["warehouses"].items()):
+                    report += f"| {name} | {stats['products']} | {stats['quantity']:,.0f} |\n"
+            elif "quants" not in fetched.errors:
+                report += "No stock on hand.\n"
+
+            report += "\n## Low Stock Alert (Bottom 10 Products)\n\n"
+            report += f"- **{len(summary['low_stock'])} products** have less than {LOW_STOCK_THRESHOLD} units on hand\n"
+            if fetched.data.get("storable"):
+                unstocked = max(0, fetched.data["storable"] - len(summary["on_hand"]))
+                report += f"- **{unstocked} storable products** have no stock on hand\n"
+            report += "\n"
+
+            if summary["low_stock"]:
+                report += "| Product | On Hand | Forecasted |\n"
+                report += "|---------|---------|------------|\n"
+                for product_id in summary["low_stock"][:10]:
+                    forecast = summary["forecast"].get(product_id)
+                    report += (
+                        f"| {summary['names'][product_id][:30]} "
+                        f"| {summary['on_hand'][product_id]:g} "
+                        f"| {'n/a' if forecast is None else f'{forecast:g}'} |\n"
+                    )
+            elif "quants" not in fetched.errors:
+                report += "No products with low stock found.\n"
+
+            if include_forecast:
+                report += "\n## Forecast Analysis\n\n"
+                report += fetched.unavailable("incoming", "Incoming moves")
+                report += fetched.unavailable("outgoing", "Outgoing moves")
+                report += "Based on current stock levels and pending orders:\n"
+                negative_forecast = summary["negative_forecast"]
+                if negative_forecast:
+                    report += f"- **{len(negative_forecast)} products** will have negative stock after fulfilling pending orders\n"
+                    report += "- Immediate procurement action required\n"
                 else:
-                    report += "No products with low stock found.\n"
-
-                if include_forecast:
-                    report += "\n## Forecast Analysis\n\n"
-                    report += "Based on current stock levels and pending orders:\n"
-                    negative_forecast = [
-                        p for p in products if p["virtual_available"] < 0
-                    ]
-                    if negative_forecast:
-                        report += f"- **{len(negative_forecast)} products** will have negative stock after fulfilling pending orders\n"
-                        report += "- Immediate procurement action required\n"
-                    else:
-                        report += "- All products have sufficient stock to meet pending demand\n"
-
-                report += "\n## Recommendations\n\n"
-                report += "1. Review and reorder products with low stock levels\n"
-                report += "2. Consider safety stock adjustments for frequently ordered items\n"
-                report += "3. Analyze seasonal patterns for better forecasting\n"
-
-                return report
+                    report += "- All products have sufficient stock to meet pending demand\n"
+
+            report += "\n## Recommendations\n\n"
+            report += "1. Review and reorder products with low stock levels\n"
+            report += "2. Consider safety stock adjustments for frequently ordered items\n"
+            report += "3. Analyze seasonal patterns for better forecasting\n"
+
+            return report
 
         @self.mcp.prompt("optimize_procurement")
         async def optimize_procurement_prompt(
@@ -113,9 +404,9 @@ class PromptRegistry:
             Returns:
                 Procurement optimization recommendations
             """
-            async with self.connection_pool.get_connection(instance_id) as client:
-                # Get products needing reorder
-                products = await client.execute_kw(
+            fetched = await prefetch(self.connection_pool, instance_id, {
+                # Products needing reorder
+                "products": Query(
                     "product.product",
                     "search_read",
                     [[["qty_available", "<", 10]]],
@@ -129,56 +420,62 @@ class PromptRegistry:
                         ],
                         "limit": 20,
                     },
-                )
-
-                report = "# Procurement Optimization Report\n\n"
-                report += f"**Lead Time**: {lead_time_days} days\n"
-                if supplier_id:
-                    report += f"**Supplier ID**: {supplier_id}\n"
-                report += "\n## Products Requiring Reorder\n\n"
-
-                if products:
-                    report += (
-                        "| Product | Current Stock | After Orders | Suggested Qty |\n"
-                    )
-                    report += (
-                        "|---------|--------------|--------------|---------------|\n"
-                    )
-
-                    for product in products:
-                        suggested_qty = max(
-                            20,  # Minimum order
-                            product.get("reordering_max_qty", 50)
-                            - product["qty_available"],
-                        )
-                        report += f"| {product['name'][:30]} | {product['qty_available']} | {product['virtual_available']} | {suggested_qty} |\n"
-
-                    report += f"\n**Total Products**: {len(products)}\n"
-                else:
-                    report += "No products currently require reordering.\n"
-
-                # Get pending purchase orders
-                pending_pos = await client.execute_kw(
+                    default=[],
+                ),
+                # Pending purchase orders
+                "pending_pos": Query(
                     "purchase.order",
                     "search_count",
                     [[["state", "in", ["draft", "sent"]]]],
+                    default="n/a",
+                ),
+            })
+            products = fetched.data["products"]
+            pending_pos = fetched.data["pending_pos"]
+
+            report = "# Procurement Optimization Report\n\n"
+            report += f"**Lead Time**: {lead_time_days} days\n"
+            if supplier_id:
+                report += f"**Supplier ID**: {supplier_id}\n"
+            report += "\n## Products Requiring Reorder\n\n"
+            report += fetched.unavailable("products", "Product stock")
+
+            if products:
+                report += (
+                    "| Product | Current Stock | After Orders | Suggested Qty |\n"
                 )
-
-                report += "\n## Current Procurement Status\n\n"
-                report += f"- **Pending Purchase Orders**: {pending_pos}\n"
-                report += f"- **Products Below Reorder Point**: {len(products)}\n"
-
-                report += "\n## Optimization Strategies\n\n"
-                report += "1. **Consolidate Orders**: Group products by supplier to reduce shipping costs\n"
                 report += (
-                    "2. **Lead Time Buffer**: Add "
-                    + str(lead_time_days)
-                    + " days buffer for critical items\n"
+                    "|---------|--------------|--------------|---------------|\n"
                 )
-                report += "3. **Volume Discounts**: Consider bulk ordering for high-turnover items\n"
-                report += "4. **Automate Reordering**: Set up reordering rules for consistent items\n"
 
-                return report
+                for product in products:
+                    suggested_qty = max(
+                        20,  # Minimum order
+                        product.get("reordering_max_qty", 50)
+                        - product["qty_available"],
+                    )
+                    report += f"| {product['name'][:30]} | {product['qty_available']} | {product['virtual_available']} | {suggested_qty} |\n"
+
+                report += f"\n**Total Products**: {len(products)}\n"
+            elif "products" not in fetched.errors:
+                report += "No products currently require reordering.\n"
+
+            report += "\n## Current Procurement Status\n\n"
+            report += fetched.unavailable("pending_pos", "Purchase order count")
+            report += f"- **Pending Purchase Orders**: {pending_pos}\n"
+            report += f"- **Products Below Reorder Point**: {len(products)}\n"
+
+            report += "\n## Optimization Strategies\n\n"
+            report += "1. **Consolidate Orders**: Group products by supplier to reduce shipping costs\n"
+            report += (
+                "2. **Lead Time Buffer**: Add "
+                + str(lead_time_days)
+                + " days buffer for critical items\n"
+            )
+            report += "3. **Volume Discounts**: Consider bulk ordering for high-turnover items\n"
+            report += "4. **Automate Reordering**: Set up reordering rules for consistent items\n"
+
+            return report
 
         @self.mcp.prompt("generate_report")
         async def generate_report_prompt(
@@ -188,89 +485,134 @@ class PromptRegistry:
         ) -> str:
             """Generate various business reports from Odoo data.
 
+            Sales figures are aggregated server-side over the requested
+            period, grouped by day (by week for periods over a month).
+
             Args:
                 instance_id: Odoo instance to analyze
                 report_type: Type of report (sales_summary, inventory_valuation, etc.)
-                period: Time period for the report
+                period: Time period for the report (this_month, last_quarter,
+                    ytd, ... or YYYY-MM-DD..YYYY-MM-DD)
 
             Returns:
                 Formatted business report
             """
-            async with self.connection_pool.get_connection(instance_id) as client:
-                report = "# Odoo Business Report\n\n"
-                report += f"**Type**: {report_type.replace('_', ' ').title()}\n"
-                report += f"**Period**: {period.replace('_', ' ').title()}\n\n"
-
-                if report_type == "sales_summary":
-                    # Get sales orders
-                    orders = await client.execute_kw(
-                        "sale.order",
-                        "search_read",
-                        [[["state", "in", ["sale", "done"]]]],
-                        {
-                            "fields": ["name", "partner_id", "amount_total", "state"],
-                            "limit": 10,
-                            "order": "date_order desc",
-                        },
-                    )
+            queries: Dict[str, Query] = {}
+            sales_period: Optional[Period] = None
+            cache_key: Optional[tuple[Any, ...]] = None
+            if report_type == "sales_summary":
+                sales_period = parse_period(period)
+                cache_key = (instance_id, report_type, sales_period)
+                granularity = "day" if sales_period.days <= 31 else "week"
+                domain = [
+                    ["state", "in", ["sale", "done"]],
+                    *sales_period.domain("date_order"),
+                ]
+                queries["totals"] = Query(
+                    "sale.order",
+                    "read_group",
+                    [domain, ["amount_total:sum"], [f"date_order:{granularity}"]],
+                    {"lazy": False},
+                    default=[],
+                )
+                queries["orders"] = Query(
+                    "sale.order",
+                    "search_read",
+                    [domain],
+                    {
+                        "fields": ["name", "partner_id", "amount_total", "state"],
+                        "limit": 5,
+                        "order": "date_order desc",
+                    },
+                    default=[],
+                )
+            elif report_type == "inventory_valuation":
+                queries["products"] = Query(
+                    "product.product",
+                    "search_read",
+                    [[["qty_available", ">", 0]]],
+                    {
+                        "fields": ["name", "qty_available", "standard_price"],
+                        "limit": 50,
+                    },
+                    default=[],
+                )
+            fetched = await self._fetch_report(
+                instance_id, queries, sales_period, cache_key
+            )
+
+            report = "# Odoo Business Report\n\n"
+            report += f"**Type**: {report_type.replace('_', ' ').title()}\n"
+            report += f"**Period**: {period.replace('_', ' ').title()}"
+            if sales_period is not None:
+                last_day = sales_period.end - timedelta(days=1)
+                report += f" ({sales_period.start.isoformat()} to {last_day.isoformat()})"
+            report += "\n\n"
+
+            if report_type == "sales_summary":
+                totals = fetched.data["totals"]
+                orders = fetched.data["orders"]
+                report += fetched.unavailable("totals", "Sales totals")
+                report += fetched.unavailable("orders", "Recent orders")
+
+                order_count = sum(group.get("__count", 0) for group in totals)
+                if order_count:
+                    total_sales = sum(group.get("amount_total") or 0.0 for group in totals)
+                    report += "## Sales Overview\n\n"
+                    report += f"- **Total Orders**: {order_count}\n"
+                    report += f"- **Total Revenue**: ${total_sales:,.2f}\n"
+                    report += f"- **Average Order Value**: ${total_sales/order_count:,.2f}\n\n"
+
+                    report += f"### Revenue by {granularity.title()}\n\n"
+                    report += f"| {granularity.title()} | Orders | Revenue |\n"
+                    report += "|------|--------|---------|\n"
+                    for group in totals:
+                        report += f"| {group.get(f'date_order:{granularity}')} | {group.get('__count', 0)} | ${group.get('amount_total') or 0.0:,.2f} |\n"
+                    report += "\n"
+
+                if orders:
+                    report += "### Recent Orders\n\n"
+                    report += "| Order | Customer | Amount | Status |\n"
+                    report += "|-------|----------|--------|--------|\n"
+                    for order in orders[:5]:
+                        customer = (
+                            order["partner_id"][1] if order["partner_id"] else "N/A"
+                        )
+                        report += f"| {order['name']} | {customer[:20]} | ${order['amount_total']:,.2f} | {order['state']} |\n"
+                if not order_count and "totals" not in fetched.errors:
+                    report += "No sales orders found for the specified period.\n"
 
-                    if orders:
-                        total_sales = sum(order["amount_total"] for order in orders)
-                        report += "## Sales Overview\n\n"
-                        report += f"- **Total Orders**: {len(orders)}\n"
-                        report += f"- **Total Revenue**: ${total_sales:,.2f}\n"
-                        report += f"- **Average Order Value**: ${total_sales/len(orders):,.2f}\n\n"
-
-                        report += "### Recent Orders\n\n"
-                        report += "| Order | Customer | Amount | Status |\n"
-                        report += "|-------|----------|--------|--------|\n"
-                        for order in orders[:5]:
-                            customer = (
-                                order["partner_id"][1] if order["partner_id"] else "N/A"
-                            )
-                            report += f"| {order['name']} | {customer[:20]} | ${order['amount_total']:,.2f} | {order['state']} |\n"
-                    else:
-                        report += "No sales orders found for the specified period.\n"
-
-                elif report_type == "inventory_valuation":
-                    # Get inventory valuation
-                    products = await client.execute_kw(
-                        "product.product",
-                        "search_read",
-                        [[["qty_available", ">", 0]]],
-                        {
-                            "fields": ["name", "qty_available", "standard_price"],
-                            "limit": 50,
-                        },
-                    )
+            elif report_type == "inventory_valuation":
+                products = fetched.data["products"]
+                report += fetched.unavailable("products", "Inventory")
 
-                    if products:
-                        total_value = sum(
-                            p["qty_available"] * p["standard_price"] for p in products
-                        )
-                        total_units = sum(p["qty_available"] for p in products)
-
-                        report += "## Inventory Valuation\n\n"
-                        report += f"- **Total Products**: {len(products)}\n"
-                        report += f"- **Total Units**: {total_units:,.0f}\n"
-                        report += f"- **Total Value**: ${total_value:,.2f}\n"
-                        report += f"- **Average Value per Unit**: ${total_value/total_units:,.2f}\n\n"
-
-                        # Top valuable products
-                        products_by_value = sorted(
-                            products,
-                            key=lambda p: p["qty_available"] * p["standard_price"],
-                            reverse=True,
-                        )
+                if products:
+                    total_value = sum(
+                        p["qty_available"] * p["standard_price"] for p in products
+                    )
+                    total_units = sum(p["qty_available"] for p in products)
+
+                    report += "## Inventory Valuation\n\n"
+                    report += f"- **Total Products**: {len(products)}\n"
+                    report += f"- **Total Units**: {total_units:,.0f}\n"
+                    report += f"- **Total Value**: ${total_value:,.2f}\n"
+                    report += f"- **Average Value per Unit**: ${total_value/total_units:,.2f}\n\n"
+
+                    # Top valuable products
+                    products_by_value = sorted(
+                        products,
+                        key=lambda p: p["qty_available"] * p["standard_price"],
+                        reverse=True,
+                    )
 
-                        report += "### Top 5 Products by Value\n\n"
-                        report += "| Product | Quantity | Unit Cost | Total Value |\n"
-                        report += "|---------|----------|-----------|-------------|\n"
-                        for product in products_by_value[:5]:
-                            value = product["qty_available"] * product["standard_price"]
-                            report += f"| {product['name'][:30]} | {product['qty_available']} | ${product['standard_price']:.2f} | ${value:,.2f} |\n"
-                    else:
-                        report += "No inventory found.\n"
-
-                report += "\n---\n*Report generated automatically by Odoo MCP Server*"
-                return report
+                    report += "### Top 5 Products by Value\n\n"
+                    report += "| Product | Quantity | Unit Cost | Total Value |\n"
+                    report += "|---------|----------|-----------|-------------|\n"
+                    for product in products_by_value[:5]:
+                        value = product["qty_available"] * product["standard_price"]
+                        report += f"| {product['name'][:30]} | {product['qty_available']} | ${product['standard_price']:.2f} | ${value:,.2f} |\n"
+                elif "products" not in fetched.errors:
+                    report += "No inventory found.\n"
+
+            report += "\n---\n*Report generated automatically by Odoo MCP Server*"
+            return report
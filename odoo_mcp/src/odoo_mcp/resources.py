@@ -1,10 +1,49 @@
 """MCP resource handler for Odoo records."""
 
-from typing import Any, Dict
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
 from fastmcp import FastMCP
 
+from .catalog import count_records, load_models, search_models
 from .connection import ConnectionPoolManager
 from .errors import NotFoundError, ValidationError
+from .pagination import (
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    query_fingerprint,
+)
+from .projection import ALL_FIELDS, project_fields
+from .types import validate_search_domain
+
+DEFAULT_LIST_LIMIT = 100
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated ``fields`` query parameter."""
+    if not fields:
+        return None
+    return [name.strip() for name in fields.split(',') if name.strip()] or None
+
+
+def _parse_domain(domain: Optional[str]) -> List[Any]:
+    """Decode a JSON ``domain`` query parameter.
+    
+    Raises:
+        ValidationError: If the domain is not valid JSON or not a domain
+    """
+    if not domain:
+        return []
+    try:
+        parsed: List[Any] = json.loads(domain)
+    except ValueError as e:
+        raise ValidationError("Invalid search domain", {"domain": domain}) from e
+    if not validate_search_domain(parsed):
+        raise ValidationError("Invalid search domain", {"domain": domain})
+    return parsed
 
 
 class ResourceHandler:
@@ -24,32 +63,50 @@ class ResourceHandler:
     def _register_resources(self) -> None:
         """Register resource handlers."""
         
-        @self.mcp.resource("odoo://{instance}/{model}/{id}")
-        async def get_record(instance: str, model: str, id: str) -> Dict[str, Any]:
+        @self.mcp.resource("odoo://{instance}/{model}/{id}{?fields}")
+        async def get_record(
+            instance: str, model: str, id: str, fields: Optional[str] = None
+        ) -> Dict[str, Any]:
             """Get a specific Odoo record.
             
+            Binary, html and non-stored computed fields are left out unless
+            requested with ``?fields=a,b`` or ``?fields=all``.
+            
             Args:
                 instance: Instance ID
                 model: Model name
                 id: Record ID
+                fields: Comma-separated field names, or 'all'
                 
             Returns:
-                Resource dictionary with URI, mimeType, and data
+                Resource dictionary with URI, mimeType, data and the fields
+                left out
                 
             Raises:
                 NotFoundError: If record not found
             """
             record_id = int(id)
             uri = f"odoo://{instance}/{model}/{id}"
+            cache = self.connection_pool.get_record_cache(instance)
+            
+            requested = _parse_fields(fields)
             
             async with self.connection_pool.get_connection(instance) as client:
-                records = await client.execute_kw(
-                    model,
-                    'read',
-                    [[record_id]]
-                )
+                read_fields, excluded = await project_fields(client, model, requested)
                 
-                if not records:
+                async def read(fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+                    kwargs = {'fields': fields} if fields else {}
+                    records: List[Dict[str, Any]] = await client.execute_kw(
+                        model,
+                        'read',
+                        [[record_id]],
+                        kwargs
+                    )
+                    return records
+                
+                record = await cache.get(model, record_id, read_fields, read)
+                
+                if record is None:
                     raise NotFoundError(
                         f"Record {model}/{record_id} not found",
                         {"model": model, "id": record_id}
@@ -58,86 +115,157 @@ class ResourceHandler:
                 return {
                     "uri": uri,
                     "mimeType": "application/json",
-                    "data": records[0]
+                    "data": record,
+                    "excluded_fields": excluded
                 }
         
-        @self.mcp.resource("odoo://{instance}/{model}")
-        async def list_records(instance: str, model: str) -> Dict[str, Any]:
-            """List records of a model.
+        @self.mcp.resource("odoo://{instance}/{model}{?cursor,limit,domain,fields,count}")
+        async def list_records(
+            instance: str,
+            model: str,
+            cursor: Optional[str] = None,
+            limit: int = DEFAULT_LIST_LIMIT,
+            domain: Optional[str] = None,
+            fields: Optional[str] = None,
+            count: bool = True,
+        ) -> Dict[str, Any]:
+            """List records of a model, newest first, one page at a time.
             
             Args:
                 instance: Instance ID
                 model: Model name
+                cursor: Continuation token from ``next`` of a previous page
+                limit: Records per page
+                domain: JSON-encoded search domain
+                fields: Comma-separated field names, or 'all'
+                    (defaults to display_name)
+                count: Also return the total number of matching records
                 
             Returns:
-                Resource dictionary with list of records
+                Resource dictionary with one page of records, the total and
+                the URI of the next page
+                
+            Raises:
+                ValidationError: If a query parameter is invalid
             """
-            uri = f"odoo://{instance}/{model}"
+            search_domain = _parse_domain(domain)
+            if not 1 <= limit <= MAX_PAGE_SIZE:
+                raise ValidationError(
+                    f"limit must be between 1 and {MAX_PAGE_SIZE}",
+                    {"limit": limit},
+                )
+            requested = _parse_fields(fields) or ["display_name"]
+            read_fields = None if requested == [ALL_FIELDS] else requested
+            
+            fingerprint = query_fingerprint(model, search_domain, requested)
+            before_id = decode_cursor(cursor, fingerprint) if cursor else 0
             
             async with self.connection_pool.get_connection(instance) as client:
-                # Get first 100 records by default
-                record_ids = await client.execute_kw(
-                    model,
-                    'search',
-                    [[]],
-                    {'limit': 100, 'order': 'id desc'}
+                page_call = fetch_page(
+                    client, model, search_domain, read_fields, limit,
+                    before_id, descending=True,
                 )
-                
-                if record_ids:
-                    records = await client.execute_kw(
-                        model,
-                        'read',
-                        [record_ids],
-                        {'fields': ['id', 'display_name']}
+                if count:
+                    records, total = await asyncio.gather(
+                        page_call,
+                        client.execute_kw(model, 'search_count', [search_domain]),
                     )
                 else:
-                    records = []
-                
-                return {
-                    "uri": uri,
-                    "mimeType": "application/json",
-                    "data": {
-                        "model": model,
-                        "count": len(records),
-                        "records": records
-                    }
+                    records, total = await page_call, None
+            
+            next_uri = None
+            if len(records) == limit:
+                query = {
+                    "cursor": encode_cursor(records[-1]["id"], fingerprint),
+                    "limit": limit,
+                }
+                if domain:
+                    query["domain"] = domain
+                if fields:
+                    query["fields"] = fields
+                if not count:
+                    query["count"] = "false"
+                next_uri = f"odoo://{instance}/{model}?{urlencode(query)}"
+            
+            return {
+                "uri": f"odoo://{instance}/{model}",
+                "mimeType": "application/json",
+                "data": {
+                    "model": model,
+                    "count": len(records),
+                    "total": total,
+                    "records": records,
+                    "next": next_uri
                 }
+            }
         
-        @self.mcp.resource("odoo://{instance}")
-        async def list_models(instance: str) -> Dict[str, Any]:
-            """List available models for an instance.
+        @self.mcp.resource("odoo://{instance}{?q,limit,counts}")
+        async def list_models(
+            instance: str,
+            q: Optional[str] = None,
+            limit: int = DEFAULT_LIST_LIMIT,
+            counts: bool = True,
+        ) -> Dict[str, Any]:
+            """List or search the models installed on an instance.
+            
+            The model index comes from ``ir.model`` and is cached with the
+            instance metadata. Record counts are fetched concurrently, only
+            for the models returned.
             
             Args:
                 instance: Instance ID
+                q: Prefix or fuzzy search over model names and descriptions
+                limit: Maximum number of models to return
+                counts: Include the record count of each model
                 
             Returns:
-                Resource dictionary with list of models
+                Resource dictionary with matching models, best match first
             """
             uri = f"odoo://{instance}"
             
             async with self.connection_pool.get_connection(instance) as client:
-                # Get common models
-                models = [
-                    "res.partner",
-                    "res.users", 
-                    "res.company",
-                    "product.product",
-                    "product.template",
-                    "sale.order",
-                    "sale.order.line",
-                    "purchase.order",
-                    "purchase.order.line",
-                    "stock.move",
-                    "stock.picking",
-                    "account.move",
-                    "account.move.line"
-                ]
+                matches = search_models(await load_models(client), q)
+                models = matches[:max(1, limit)]
+                
+                if counts:
+                    record_counts = await count_records(
+                        client, [entry["model"] for entry in models]
+                    )
+                    models = [
+                        {**entry, "count": record_counts[entry["model"]]}
+                        for entry in models
+                    ]
                 
                 return {
                     "uri": uri,
                     "mimeType": "application/json",
                     "data": {
                         "instance": instance,
+                        "total": len(matches),
                         "models": models
                     }
-                }
\ No newline at end of file
+                }
+        
+        @self.mcp.resource("odoo://_metrics")
+        async def get_metrics() -> Dict[str, Any]:
+            """Get latency, payload and error metrics for tools and RPC calls.
+            
+            Returns:
+                Resource dictionary with per-tool and per-RPC (instance,
+                model, method) latency histograms, body sizes, serialization
+                time and error counts
+            """
+            return {
+                "uri": "odoo://_metrics",
+                "mimeType": "application/json",
+                "data": self.connection_pool.metrics.snapshot()
+            }
+        
+        @self.mcp.resource("odoo://_metrics/prometheus", mime_type="text/plain")
+        async def get_prometheus_metrics() -> str:
+            """Get the same metrics in the Prometheus text format.
+            
+            Returns:
+                Prometheus exposition text
+            """
+            return self.connection_pool.metrics.render_prometheus()
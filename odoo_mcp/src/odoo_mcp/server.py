@@ -48,6 +48,17 @@ async def lifespan(mcp: "FastMCP[Any]") -> AsyncIterator[dict[str, Any]]:
             password=odoo_password,
             timeout=int(os.getenv("ODOO_TIMEOUT", "30")),
             max_connections=int(os.getenv("ODOO_MAX_CONNECTIONS", "10")),
+            keep_alive=os.getenv("ODOO_KEEP_ALIVE", "true").lower() == "true",
+            keepalive_timeout=float(os.getenv("ODOO_KEEPALIVE_TIMEOUT", "15")),
+            max_connection_age=float(os.getenv("ODOO_MAX_CONNECTION_AGE", "300")),
+            auth_ttl=float(os.getenv("ODOO_AUTH_TTL", "3600")),
+            protocol=os.getenv("ODOO_PROTOCOL", "xmlrpc"),
+            metadata_cache_ttl=float(os.getenv("ODOO_METADATA_CACHE_TTL", "300")),
+            metadata_cache_size=int(os.getenv("ODOO_METADATA_CACHE_SIZE", "256")),
+            record_cache_size=int(os.getenv("ODOO_RECORD_CACHE_SIZE", "1024")),
+            min_concurrency=int(os.getenv("ODOO_MIN_CONCURRENCY", "1")),
+            max_retries=int(os.getenv("ODOO_MAX_RETRIES", "3")),
+            retry_deadline=float(os.getenv("ODOO_RETRY_DEADLINE", "60")),
         )
 
         # Add the default connection
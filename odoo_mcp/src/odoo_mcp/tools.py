@@ -2,16 +2,42 @@
 
 from typing import Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
-from .connection import ConnectionPoolManager
+from .aggregation import aggregate
+from .batch import run_batch
+from .bulk import DEFAULT_CHUNK_SIZE, create_many, write_many
+from .connection import IDEMPOTENT_METHODS, ConnectionPoolManager
 from .errors import ValidationError
+from .lookup import REFERENCE_MODELS, resolve
+from .metrics import MetricsMiddleware
+from .pagination import (
+    MAX_PAGE_SIZE,
+    MAX_RECORDS_PER_CALL,
+    decode_cursor,
+    encode_cursor,
+    iter_pages,
+    query_fingerprint,
+)
+from .projection import project_fields
 from .types import (
     validate_record_data,
     validate_search_domain,
 )
 
 
+async def _report_projection(
+    ctx: Context | None, model: str, excluded: list[str]
+) -> None:
+    """Tell the client which fields the lean default left out."""
+    if ctx is not None and excluded:
+        await ctx.info(
+            f"Skipped {len(excluded)} heavy {model} fields "
+            f"({', '.join(excluded[:10])}{', ...' if len(excluded) > 10 else ''}); "
+            "pass fields=['all'] to include them"
+        )
+
+
 class ToolRegistry:
     """Registry for MCP tools."""
 
@@ -24,8 +50,23 @@ class ToolRegistry:
         """
         self.mcp = mcp
         self.connection_pool = connection_pool
+        self.mcp.add_middleware(MetricsMiddleware(connection_pool.metrics))
         self._register_tools()
 
+    def _after_write(
+        self, instance_id: str, model: str, ids: list[int] | None = None
+    ) -> None:
+        """Drop cached data a write to ``model`` may have made stale.
+
+        Args:
+            instance_id: Odoo instance identifier
+            model: Model that was written to
+            ids: Records written (all cached records of the model when omitted)
+        """
+        self.connection_pool.invalidate_records(instance_id, model, ids)
+        if model in REFERENCE_MODELS:
+            self.connection_pool.invalidate_metadata(instance_id, model)
+
     def _register_tools(self) -> None:
         """Register all Odoo MCP tools."""
 
@@ -50,8 +91,44 @@ class ToolRegistry:
             if not validate_record_data(values):
                 raise ValidationError("Invalid record data", {"values": values})
 
-            async with self.connection_pool.get_connection(instance_id) as client:
-                return await client.execute_kw(model, "create", [values])
+            try:
+                async with self.connection_pool.get_connection(instance_id) as client:
+                    return await client.execute_kw(model, "create", [values])
+            finally:
+                # Creating a record can change computed fields of its
+                # siblings; a failed call may still have been applied
+                self._after_write(instance_id, model)
+
+        @self.mcp.tool()
+        async def odoo_create_many(
+            instance_id: str,
+            model: str,
+            records: list[dict[str, Any]],
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            max_concurrency: int | None = None,
+        ) -> dict[str, Any]:
+            """Create many records with chunked list-create calls.
+
+            A bad row does not fail the others: each record gets its own
+            outcome.
+
+            Args:
+                instance_id: Odoo instance identifier
+                model: Model name (e.g., 'res.partner')
+                records: Field values for each new record
+                chunk_size: Records per create call
+                max_concurrency: Optional cap on concurrent calls
+
+            Returns:
+                Per-record ``id`` or ``error`` in input order, with success
+                and failure counts
+            """
+            result = await create_many(
+                self.connection_pool, instance_id, model, records,
+                chunk_size, max_concurrency,
+            )
+            self._after_write(instance_id, model)
+            return result
 
         @self.mcp.tool()
         async def odoo_read(
@@ -59,22 +136,29 @@ class ToolRegistry:
             model: str,
             ids: list[int],
             fields: list[str] | None = None,
+            ctx: Context | None = None,
         ) -> list[dict[str, Any]]:
             """Read records from Odoo.
 
+            Without a field list, binary, html and non-stored computed fields
+            are left out; pass ``["all"]`` to read every field.
+
             Args:
                 instance_id: Odoo instance identifier
                 model: Model name
                 ids: List of record IDs to read
-                fields: Optional list of fields to return
+                fields: Optional list of fields to return, or ["all"]
 
             Returns:
                 List of record dictionaries
             """
             async with self.connection_pool.get_connection(instance_id) as client:
-                return await client.execute_kw(
+                fields, excluded = await project_fields(client, model, fields)
+                records = await client.execute_kw(
                     model, "read", [ids], {"fields": fields} if fields else {}
                 )
+            await _report_projection(ctx, model, excluded)
+            return records
 
         @self.mcp.tool()
         async def odoo_search(
@@ -124,14 +208,18 @@ class ToolRegistry:
             limit: int | None = None,
             offset: int | None = None,
             order: str | None = None,
+            ctx: Context | None = None,
         ) -> list[dict[str, Any]]:
             """Search and read records in one operation.
 
+            Without a field list, binary, html and non-stored computed fields
+            are left out; pass ``["all"]`` to read every field.
+
             Args:
                 instance_id: Odoo instance identifier
                 model: Model name
                 domain: Search domain
-                fields: Optional list of fields to return
+                fields: Optional list of fields to return, or ["all"]
                 limit: Maximum number of records
                 offset: Number of records to skip
                 order: Sort order
@@ -143,8 +231,6 @@ class ToolRegistry:
                 raise ValidationError("Invalid search domain", {"domain": domain})
 
             kwargs: dict[str, Any] = {}
-            if fields:
-                kwargs["fields"] = fields
             if limit is not None:
                 kwargs["limit"] = limit
             if offset is not None:
@@ -153,7 +239,85 @@ class ToolRegistry:
                 kwargs["order"] = order
 
             async with self.connection_pool.get_connection(instance_id) as client:
-                return await client.execute_kw(model, "search_read", [domain], kwargs)
+                fields, excluded = await project_fields(client, model, fields)
+                if fields:
+                    kwargs["fields"] = fields
+                records = await client.execute_kw(
+                    model, "search_read", [domain], kwargs
+                )
+            await _report_projection(ctx, model, excluded)
+            return records
+
+        @self.mcp.tool()
+        async def odoo_search_read_paged(
+            instance_id: str,
+            model: str,
+            domain: list[Any],
+            fields: list[str] | None = None,
+            page_size: int = 500,
+            cursor: str | None = None,
+            max_pages: int = 1,
+            ctx: Context | None = None,
+        ) -> dict[str, Any]:
+            """Search and read records page by page, ordered by id.
+
+            Pass the returned ``next_cursor`` back with the same model, domain
+            and fields to get the following page; it is null once all records
+            have been returned. Progress is reported after each page. Without
+            a field list, binary, html and non-stored computed fields are left
+            out; pass ``["all"]`` to read every field.
+
+            Args:
+                instance_id: Odoo instance identifier
+                model: Model name
+                domain: Search domain
+                fields: Optional list of fields to return, or ["all"]
+                page_size: Records per page
+                cursor: Continuation token from a previous call
+                max_pages: Number of pages to fetch in this call
+
+            Returns:
+                Records, their count, the next cursor and the fields left out
+            """
+            if not validate_search_domain(domain):
+                raise ValidationError("Invalid search domain", {"domain": domain})
+            if not 1 <= page_size <= MAX_PAGE_SIZE:
+                raise ValidationError(
+                    f"page_size must be between 1 and {MAX_PAGE_SIZE}",
+                    {"page_size": page_size},
+                )
+            if max_pages < 1 or page_size * max_pages > MAX_RECORDS_PER_CALL:
+                raise ValidationError(
+                    f"page_size * max_pages must be at most {MAX_RECORDS_PER_CALL}",
+                    {"page_size": page_size, "max_pages": max_pages},
+                )
+
+            fingerprint = query_fingerprint(model, domain, fields)
+            after_id = decode_cursor(cursor, fingerprint) if cursor else 0
+
+            records: list[dict[str, Any]] = []
+            next_cursor = None
+            pages = 0
+            async with self.connection_pool.get_connection(instance_id) as client:
+                read_fields, excluded = await project_fields(client, model, fields)
+                async for page in iter_pages(
+                    client, model, domain, read_fields, page_size, after_id
+                ):
+                    records.extend(page)
+                    pages += 1
+                    if ctx is not None:
+                        await ctx.report_progress(progress=len(records))
+                    if pages >= max_pages:
+                        if len(page) == page_size:
+                            next_cursor = encode_cursor(page[-1]["id"], fingerprint)
+                        break
+
+            return {
+                "records": records,
+                "count": len(records),
+                "next_cursor": next_cursor,
+                "excluded_fields": excluded,
+            }
 
         @self.mcp.tool()
         async def odoo_update(
@@ -173,8 +337,49 @@ class ToolRegistry:
             if not validate_record_data(values):
                 raise ValidationError("Invalid record data", {"values": values})
 
-            async with self.connection_pool.get_connection(instance_id) as client:
-                return await client.execute_kw(model, "write", [ids, values])
+            try:
+                async with self.connection_pool.get_connection(instance_id) as client:
+                    return await client.execute_kw(model, "write", [ids, values])
+            finally:
+                # write_date has one-second resolution, so drop the entries
+                # directly, also when a failed call may have been applied
+                self._after_write(instance_id, model, ids)
+
+        @self.mcp.tool()
+        async def odoo_write_many(
+            instance_id: str,
+            model: str,
+            updates: list[dict[str, Any]],
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            max_concurrency: int | None = None,
+        ) -> dict[str, Any]:
+            """Update many records, each with its own values.
+
+            Records receiving identical values are written together, so
+            ``[{"id": 1, "values": {"active": false}}, {"id": 2, "values":
+            {"active": false}}]`` costs one write call.
+
+            Args:
+                instance_id: Odoo instance identifier
+                model: Model name
+                updates: ``{"id", "values"}`` for each record; an id may
+                    appear only once
+                chunk_size: Maximum ids per write call
+                max_concurrency: Optional cap on concurrent calls
+
+            Returns:
+                Per-record outcomes in input order, with success and failure
+                counts
+            """
+            result = await write_many(
+                self.connection_pool, instance_id, model, updates,
+                chunk_size, max_concurrency,
+            )
+            ids = [outcome["id"] for outcome in result["results"]]
+            self._after_write(
+                instance_id, model, [i for i in ids if isinstance(i, int)]
+            )
+            return result
 
         @self.mcp.tool()
         async def odoo_delete(instance_id: str, model: str, ids: list[int]) -> bool:
@@ -188,8 +393,11 @@ class ToolRegistry:
             Returns:
                 True if successful
             """
-            async with self.connection_pool.get_connection(instance_id) as client:
-                return await client.execute_kw(model, "unlink", [ids])
+            try:
+                async with self.connection_pool.get_connection(instance_id) as client:
+                    return await client.execute_kw(model, "unlink", [ids])
+            finally:
+                self._after_write(instance_id, model, ids)
 
         @self.mcp.tool()
         async def odoo_execute(
@@ -211,8 +419,42 @@ class ToolRegistry:
             Returns:
                 Method result
             """
+            try:
+                async with self.connection_pool.get_connection(instance_id) as client:
+                    return await client.execute_kw(model, method, args, kwargs or {})
+            finally:
+                # Any non read-only method may have changed records, even
+                # when the call failed after reaching Odoo
+                if method not in IDEMPOTENT_METHODS:
+                    self._after_write(instance_id, model)
+
+        @self.mcp.tool()
+        async def odoo_resolve(
+            instance_id: str,
+            model: str,
+            name: str,
+            operator: str = "ilike",
+            limit: int = 10,
+        ) -> list[dict[str, Any]]:
+            """Resolve a record name to its id (e.g., a country or a UoM).
+
+            Countries, product categories, units of measure and sales teams
+            are answered from an in-memory index loaded on first use; other
+            models use Odoo's name_search.
+
+            Args:
+                instance_id: Odoo instance identifier
+                model: Model name (e.g., 'res.country')
+                name: Name to look up
+                operator: '=' (exact), '=ilike' (exact, any case) or
+                    'ilike' (contains)
+                limit: Maximum number of matches
+
+            Returns:
+                Matches as ``{"id", "name"}``, best match first
+            """
             async with self.connection_pool.get_connection(instance_id) as client:
-                return await client.execute_kw(model, method, args, kwargs or {})
+                return await resolve(client, model, name, operator, limit)
 
         @self.mcp.tool()
         async def odoo_fields_get(
@@ -254,3 +496,112 @@ class ToolRegistry:
 
             async with self.connection_pool.get_connection(instance_id) as client:
                 return await client.execute_kw(model, "search_count", [domain])
+
+        @self.mcp.tool()
+        async def odoo_aggregate(
+            instance_id: str,
+            model: str,
+            domain: list[Any],
+            groupby: list[str],
+            measures: list[str] | None = None,
+            order: str | None = None,
+            limit: int | None = None,
+        ) -> dict[str, Any]:
+            """Aggregate records in Odoo with read_group.
+
+            The database does the grouping, so only one row per group is
+            returned instead of every matching record.
+
+            Args:
+                instance_id: Odoo instance identifier
+                model: Model name (e.g., 'sale.order')
+                domain: Search domain
+                groupby: Fields to group by; dates accept a granularity
+                    (e.g., ['date_order:month', 'team_id'])
+                measures: Fields to aggregate as field or field:aggregate
+                    (sum, avg, min, max, count, count_distinct)
+                order: Optional group ordering (e.g., 'amount_total desc')
+                limit: Optional maximum number of groups
+
+            Returns:
+                Table with ``columns`` and ``rows``; relational group
+                values are ``{"id", "name"}``
+            """
+            if not validate_search_domain(domain):
+                raise ValidationError("Invalid search domain", {"domain": domain})
+            if not groupby:
+                raise ValidationError("At least one groupby is required")
+
+            async with self.connection_pool.get_connection(instance_id) as client:
+                return await aggregate(
+                    client, model, domain, groupby, measures or [], order, limit
+                )
+
+        @self.mcp.tool()
+        async def odoo_batch(
+            instance_id: str,
+            operations: list[dict[str, Any]],
+            max_concurrency: int | None = None,
+        ) -> list[dict[str, Any]]:
+            """Execute several Odoo calls in one request.
+
+            Each operation is ``{"id", "model", "method", "args", "kwargs"}``.
+            Arguments may reference an earlier operation's result with
+            ``{"$ref": "op_id"}`` or one field of it with
+            ``{"$ref": "op_id.field"}``. Independent operations run
+            concurrently.
+
+            Args:
+                instance_id: Odoo instance identifier
+                operations: Operations to execute
+                max_concurrency: Optional cap on concurrent calls
+
+            Returns:
+                Per-operation results or errors, in input order
+            """
+            outcomes = await run_batch(
+                self.connection_pool, instance_id, operations, max_concurrency
+            )
+            written = {
+                op["model"]
+                for op in operations
+                if op.get("method") not in IDEMPOTENT_METHODS
+            }
+            for model in written:
+                self._after_write(instance_id, model)
+            return outcomes
+
+        @self.mcp.tool()
+        async def odoo_pool_stats(instance_id: str) -> dict[str, Any]:
+            """Get connection pool diagnostics for an instance.
+
+            Args:
+                instance_id: Odoo instance identifier
+
+            Returns:
+                Socket counts, handshake counters, cache hit/miss counters and
+                the adaptive concurrency limit with its queue depth
+            """
+            return self.connection_pool.get_pool_stats(instance_id)
+
+        @self.mcp.tool()
+        async def odoo_cache_invalidate(
+            instance_id: str, model: str | None = None
+        ) -> dict[str, Any]:
+            """Drop cached model metadata and records (e.g., after installing a module).
+
+            Args:
+                instance_id: Odoo instance identifier
+                model: Only invalidate this model (all models when omitted)
+
+            Returns:
+                Number of metadata and record cache entries removed
+            """
+            removed = self.connection_pool.invalidate_metadata(instance_id, model)
+            records = self.connection_pool.invalidate_records(instance_id, model)
+            return {
+                "instance_id": instance_id,
+                "model": model,
+                "removed": removed,
+                "records_removed": records,
+            }
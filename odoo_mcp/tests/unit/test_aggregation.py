@@ -0,0 +1,89 @@
+"""Unit tests for read_group aggregation."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from odoo_mcp.aggregation import aggregate, parse_groupby, parse_measures
+from odoo_mcp.errors import ValidationError
+
+
+class TestSpecs:
+    """Test groupby and measure parsing."""
+
+    def test_parse_groupby(self) -> None:
+        """Test valid and invalid group-by specs."""
+        assert parse_groupby(["date_order:month", "team_id"]) == ["date_order:month", "team_id"]
+        with pytest.raises(ValidationError):
+            parse_groupby(["date_order:fortnight"])
+
+    def test_parse_measures_defaults_to_sum(self) -> None:
+        """Test that bare fields are summed."""
+        assert parse_measures(["amount_total", "amount_untaxed:avg"]) == [
+            ("amount_total", "sum"),
+            ("amount_untaxed", "avg"),
+        ]
+        with pytest.raises(ValidationError):
+            parse_measures(["amount_total:median"])
+
+
+class TestAggregate:
+    """Test the read_group call and table shaping."""
+
+    async def test_aggregate_builds_table(self) -> None:
+        """Test that groups become compact rows."""
+        client = MagicMock()
+        client.execute_kw = AsyncMock(return_value=[
+            {"date_order:month": "January 2025", "team_id": [1, "Online"], "amount_total": 1500.0, "__count": 3},
+            {"date_order:month": "January 2025", "team_id": False, "amount_total": 200.0, "__count": 1},
+        ])
+
+        table = await aggregate(
+            client,
+            "sale.order",
+            [["state", "in", ["sale", "done"]]],
+            ["date_order:month", "team_id"],
+            ["amount_total"],
+            order="amount_total desc",
+        )
+
+        client.execute_kw.assert_called_once_with(
+            "sale.order",
+            "read_group",
+            [[["state", "in", ["sale", "done"]]], ["amount_total:sum"], ["date_order:month", "team_id"]],
+            {"lazy": False, "orderby": "amount_total desc"},
+        )
+        assert table == {
+            "columns": ["date_order:month", "team_id", "amount_total:sum", "count"],
+            "rows": [
+                ["January 2025", {"id": 1, "name": "Online"}, 1500.0, 3],
+                ["January 2025", None, 200.0, 1],
+            ],
+        }
+
+    async def test_several_aggregates_of_one_field(self) -> None:
+        """Test that each aggregate of a field gets its own aliased column."""
+        client = MagicMock()
+        client.execute_kw = AsyncMock(return_value=[
+            {"state": "sale", "amount_total__sum": 900.0, "amount_total__max": 500.0, "partner_id": 2, "__count": 3},
+        ])
+
+        table = await aggregate(
+            client,
+            "sale.order",
+            [],
+            ["state"],
+            ["amount_total:sum", "amount_total:max", "partner_id:count_distinct"],
+        )
+
+        assert client.execute_kw.call_args[0][2][1] == [
+            "amount_total__sum:sum(amount_total)",
+            "amount_total__max:max(amount_total)",
+            "partner_id:count_distinct",
+        ]
+        assert table["rows"] == [["sale", 900.0, 500.0, 2, 3]]
+
+    async def test_duplicate_measure_is_rejected(self) -> None:
+        """Test that the same aggregate cannot be requested twice."""
+        with pytest.raises(ValidationError):
+            await aggregate(MagicMock(), "sale.order", [], ["state"], ["amount_total", "amount_total:sum"])
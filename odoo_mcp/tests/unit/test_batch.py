@@ -0,0 +1,118 @@
+"""Unit tests for batched execution."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from odoo_mcp.batch import find_references, resolve_references, run_batch
+from odoo_mcp.connection import OdooConnectionConfig
+from odoo_mcp.errors import NotFoundError, ValidationError
+
+
+def make_pool(execute_kw: Any, max_connections: int = 10) -> MagicMock:
+    """Create a pool mock whose clients delegate to execute_kw."""
+    client = MagicMock()
+    client.execute_kw = execute_kw
+    client.last_retries = 0
+
+    @asynccontextmanager
+    async def get_connection(instance_id: str) -> AsyncIterator[MagicMock]:
+        yield client
+
+    pool = MagicMock()
+    pool.get_connection = get_connection
+    pool.get_config.return_value = OdooConnectionConfig(
+        url="https://odoo.example.com",
+        database="testdb",
+        username="admin",
+        password="secret",
+        max_connections=max_connections,
+    )
+    return pool
+
+
+class TestReferences:
+    """Test reference discovery and substitution."""
+
+    def test_find_references(self) -> None:
+        """Test that nested references are found."""
+        args = [{"$ref": "partners"}, {"fields": [{"$ref": "names.name"}]}]
+        assert find_references(args) == {"partners", "names"}
+
+    def test_resolve_whole_result(self) -> None:
+        """Test substituting a whole result."""
+        assert resolve_references([{"$ref": "a"}], {"a": [1, 2]}) == [[1, 2]]
+
+    def test_resolve_field_reduces_many2one(self) -> None:
+        """Test that many2one values resolve to their id."""
+        results = {"orders": [{"partner_id": [7, "Acme"]}, {"partner_id": [9, "Foo"]}]}
+        assert resolve_references({"$ref": "orders.partner_id"}, results) == [7, 9]
+
+
+class TestRunBatch:
+    """Test batch scheduling."""
+
+    async def test_independent_operations_run_concurrently(self) -> None:
+        """Test that independent operations overlap."""
+        in_flight = 0
+        peak = 0
+
+        async def execute_kw(model: str, method: str, args: list[Any], kwargs: Any) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 1
+
+        pool = make_pool(execute_kw)
+        operations = [
+            {"model": "res.partner", "method": "search_count", "args": [[]]}
+            for _ in range(5)
+        ]
+
+        results = await run_batch(pool, "default", operations, max_concurrency=3)
+
+        assert [r["result"] for r in results] == [1] * 5
+        assert peak == 3
+
+    async def test_references_feed_later_operations(self) -> None:
+        """Test that a dependent operation receives the earlier result."""
+        execute_kw = AsyncMock(side_effect=[[1, 2], [{"id": 1}, {"id": 2}]])
+        pool = make_pool(execute_kw)
+
+        results = await run_batch(pool, "default", [
+            {"id": "ids", "model": "res.partner", "method": "search", "args": [[]]},
+            {"id": "rows", "model": "res.partner", "method": "read",
+             "args": [{"$ref": "ids"}], "kwargs": {"fields": ["name"]}},
+        ])
+
+        assert results[1] == {"id": "rows", "result": [{"id": 1}, {"id": 2}]}
+        execute_kw.assert_called_with("res.partner", "read", [[1, 2]], {"fields": ["name"]})
+
+    async def test_failures_are_reported_per_operation(self) -> None:
+        """Test that a failing operation does not fail the batch."""
+        execute_kw = AsyncMock(side_effect=NotFoundError("Record not found"))
+        pool = make_pool(execute_kw)
+
+        results = await run_batch(pool, "default", [
+            {"id": "a", "model": "res.partner", "method": "read", "args": [[99]]},
+            {"id": "b", "model": "res.partner", "method": "read", "args": [{"$ref": "a"}]},
+        ])
+
+        assert results[0]["code"] == "E005"
+        assert results[1]["error"] == "Dependency failed"
+        execute_kw.assert_called_once()
+
+    async def test_forward_references_are_rejected(self) -> None:
+        """Test that references must point to earlier operations."""
+        pool = make_pool(AsyncMock())
+
+        with pytest.raises(ValidationError):
+            await run_batch(pool, "default", [
+                {"id": "a", "model": "res.partner", "method": "read", "args": [{"$ref": "b"}]},
+                {"id": "b", "model": "res.partner", "method": "search", "args": [[]]},
+            ])
@@ -0,0 +1,169 @@
+"""Unit tests for bulk create and write."""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from odoo_mcp.bulk import chunked, create_many, group_writes, write_many
+from odoo_mcp.connection import OdooConnectionConfig
+from odoo_mcp.errors import ConnectionError, ValidationError
+
+
+def make_pool(execute_kw: Any) -> MagicMock:
+    """Create a pool mock whose clients delegate to execute_kw."""
+    client = MagicMock()
+    client.execute_kw = execute_kw
+
+    @asynccontextmanager
+    async def get_connection(instance_id: str) -> AsyncIterator[MagicMock]:
+        yield client
+
+    pool = MagicMock()
+    pool.get_connection = get_connection
+    pool.get_config.return_value = OdooConnectionConfig(
+        url="https://odoo.example.com",
+        database="testdb",
+        username="admin",
+        password="secret",
+    )
+    return pool
+
+
+class TestHelpers:
+    """Test chunking and grouping."""
+
+    def test_chunked(self) -> None:
+        """Test splitting into fixed-size chunks."""
+        assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+    def test_group_writes(self) -> None:
+        """Test that identical values share a group."""
+        updates = [
+            {"index": 0, "id": 1, "values": {"active": False}},
+            {"index": 1, "id": 2, "values": {"name": "B"}},
+            {"index": 2, "id": 3, "values": {"active": False}},
+        ]
+        assert group_writes(updates) == [
+            ({"active": False}, [0, 2]),
+            ({"name": "B"}, [1]),
+        ]
+
+
+class TestCreateMany:
+    """Test chunked list-create."""
+
+    async def test_chunks_use_list_create(self) -> None:
+        """Test that records are sent in chunks and ids mapped back."""
+        calls: List[Any] = []
+        next_id = 100
+
+        async def execute_kw(model: str, method: str, args: List[Any]) -> Any:
+            nonlocal next_id
+            calls.append(args[0])
+            ids = list(range(next_id, next_id + len(args[0])))
+            next_id += len(args[0])
+            return ids
+
+        records = [{"name": f"Partner {i}"} for i in range(5)]
+        result = await create_many(make_pool(execute_kw), "default", "res.partner", records, chunk_size=2)
+
+        assert [len(chunk) for chunk in calls] == [2, 2, 1]
+        assert result["succeeded"] == 5
+        assert sorted(outcome["id"] for outcome in result["results"]) == list(range(100, 105))
+
+    async def test_bad_row_is_isolated(self) -> None:
+        """Test that a rejected chunk falls back to per-record creates."""
+        async def execute_kw(model: str, method: str, args: List[Any]) -> Any:
+            values = args[0]
+            if isinstance(values, list):
+                raise ValidationError("Missing required field")
+            if not values.get("name"):
+                raise ValidationError("Missing required field")
+            return 7
+
+        records = [{"name": "A"}, {"email": "x@example.com"}, "not a dict"]
+        result = await create_many(make_pool(execute_kw), "default", "res.partner", records)
+
+        assert result["results"][0] == {"index": 0, "id": 7}
+        assert result["results"][1]["error"] == "Missing required field"
+        assert result["results"][2]["error"] == "Invalid record data"
+        assert (result["succeeded"], result["failed"]) == (1, 2)
+
+    async def test_connection_failure_is_not_resent(self) -> None:
+        """Test that a chunk with an unknown outcome is not created again."""
+        calls = 0
+
+        async def execute_kw(model: str, method: str, args: List[Any]) -> Any:
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("Request timeout")
+
+        result = await create_many(make_pool(execute_kw), "default", "res.partner", [{"name": "A"}, {"name": "B"}])
+
+        assert calls == 1
+        assert result["failed"] == 2
+
+    async def test_chunk_size_is_bounded(self) -> None:
+        """Test that an invalid chunk size is rejected."""
+        with pytest.raises(ValidationError):
+            await create_many(make_pool(None), "default", "res.partner", [], chunk_size=0)
+
+
+class TestWriteMany:
+    """Test grouped writes."""
+
+    async def test_identical_values_share_a_write(self) -> None:
+        """Test that updates are grouped into minimal write calls."""
+        calls: List[Any] = []
+
+        async def execute_kw(model: str, method: str, args: List[Any]) -> bool:
+            calls.append(args)
+            return True
+
+        updates = [
+            {"id": 1, "values": {"active": False}},
+            {"id": 2, "values": {"active": False}},
+            {"id": 3, "values": {"name": "C"}},
+        ]
+        result = await write_many(make_pool(execute_kw), "default", "res.partner", updates)
+
+        assert sorted(calls, key=str) == sorted([[[1, 2], {"active": False}], [[3], {"name": "C"}]], key=str)
+        assert result["succeeded"] == 3
+
+    async def test_duplicate_ids_are_rejected(self) -> None:
+        """Test that a repeated id is not written twice concurrently."""
+        calls: List[Any] = []
+
+        async def execute_kw(model: str, method: str, args: List[Any]) -> bool:
+            calls.append(args)
+            return True
+
+        updates = [
+            {"id": 1, "values": {"name": "A"}},
+            {"id": 2, "values": {"name": "B"}},
+            {"id": 1, "values": {"name": "Z"}},
+        ]
+        result = await write_many(make_pool(execute_kw), "default", "res.partner", updates)
+
+        assert sorted(calls, key=str) == [[[1], {"name": "A"}], [[2], {"name": "B"}]]
+        assert result["succeeded"] == 2
+        assert result["results"][2]["error"] == "Duplicate id; merge the values into one update"
+
+    async def test_rejected_group_is_split(self) -> None:
+        """Test that a failing group is retried per record."""
+        async def execute_kw(model: str, method: str, args: List[Any]) -> bool:
+            if 2 in args[0]:
+                raise ValidationError("Record is locked")
+            return True
+
+        updates = [{"id": i, "values": {"active": False}} for i in (1, 2, 3)] + [{"values": {}}]
+        result = await write_many(make_pool(execute_kw), "default", "res.partner", updates)
+
+        assert [outcome.get("error") for outcome in result["results"]] == [
+            None,
+            "Record is locked",
+            None,
+            "Each update needs an integer id and values",
+        ]
@@ -0,0 +1,144 @@
+"""Unit tests for in-memory caches."""
+
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+from odoo_mcp.cache import MISSING, RecordCache, TTLCache, call_key, is_metadata_call
+
+
+class TestCallKey:
+    """Test call normalization."""
+
+    def test_key_ignores_kwargs_order(self) -> None:
+        """Test that kwargs ordering does not change the key."""
+        first = call_key("res.partner", "search_read", [[]], {"fields": ["name"], "limit": 5})
+        second = call_key("res.partner", "search_read", [[]], {"limit": 5, "fields": ["name"]})
+        assert first == second
+
+    def test_is_metadata_call(self) -> None:
+        """Test metadata call detection."""
+        assert is_metadata_call("product.product", "fields_get")
+        assert is_metadata_call("sale.order", "check_access_rights")
+        assert is_metadata_call("ir.model", "search_read")
+        assert not is_metadata_call("res.partner", "search_read")
+        assert not is_metadata_call("ir.model", "write")
+
+
+class TestTTLCache:
+    """Test the LRU/TTL cache."""
+
+    def test_hit_and_miss_counters(self) -> None:
+        """Test that lookups are counted."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        assert cache.get("a", MISSING) is MISSING
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats() == {"size": 1, "maxsize": 2, "hits": 1, "misses": 1}
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_entries_expire(self) -> None:
+        """Test that entries expire after their TTL."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        with patch("odoo_mcp.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("odoo_mcp.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalidate_with_predicate(self) -> None:
+        """Test selective invalidation."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(("res.partner", "fields_get", "[]"), {})
+        cache.set(("sale.order", "fields_get", "[]"), {})
+
+        assert cache.invalidate(lambda key: key[0] == "res.partner") == 1
+        assert len(cache) == 1
+        assert cache.invalidate() == 1
+
+
+class FakeRecords:
+    """In-memory stand-in for a model's ``read``."""
+
+    def __init__(self) -> None:
+        self.rows = {1: {"id": 1, "name": "Desk", "image_1920": "...", "write_date": "2024-01-01 10:00:00"}}
+        self.calls: List[Optional[List[str]]] = []
+
+    async def read(self, fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+        self.calls.append(fields)
+        row = self.rows.get(1)
+        if row is None:
+            return []
+        return [{k: v for k, v in row.items() if not fields or k in fields or k == "id"}]
+
+
+class TestRecordCache:
+    """Test the write_date-validated record cache."""
+
+    async def test_unchanged_record_only_reads_write_date(self) -> None:
+        """Test that a hit re-reads write_date but not the whole record."""
+        cache = RecordCache(maxsize=10)
+        source = FakeRecords()
+
+        first = await cache.get("product.product", 1, None, source.read)
+        second = await cache.get("product.product", 1, None, source.read)
+
+        assert first == second
+        assert source.calls == [None, ["write_date"]]
+        assert cache.stats()["hits"] == 1
+
+    async def test_changed_record_is_refreshed(self) -> None:
+        """Test that a newer write_date triggers a full read."""
+        cache = RecordCache(maxsize=10)
+        source = FakeRecords()
+
+        await cache.get("product.product", 1, None, source.read)
+        source.rows[1] = {**source.rows[1], "name": "Chair", "write_date": "2024-01-02 10:00:00"}
+        record = await cache.get("product.product", 1, None, source.read)
+
+        assert record is not None and record["name"] == "Chair"
+        assert cache.stats()["stale"] == 1
+
+    async def test_deleted_record_returns_none(self) -> None:
+        """Test that a record removed in Odoo is dropped from the cache."""
+        cache = RecordCache(maxsize=10)
+        source = FakeRecords()
+
+        await cache.get("product.product", 1, None, source.read)
+        del source.rows[1]
+
+        assert await cache.get("product.product", 1, None, source.read) is None
+        assert len(cache) == 0
+
+    async def test_field_sets_are_cached_separately(self) -> None:
+        """Test that the key includes the requested fields."""
+        cache = RecordCache(maxsize=10)
+        source = FakeRecords()
+
+        record = await cache.get("product.product", 1, ["name"], source.read)
+
+        assert source.calls == [["name", "write_date"]]
+        assert "image_1920" not in record
+        await cache.get("product.product", 1, None, source.read)
+        assert len(cache) == 2
+
+    async def test_invalidate_by_model_and_ids(self) -> None:
+        """Test targeted invalidation."""
+        cache = RecordCache(maxsize=10)
+        source = FakeRecords()
+        await cache.get("product.product", 1, None, source.read)
+        await cache.get("product.product", 1, ["name"], source.read)
+
+        assert cache.invalidate("res.partner") == 0
+        assert cache.invalidate("product.product", [2]) == 0
+        assert cache.invalidate("product.product", [1]) == 2
@@ -0,0 +1,62 @@
+"""Unit tests for the model catalog."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from odoo_mcp.catalog import count_records, load_models, search_models
+from odoo_mcp.errors import PermissionError
+
+MODELS = [
+    {"model": "product.product", "name": "Product Variant"},
+    {"model": "product.template", "name": "Product"},
+    {"model": "res.partner", "name": "Contact"},
+    {"model": "sale.order", "name": "Sales Order"},
+    {"model": "sale.order.line", "name": "Sales Order Line"},
+]
+
+
+class TestSearchModels:
+    """Test model ranking."""
+
+    def test_exact_then_prefix(self) -> None:
+        """Test that the exact technical name ranks first."""
+        result = search_models(MODELS, "sale.order")
+        assert [m["model"] for m in result] == ["sale.order", "sale.order.line"]
+
+    def test_description_and_spaces(self) -> None:
+        """Test matching descriptions and space-separated names."""
+        assert search_models(MODELS, "contact")[0]["model"] == "res.partner"
+        assert search_models(MODELS, "sale order")[0]["model"] == "sale.order"
+
+    def test_fuzzy_match(self) -> None:
+        """Test that a misspelling still finds the model."""
+        assert search_models(MODELS, "res.partnr")[0]["model"] == "res.partner"
+        assert search_models(MODELS, "zzzz") == []
+
+    def test_empty_query_returns_all(self) -> None:
+        """Test that no query lists everything."""
+        assert search_models(MODELS, None) == MODELS
+
+
+class TestLoading:
+    """Test the RPC helpers."""
+
+    async def test_load_models_reads_ir_model(self) -> None:
+        """Test that the index comes from one ir.model read."""
+        client = MagicMock()
+        client.execute_kw = AsyncMock(return_value=[{"id": 1, "model": "res.partner", "name": "Contact"}])
+
+        assert await load_models(client) == [{"model": "res.partner", "name": "Contact"}]
+        assert client.execute_kw.call_args.args[:2] == ("ir.model", "search_read")
+
+    async def test_count_records_tolerates_errors(self) -> None:
+        """Test that models that cannot be counted get None."""
+        async def search_count(model: str, method: str, args: list) -> int:
+            if model == "mail.thread":
+                raise PermissionError("Access denied")
+            return 42
+
+        client = MagicMock()
+        client.execute_kw = search_count
+
+        counts = await count_records(client, ["res.partner", "mail.thread"])
+        assert counts == {"res.partner": 42, "mail.thread": None}
@@ -5,13 +5,20 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 import aiohttp
 
+from odoo_mcp.cache import TTLCache
 from odoo_mcp.connection import (
     OdooConnectionConfig,
     ConnectionPoolManager,
     OdooAsyncClient,
+    AuthCache,
+    PersistentConnector,
+    PoolStats,
+    SingleFlight,
     ConnectionError,
     AuthenticationError,
 )
+from odoo_mcp.errors import RateLimitError
+from odoo_mcp.limiter import AdaptiveLimiter
 
 
 class TestOdooConnectionConfig:
@@ -32,6 +39,7 @@ class TestOdooConnectionConfig:
         assert config.password == "secret"
         assert config.timeout == 30  # default
         assert config.max_connections == 10  # default
+        assert config.keep_alive is True  # default
 
     def test_config_with_custom_values(self) -> None:
         """Test creating config with custom values."""
@@ -160,6 +168,235 @@ class TestConnectionPoolManager:
         for session in pool_manager._sessions.values():
             session.close.assert_called_once()
 
+    async def test_add_connection_uses_keep_alive(self, pool_manager: ConnectionPoolManager) -> None:
+        """Test that connections are pooled with keep-alive by default."""
+        config = OdooConnectionConfig(
+            url="https://odoo.example.com",
+            database="testdb",
+            username="admin",
+            password="secret",
+            max_connection_age=120.0,
+        )
+        
+        await pool_manager.add_connection("test_instance", config)
+        connector = pool_manager._connectors["test_instance"]
+        
+        assert isinstance(connector, PersistentConnector)
+        assert connector.force_close is False
+        assert connector.max_age == 120.0
+        
+        await pool_manager.cleanup()
+
+    async def test_add_connection_without_keep_alive(self, pool_manager: ConnectionPoolManager) -> None:
+        """Test that keep-alive can be disabled per connection."""
+        config = OdooConnectionConfig(
+            url="https://odoo.example.com",
+            database="testdb",
+            username="admin",
+            password="secret",
+            keep_alive=False,
+        )
+        
+        await pool_manager.add_connection("test_instance", config)
+        assert pool_manager._connectors["test_instance"].force_close is True
+        
+        await pool_manager.cleanup()
+
+    async def test_clients_share_authentication(self, pool_manager: ConnectionPoolManager) -> None:
+        """Test that clients of one instance share the cached uid."""
+        config = OdooConnectionConfig(
+            url="https://odoo.example.com",
+            database="testdb",
+            username="admin",
+            password="secret",
+        )
+        await pool_manager.add_connection("test_instance", config)
+        
+        with patch.object(OdooAsyncClient, "_login", AsyncMock(return_value=2)) as login:
+            for _ in range(3):
+                async with pool_manager.get_connection("test_instance") as client:
+                    assert await client.authenticate() == 2
+        
+        login.assert_called_once()
+        assert pool_manager.get_pool_stats("test_instance")["logins"] == 1
+        
+        await pool_manager.cleanup()
+
+    async def test_get_pool_stats(self, pool_manager: ConnectionPoolManager) -> None:
+        """Test pool statistics for a fresh connection."""
+        config = OdooConnectionConfig(
+            url="https://odoo.example.com",
+            database="testdb",
+            username="admin",
+            password="secret",
+        )
+        
+        await pool_manager.add_connection("test_instance", config)
+        stats = pool_manager.get_pool_stats("test_instance")
+        
+        assert stats == {
+            "instance_id": "test_instance",
+            "open": 0,
+            "idle": 0,
+            "in_use": 0,
+            "handshakes": 0,
+            "handshakes_avoided": 0,
+            "recycled": 0,
+            "stale_retries": 0,
+            "retries": 0,
+            "logins": 0,
+            "metadata_cache": {"size": 0, "maxsize": 256, "hits": 0, "misses": 0},
+            "limiter": {
+                "limit": 10,
+                "max_limit": 10,
+                "in_flight": 0,
+                "queue_depth": 0,
+                "admitted": 0,
+                "throttled": 0,
+                "avg_wait_ms": 0.0,
+                "max_wait_ms": 0.0,
+            },
+            "single_flight": {"calls": 0, "coalesced": 0, "in_flight": 0},
+            "record_cache": {"size": 0, "maxsize": 1024, "hits": 0, "misses": 0, "stale": 0},
+        }
+        with pytest.raises(ValueError):
+            pool_manager.get_pool_stats("nonexistent")
+        
+        await pool_manager.cleanup()
+
+
+class TestSingleFlight:
+    """Test coalescing of identical concurrent calls."""
+
+    async def test_identical_calls_share_one_request(self) -> None:
+        """Test that concurrent callers with the same key share a result."""
+        flight = SingleFlight()
+        calls = 0
+        
+        async def call() -> list[int]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [1, 2]
+        
+        results = await asyncio.gather(*(flight.do("key", call) for _ in range(4)))
+        
+        assert results == [[1, 2]] * 4
+        assert calls == 1
+        assert flight.stats() == {"calls": 1, "coalesced": 3, "in_flight": 0}
+
+    async def test_errors_are_shared_and_not_kept(self) -> None:
+        """Test that a failure reaches every waiter and the next call runs again."""
+        flight = SingleFlight()
+        call = AsyncMock(side_effect=[ConnectionError("Connection failed"), 5])
+        
+        results = await asyncio.gather(
+            flight.do("key", call), flight.do("key", call), return_exceptions=True
+        )
+        
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert await flight.do("key", call) == 5
+        assert call.call_count == 2
+
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        """Test that the shared request survives one waiter being cancelled."""
+        flight = SingleFlight()
+        
+        async def call() -> int:
+            await asyncio.sleep(0.01)
+            return 3
+        
+        first = asyncio.ensure_future(flight.do("key", call))
+        second = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        
+        assert await second == 3
+
+
+class TestAuthCache:
+    """Test the shared authentication cache."""
+
+    async def test_concurrent_callers_share_one_login(self) -> None:
+        """Test that concurrent first callers wait on a single login."""
+        cache = AuthCache(ttl=60)
+        calls = 0
+        
+        async def login() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 2
+        
+        uids = await asyncio.gather(*(cache.get_uid(login) for _ in range(5)))
+        
+        assert uids == [2] * 5
+        assert calls == 1
+        assert cache.logins == 1
+
+    async def test_expired_session_logs_in_again(self) -> None:
+        """Test that the uid is refreshed after the TTL."""
+        cache = AuthCache(ttl=0)
+        login = AsyncMock(return_value=2)
+        
+        await cache.get_uid(login)
+        await cache.get_uid(login)
+        
+        assert login.call_count == 2
+
+    async def test_failed_login_is_not_cached(self) -> None:
+        """Test that a failed login lets the next caller retry."""
+        cache = AuthCache(ttl=60)
+        login = AsyncMock(side_effect=[AuthenticationError("Invalid credentials"), 2])
+        
+        with pytest.raises(AuthenticationError):
+            await cache.get_uid(login)
+        assert await cache.get_uid(login) == 2
+
+    async def test_invalidate(self) -> None:
+        """Test that invalidation forces a new login."""
+        cache = AuthCache(ttl=60)
+        login = AsyncMock(return_value=2)
+        
+        await cache.get_uid(login)
+        cache.invalidate()
+        await cache.get_uid(login)
+        
+        assert login.call_count == 2
+
+
+class TestPersistentConnector:
+    """Test socket lifetime handling."""
+
+    async def test_release_recycles_old_sockets(self) -> None:
+        """Test that sockets older than the max age are closed on release."""
+        stats = PoolStats()
+        connector = PersistentConnector(max_age=10.0, stats=stats)
+        protocol = MagicMock()
+        connector._created_at[protocol] = 0.0
+        
+        with patch("aiohttp.TCPConnector._release") as base_release:
+            connector._release("key", protocol)
+        
+        base_release.assert_called_once_with("key", protocol, should_close=True)
+        assert stats.recycled == 1
+        await connector.close()
+
+    async def test_release_keeps_young_sockets(self) -> None:
+        """Test that young sockets are returned to the pool."""
+        stats = PoolStats()
+        connector = PersistentConnector(max_age=10.0, stats=stats)
+        protocol = MagicMock()
+        
+        with patch("aiohttp.TCPConnector._release") as base_release, \
+                patch("odoo_mcp.connection.time.monotonic", return_value=5.0):
+            connector._created_at[protocol] = 0.0
+            connector._release("key", protocol)
+        
+        base_release.assert_called_once_with("key", protocol, should_close=False)
+        assert stats.recycled == 0
+        await connector.close()
+
 
 class TestOdooAsyncClient:
     """Test async Odoo client."""
@@ -263,3 +500,217 @@ class TestOdooAsyncClient:
         
         with pytest.raises(ConnectionError, match="Connection timeout"):
             await client.authenticate()
+
+    async def test_stale_socket_is_retried_once(self, mock_session: AsyncMock, test_config: OdooConnectionConfig) -> None:
+        """Test that a request on a reset keep-alive socket is retried."""
+        stats = PoolStats()
+        client = OdooAsyncClient(session=mock_session, config=test_config, stats=stats)
+        client._uid = 2
+        
+        exec_response = AsyncMock()
+        exec_response.read.return_value = b'<?xml version="1.0"?><methodResponse><params><param><value><int>7</int></value></param></params></methodResponse>'
+        mock_session.post.return_value.__aenter__.side_effect = [
+            aiohttp.ServerDisconnectedError(),
+            exec_response,
+        ]
+        
+        result = await client.execute_kw("res.partner", "search_count", [[]])
+        
+        assert result == 7
+        assert mock_session.post.call_count == 2
+        assert stats.stale_retries == 1
+
+    async def test_stale_socket_retry_gives_up(self, mock_session: AsyncMock, test_config: OdooConnectionConfig) -> None:
+        """Test that a second reset surfaces as ConnectionError."""
+        test_config.max_retries = 0
+        client = OdooAsyncClient(session=mock_session, config=test_config)
+        client._uid = 2
+        mock_session.post.return_value.__aenter__.side_effect = aiohttp.ServerDisconnectedError()
+        
+        with pytest.raises(ConnectionError):
+            await client.execute_kw("res.partner", "search_count", [[]])
+        assert mock_session.post.call_count == 2
+
+    async def test_stale_socket_does_not_resend_writes(self, client: OdooAsyncClient, mock_session: AsyncMock) -> None:
+        """Test that a create is not sent again after the socket drops."""
+        client._uid = 2
+        mock_session.post.return_value.__aenter__.side_effect = aiohttp.ServerDisconnectedError()
+        
+        with pytest.raises(ConnectionError):
+            await client.execute_kw("res.partner", "create", [{"name": "Test"}])
+        assert mock_session.post.call_count == 1
+
+    async def test_access_denied_reauthenticates_once(self, mock_session: AsyncMock, test_config: OdooConnectionConfig) -> None:
+        """Test that an Access Denied fault invalidates the session and retries."""
+        cache = AuthCache(ttl=60)
+        client = OdooAsyncClient(session=mock_session, config=test_config, auth_cache=cache)
+        client._uid = 2
+        
+        denied_response = AsyncMock()
+        denied_response.read.return_value = b'<?xml version="1.0"?><methodResponse><fault><value><struct><member><name>faultString</name><value><string>Access Denied</string></value></member><member><name>faultCode</name><value><int>3</int></value></member></struct></value></fault></methodResponse>'
+        auth_response = AsyncMock()
+        auth_response.read.return_value = b'<?xml version="1.0"?><methodResponse><params><param><value><int>2</int></value></param></params></methodResponse>'
+        exec_response = AsyncMock()
+        exec_response.read.return_value = b'<?xml version="1.0"?><methodResponse><params><param><value><int>7</int></value></param></params></methodResponse>'
+        mock_session.post.return_value.__aenter__.side_effect = [
+            denied_response,
+            auth_response,
+            exec_response,
+        ]
+        
+        result = await client.execute_kw("res.partner", "search_count", [[]])
+        
+        assert result == 7
+        assert mock_session.post.call_count == 3
+        assert cache.logins == 1
+
+    async def test_server_version_is_cached(self, mock_session: AsyncMock, test_config: OdooConnectionConfig) -> None:
+        """Test that the server version is cached with the session."""
+        cache = AuthCache(ttl=60)
+        client = OdooAsyncClient(session=mock_session, config=test_config, auth_cache=cache)
+        
+        version_response = AsyncMock()
+        version_response.read.return_value = b'<?xml version="1.0"?><methodResponse><params><param><value><struct><member><name>server_version</name><value><string>17.0</string></value></member></struct></value></param></params></methodResponse>'
+        mock_session.post.return_value.__aenter__.return_value = version_response
+        
+        assert await client.server_version() == "17.0"
+        assert await client.server_version() == "17.0"
+        mock_session.post.assert_called_once()
+
+    async def test_fields_get_is_served_from_metadata_cache(self, mock_session: AsyncMock, test_config: OdooConnectionConfig) -> None:
+        """Test that repeated fields_get calls hit the metadata cache."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        client = OdooAsyncClient(session=mock_session, config=test_config, metadata_cache=cache)
+        client._uid = 2
+        
+        exec_response = AsyncMock()
+        exec_response.read.return_value = b'<?xml version="1.0"?><methodResponse><params><param><value><struct><member><name>name</name><value><struct><member><name>type</name><value><string>char</string></value></member></struct></value></member></struct></value></param></params></methodResponse>'
+        mock_session.post.return_value.__aenter__.return_value = exec_response
+        
+        first = await client.execute_kw("res.partner", "fields_get", [], {"attributes": ["type"]})
+        second = await client.execute_kw("res.partner", "fields_get", [], {"attributes": ["type"]})
+        
+        assert first == second == {"name": {"type": "char"}}
+        mock_session.post.assert_called_once()
+        assert cache.stats()["hits"] == 1
+
+    async def test_data_calls_bypass_metadata_cache(self, mock_session: AsyncMock, test_config: OdooConnectionConfig) -> None:
+        """Test that ordinary reads are never cached."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        client = OdooAsyncClient(session=mock_session, config=test_config, metadata_cache=cache)
+        client._uid = 2
+        
+        exec_response = AsyncMock()
+        exec_response.read.return_value = b'<?xml version="1.0"?><methodResponse><params><param><value><int>7</int></value></param></params></methodResponse>'
+        mock_session.post.return_value.__aenter__.return_value = exec_response
+        
+        await client.execute_kw("res.partner", "search_count", [[]])
+        await client.execute_kw("res.partner", "search_count", [[]])
+        
+        assert mock_session.post.call_count == 2
+        assert len(cache) == 0
+
+    async def test_rate_limit_response_backs_off(self, mock_session: AsyncMock, test_config: OdooConnectionConfig) -> None:
+        """Test that HTTP 429 raises RateLimitError and lowers the limit."""
+        limiter = AdaptiveLimiter(max_limit=8)
+        client = OdooAsyncClient(session=mock_session, config=test_config, limiter=limiter)
+        client._uid = 2
+        
+        throttled_response = AsyncMock()
+        throttled_response.status = 429
+        throttled_response.headers = {"Retry-After": "2"}
+        mock_session.post.return_value.__aenter__.return_value = throttled_response
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            await client.execute_kw("res.partner", "create", [{"name": "Test"}])
+        
+        assert exc_info.value.details["retry_after"] == "2"
+        assert limiter.stats()["limit"] == 4
+
+    async def test_idempotent_calls_are_retried(self, mock_session: AsyncMock, test_config: OdooConnectionConfig) -> None:
+        """Test that reads are retried after a transient connection error."""
+        stats = PoolStats()
+        client = OdooAsyncClient(session=mock_session, config=test_config, stats=stats)
+        client._uid = 2
+        
+        exec_response = AsyncMock()
+        exec_response.read.return_value = b'<?xml version="1.0"?><methodResponse><params><param><value><int>7</int></value></param></params></methodResponse>'
+        mock_session.post.return_value.__aenter__.side_effect = [
+            asyncio.TimeoutError(),
+            exec_response,
+        ]
+        
+        with patch("odoo_mcp.errors.asyncio.sleep", AsyncMock()) as sleep:
+            result = await client.execute_kw("res.partner", "search_count", [[]])
+        
+        assert result == 7
+        assert client.last_retries == 1
+        assert stats.retries == 1
+        sleep.assert_called_once()
+
+    async def test_non_idempotent_calls_are_not_retried(self, client: OdooAsyncClient, mock_session: AsyncMock) -> None:
+        """Test that a create is not sent twice after a timeout."""
+        client._uid = 2
+        mock_session.post.return_value.__aenter__.side_effect = asyncio.TimeoutError()
+        
+        with pytest.raises(ConnectionError):
+            await client.execute_kw("res.partner", "create", [{"name": "Test"}])
+        
+        mock_session.post.assert_called_once()
+
+    async def test_retries_stop_after_max_retries(self, client: OdooAsyncClient, mock_session: AsyncMock) -> None:
+        """Test that the original error surfaces with its retry count."""
+        client._uid = 2
+        mock_session.post.return_value.__aenter__.side_effect = asyncio.TimeoutError()
+        
+        with patch("odoo_mcp.errors.asyncio.sleep", AsyncMock()):
+            with pytest.raises(ConnectionError) as exc_info:
+                await client.execute_kw("res.partner", "read", [[1]])
+        
+        assert exc_info.value.details["retries"] == 3
+        assert mock_session.post.call_count == 4
+
+    async def test_concurrent_reads_are_coalesced(self, mock_session: AsyncMock, test_config: OdooConnectionConfig) -> None:
+        """Test that identical reads from different clients send one request."""
+        flight = SingleFlight()
+        clients = [
+            OdooAsyncClient(session=mock_session, config=test_config, single_flight=flight)
+            for _ in range(3)
+        ]
+        for client in clients:
+            client._uid = 2
+        
+        async def slow_response() -> AsyncMock:
+            await asyncio.sleep(0.01)
+            response = AsyncMock()
+            response.read.return_value = b'<?xml version="1.0"?><methodResponse><params><param><value><int>7</int></value></param></params></methodResponse>'
+            return response
+        
+        mock_session.post.return_value.__aenter__.side_effect = slow_response
+        
+        results = await asyncio.gather(*(
+            client.execute_kw("product.product", "search_count", [[["sale_ok", "=", True]]])
+            for client in clients
+        ))
+        
+        assert results == [7, 7, 7]
+        mock_session.post.assert_called_once()
+        assert flight.coalesced == 2
+
+    async def test_writes_are_not_coalesced(self, mock_session: AsyncMock, test_config: OdooConnectionConfig) -> None:
+        """Test that identical creates are each sent."""
+        flight = SingleFlight()
+        client = OdooAsyncClient(session=mock_session, config=test_config, single_flight=flight)
+        client._uid = 2
+        
+        response = AsyncMock()
+        response.read.return_value = b'<?xml version="1.0"?><methodResponse><params><param><value><int>7</int></value></param></params></methodResponse>'
+        mock_session.post.return_value.__aenter__.return_value = response
+        
+        await asyncio.gather(*(
+            client.execute_kw("res.partner", "create", [{"name": "Test"}])
+            for _ in range(2)
+        ))
+        
+        assert mock_session.post.call_count == 2
+        assert flight.calls == 0
@@ -240,6 +240,61 @@ class TestRetryDecorator:
         assert "Max retries exceeded" in str(exc_info.value)
 
 
+    async def test_jittered_backoff_stays_within_bounds(self, monkeypatch) -> None:
+        """Test decorrelated-jitter delays."""
+        sleep_times = []
+        
+        async def mock_sleep(seconds: float) -> None:
+            sleep_times.append(seconds)
+        
+        monkeypatch.setattr(asyncio, "sleep", mock_sleep)
+        handler = ErrorHandler(max_retries=6, jitter=True, base_delay=0.5, max_delay=2.0)
+        
+        @handler.with_retry()
+        async def failing_operation() -> str:
+            raise asyncio.TimeoutError("Timeout")
+        
+        with pytest.raises(OdooMCPError):
+            await failing_operation()
+        
+        assert len(sleep_times) == 5
+        assert all(0.5 <= delay <= 2.0 for delay in sleep_times)
+
+    async def test_deadline_and_reraise(self, monkeypatch) -> None:
+        """Test that the deadline stops retries and the original error is kept."""
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+        handler = ErrorHandler(max_retries=5, backoff_factor=10.0, deadline=5.0, reraise=True)
+        call_count = 0
+        
+        @handler.with_retry()
+        async def failing_operation() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise ConnectionError("Connection failed")
+        
+        with pytest.raises(ConnectionError) as exc_info:
+            await failing_operation()
+        
+        # First delay is 1s, the second (10s) would exceed the 5s budget
+        assert call_count == 2
+        assert exc_info.value.details["retries"] == 1
+
+    async def test_should_retry_filter(self) -> None:
+        """Test that should_retry can veto a retry."""
+        handler = ErrorHandler(max_retries=3)
+        call_count = 0
+        
+        @handler.with_retry(should_retry=lambda error: False)
+        async def failing_operation() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise ConnectionError("Connection failed")
+        
+        with pytest.raises(ConnectionError):
+            await failing_operation()
+        assert call_count == 1
+
+
 class TestErrorFormatting:
     """Test error formatting functions."""
 
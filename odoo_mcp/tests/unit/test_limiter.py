@@ -0,0 +1,81 @@
+"""Unit tests for adaptive concurrency limiting."""
+
+import asyncio
+
+import pytest
+
+from odoo_mcp.errors import RateLimitError
+from odoo_mcp.limiter import AdaptiveLimiter
+
+
+class TestAdaptiveLimiter:
+    """Test admission control and AIMD adjustments."""
+
+    async def test_limits_concurrency(self) -> None:
+        """Test that no more than limit requests run at once."""
+        limiter = AdaptiveLimiter(max_limit=2)
+        in_flight = 0
+        peak = 0
+
+        async def request() -> None:
+            nonlocal in_flight, peak
+            async with limiter.slot():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.stats()["admitted"] == 6
+        assert limiter.stats()["max_wait_ms"] > 0
+
+    async def test_overload_halves_limit_once_per_window(self) -> None:
+        """Test that concurrent failures from one window back off once."""
+        limiter = AdaptiveLimiter(max_limit=8)
+
+        async def failing() -> None:
+            async with limiter.slot():
+                await asyncio.sleep(0.01)
+                raise RateLimitError("Too many requests")
+
+        results = await asyncio.gather(*(failing() for _ in range(4)), return_exceptions=True)
+
+        assert all(isinstance(r, RateLimitError) for r in results)
+        assert limiter.stats()["limit"] == 4
+        assert limiter.stats()["throttled"] == 4
+
+    async def test_limit_respects_minimum(self) -> None:
+        """Test that repeated overload stops at min_limit."""
+        limiter = AdaptiveLimiter(max_limit=4, min_limit=2)
+
+        for _ in range(5):
+            with pytest.raises(asyncio.TimeoutError):
+                async with limiter.slot():
+                    raise asyncio.TimeoutError()
+
+        assert limiter.stats()["limit"] == 2
+
+    async def test_success_ramps_limit_back_up(self) -> None:
+        """Test additive increase after a backoff."""
+        limiter = AdaptiveLimiter(max_limit=4)
+        with pytest.raises(RateLimitError):
+            async with limiter.slot():
+                raise RateLimitError("Too many requests")
+        assert limiter.stats()["limit"] == 2
+
+        for _ in range(10):
+            async with limiter.slot():
+                pass
+
+        assert limiter.stats()["limit"] == 4
+
+    async def test_other_errors_do_not_back_off(self) -> None:
+        """Test that application errors leave the limit alone."""
+        limiter = AdaptiveLimiter(max_limit=4)
+        with pytest.raises(ValueError):
+            async with limiter.slot():
+                raise ValueError("bad input")
+
+        assert limiter.stats()["limit"] == 4
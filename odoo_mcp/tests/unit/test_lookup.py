@@ -0,0 +1,77 @@
+"""Unit tests for name resolution."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from odoo_mcp.cache import TTLCache
+from odoo_mcp.errors import ValidationError
+from odoo_mcp.lookup import MAX_INDEX_SIZE, NameIndex, resolve
+
+COUNTRIES = [
+    {"id": 1, "display_name": "Ireland", "name": "Ireland", "code": "IE"},
+    {"id": 2, "display_name": "Iceland", "name": "Iceland", "code": "IS"},
+    {"id": 3, "display_name": "Northern Ireland", "name": "Northern Ireland", "code": "XI"},
+]
+
+
+def make_client(return_value: object) -> MagicMock:
+    client = MagicMock()
+    client.execute_kw = AsyncMock(return_value=return_value)
+    client.metadata_cache = TTLCache()
+    return client
+
+
+class TestNameIndex:
+    """Test local lookups."""
+
+    def test_ilike_ranks_exact_then_prefix(self) -> None:
+        """Test that the exact match comes before substring matches."""
+        index = NameIndex(COUNTRIES, ["name", "code"])
+        assert [m["id"] for m in index.lookup("ireland", "ilike", 10)] == [1, 3]
+
+    def test_exact_operators(self) -> None:
+        """Test case-sensitive and case-insensitive exact matches."""
+        index = NameIndex(COUNTRIES, ["name", "code"])
+        assert index.lookup("ie", "=ilike", 10) == [{"id": 1, "name": "Ireland"}]
+        assert index.lookup("ie", "=", 10) == []
+
+
+class TestResolve:
+    """Test resolution through the index or name_search."""
+
+    async def test_reference_model_is_loaded_once(self) -> None:
+        """Test that repeated lookups reuse one search_read."""
+        client = make_client(COUNTRIES)
+
+        await resolve(client, "res.country", "Ireland")
+        result = await resolve(client, "res.country", "IS", "=ilike")
+
+        assert result == [{"id": 2, "name": "Iceland"}]
+        client.execute_kw.assert_called_once()
+        assert client.execute_kw.call_args.args[1] == "search_read"
+
+    async def test_other_models_use_name_search(self) -> None:
+        """Test the name_search fallback."""
+        client = make_client([[7, "Acme Corp"]])
+
+        result = await resolve(client, "res.partner", "Acme")
+
+        assert result == [{"id": 7, "name": "Acme Corp"}]
+        client.execute_kw.assert_called_once_with(
+            "res.partner", "name_search", ["Acme"], {"operator": "ilike", "limit": 10}
+        )
+
+    async def test_oversized_model_falls_back(self) -> None:
+        """Test that a reference model too large to index uses name_search."""
+        rows = [{"id": i, "display_name": f"Team {i}", "name": f"Team {i}"} for i in range(MAX_INDEX_SIZE + 1)]
+        client = make_client(rows)
+        client.execute_kw.side_effect = [rows, [[5, "Team 5"]]]
+
+        assert await resolve(client, "crm.team", "Team 5", "=") == [{"id": 5, "name": "Team 5"}]
+        assert client.execute_kw.call_args.args[1] == "name_search"
+
+    async def test_unknown_operator(self) -> None:
+        """Test that unsupported operators are rejected."""
+        with pytest.raises(ValidationError):
+            await resolve(make_client([]), "res.country", "Ireland", "like")
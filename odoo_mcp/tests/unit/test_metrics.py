@@ -0,0 +1,126 @@
+"""Unit tests for tool and RPC metrics."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+
+from odoo_mcp.connection import OdooAsyncClient, OdooConnectionConfig
+from odoo_mcp.metrics import Histogram, Metrics, MetricsMiddleware
+
+RESULT = b'<?xml version="1.0"?><methodResponse><params><param><value><int>2</int></value></param></params></methodResponse>'
+FAULT = b'<?xml version="1.0"?><methodResponse><fault><value><struct><member><name>faultString</name><value><string>boom</string></value></member><member><name>faultCode</name><value><int>1</int></value></member></struct></value></fault></methodResponse>'
+
+
+class TestHistogram:
+    """Test histogram bookkeeping."""
+
+    def test_quantiles_and_buckets(self) -> None:
+        """Test bucket placement, quantile estimates and cumulative counts."""
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.75) == 1.0
+        assert histogram.quantile(0.99) == 3.0
+        assert histogram.cumulative() == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+
+    def test_empty_snapshot(self) -> None:
+        """Test that an empty histogram has no quantiles."""
+        snapshot = Histogram().snapshot()
+        assert snapshot["count"] == 0
+        assert snapshot["p95"] is None
+
+
+class TestMetrics:
+    """Test aggregation and export."""
+
+    def test_snapshot_orders_rpc_by_total_time(self) -> None:
+        """Test that RPC rows carry their labels, slowest first."""
+        metrics = Metrics()
+        metrics.observe_rpc("default", "res.partner", "read", 0.1, bytes_out=100, bytes_in=900)
+        metrics.observe_rpc("default", "sale.order", "search_read", 2.0, error=True)
+        metrics.observe_tool("odoo_read", 0.2)
+
+        snapshot = metrics.snapshot()
+
+        assert [row["model"] for row in snapshot["rpc"]] == ["sale.order", "res.partner"]
+        assert snapshot["rpc"][0]["errors"] == 1
+        assert snapshot["rpc"][1]["bytes_in"] == 900
+        assert snapshot["tools"]["odoo_read"]["latency"]["count"] == 1
+
+    def test_render_prometheus(self) -> None:
+        """Test the text exposition format."""
+        metrics = Metrics()
+        metrics.observe_rpc("default", "res.partner", "read", 0.02, bytes_out=100, bytes_in=900)
+        metrics.observe_tool("odoo_read", 0.03, error=True)
+
+        text = metrics.render_prometheus()
+
+        assert "# TYPE odoo_mcp_rpc_duration_seconds histogram" in text
+        assert 'odoo_mcp_rpc_duration_seconds_bucket{instance="default",model="res.partner",method="read",le="0.025"} 1' in text
+        assert 'odoo_mcp_rpc_response_bytes_total{instance="default",model="res.partner",method="read"} 900' in text
+        assert 'odoo_mcp_tool_errors_total{tool="odoo_read"} 1' in text
+
+
+class TestInstrumentation:
+    """Test the recording hooks."""
+
+    @pytest.fixture
+    def config(self) -> OdooConnectionConfig:
+        """Create test configuration."""
+        return OdooConnectionConfig(
+            url="https://odoo.example.com",
+            database="testdb",
+            username="admin",
+            password="secret",
+        )
+
+    async def test_client_records_rpc_calls(self, config: OdooConnectionConfig) -> None:
+        """Test that each round trip is recorded under its model and method."""
+        session = AsyncMock()
+        session.post = MagicMock()
+        ok, fault = AsyncMock(), AsyncMock()
+        ok.status = fault.status = 200
+        ok.read.return_value = RESULT
+        fault.read.return_value = FAULT
+        session.post.return_value.__aenter__.side_effect = [ok, ok, fault]
+        metrics = Metrics()
+        client = OdooAsyncClient(session=session, config=config, metrics=metrics, instance_id="main")
+
+        await client.execute_kw("res.partner", "search_count", [[]])
+        with pytest.raises(Exception):
+            await client.execute_kw("res.partner", "search_count", [[]])
+
+        login = metrics.rpc[("main", "common", "authenticate")]
+        count = metrics.rpc[("main", "res.partner", "search_count")]
+        assert login.latency.count == 1
+        assert count.latency.count == 2
+        assert count.errors == 1
+        assert count.bytes_in == len(RESULT) + len(FAULT)
+        assert count.bytes_out > 0
+
+    async def test_middleware_times_tools(self) -> None:
+        """Test that tool calls and their failures are recorded."""
+        mcp = FastMCP("test")
+        metrics = Metrics()
+        mcp.add_middleware(MetricsMiddleware(metrics))
+
+        @mcp.tool()
+        async def ok() -> int:
+            return 1
+
+        @mcp.tool()
+        async def broken() -> int:
+            raise ValueError("nope")
+
+        await mcp.call_tool("ok", {})
+        with pytest.raises(ToolError):
+            await mcp.call_tool("broken", {})
+
+        assert metrics.tools["ok"].latency.count == 1
+        assert metrics.tools["ok"].errors == 0
+        assert metrics.tools["broken"].errors == 1
@@ -0,0 +1,68 @@
+"""Unit tests for keyset pagination."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from odoo_mcp.errors import ValidationError
+from odoo_mcp.pagination import (
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    iter_pages,
+    query_fingerprint,
+)
+
+
+class TestCursor:
+    """Test continuation tokens."""
+
+    def test_round_trip(self) -> None:
+        """Test that a cursor decodes to the id it was built from."""
+        fingerprint = query_fingerprint("res.partner", [], ["name"])
+        assert decode_cursor(encode_cursor(4242, fingerprint), fingerprint) == 4242
+
+    def test_cursor_is_bound_to_query(self) -> None:
+        """Test that a cursor cannot be replayed against another query."""
+        cursor = encode_cursor(10, query_fingerprint("res.partner", [], None))
+
+        with pytest.raises(ValidationError, match="does not match"):
+            decode_cursor(cursor, query_fingerprint("sale.order", [], None))
+
+    def test_malformed_cursor(self) -> None:
+        """Test that garbage tokens are rejected."""
+        with pytest.raises(ValidationError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor", "abc")
+
+
+class TestKeysetPages:
+    """Test page fetching."""
+
+    async def test_fetch_page_filters_on_id(self) -> None:
+        """Test that pages continue after the last id instead of using OFFSET."""
+        client = MagicMock()
+        client.execute_kw = AsyncMock(return_value=[])
+
+        await fetch_page(client, "res.partner", [["active", "=", True]], ["name"], 100, 500)
+
+        client.execute_kw.assert_called_once_with(
+            "res.partner",
+            "search_read",
+            [[["active", "=", True], ["id", ">", 500]]],
+            {"limit": 100, "order": "id asc", "fields": ["id", "name"]},
+        )
+
+    async def test_iter_pages_walks_until_short_page(self) -> None:
+        """Test that iteration stops after a page smaller than page_size."""
+        client = MagicMock()
+        client.execute_kw = AsyncMock(side_effect=[
+            [{"id": 1}, {"id": 2}],
+            [{"id": 3}, {"id": 4}],
+            [{"id": 5}],
+        ])
+
+        pages = [page async for page in iter_pages(client, "res.partner", [], None, 2)]
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        last_domain = client.execute_kw.call_args.args[2][0]
+        assert last_domain == [["id", ">", 4]]
@@ -0,0 +1,63 @@
+"""Unit tests for reporting period parsing."""
+
+from datetime import date
+
+import pytest
+
+from odoo_mcp.errors import ValidationError
+from odoo_mcp.periods import Period, parse_period
+
+TODAY = date(2024, 5, 15)
+
+
+class TestParsePeriod:
+    """Test translation of period names and ranges."""
+
+    @pytest.mark.parametrize(
+        "name,start,end",
+        [
+            ("today", date(2024, 5, 15), date(2024, 5, 16)),
+            ("this_week", date(2024, 5, 13), date(2024, 5, 20)),
+            ("this_month", date(2024, 5, 1), date(2024, 6, 1)),
+            ("last_month", date(2024, 4, 1), date(2024, 5, 1)),
+            ("last_quarter", date(2024, 1, 1), date(2024, 4, 1)),
+            ("ytd", date(2024, 1, 1), date(2024, 5, 16)),
+            ("last_year", date(2023, 1, 1), date(2024, 1, 1)),
+        ],
+    )
+    def test_named_periods(self, name: str, start: date, end: date) -> None:
+        """Test that named periods resolve relative to today."""
+        assert parse_period(name, TODAY) == Period(start, end)
+
+    def test_last_month_across_year(self) -> None:
+        """Test that last_month in January is December of the previous year."""
+        assert parse_period("last_month", date(2024, 1, 10)) == Period(date(2023, 12, 1), date(2024, 1, 1))
+
+    def test_custom_range_includes_both_ends(self) -> None:
+        """Test that a custom range covers its last day."""
+        period = parse_period("2024-02-01..2024-02-29", TODAY)
+        assert period == Period(date(2024, 2, 1), date(2024, 3, 1))
+        assert period.days == 29
+
+    @pytest.mark.parametrize("value", ["fortnight", "2024-02-10..2024-02-01", "2024-02-30..2024-03-01"])
+    def test_invalid_periods(self, value: str) -> None:
+        """Test that unknown names and bad ranges are rejected."""
+        with pytest.raises(ValidationError):
+            parse_period(value, TODAY)
+
+
+class TestPeriod:
+    """Test period helpers."""
+
+    def test_is_closed(self) -> None:
+        """Test that only periods ending by today are closed."""
+        assert parse_period("last_month", TODAY).is_closed(TODAY)
+        assert not parse_period("this_month", TODAY).is_closed(TODAY)
+
+    def test_domain(self) -> None:
+        """Test the half-open domain on a datetime field."""
+        period = Period(date(2024, 3, 1), date(2024, 4, 1))
+        assert period.domain("date_order") == [
+            ["date_order", ">=", "2024-03-01 00:00:00"],
+            ["date_order", "<", "2024-04-01 00:00:00"],
+        ]
@@ -0,0 +1,51 @@
+"""Unit tests for lean field projection."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from odoo_mcp.projection import lean_fields, project_fields
+
+FIELDS_META = {
+    "id": {"type": "integer", "store": True},
+    "name": {"type": "char", "store": True},
+    "display_name": {"type": "char", "store": False},
+    "image_1920": {"type": "binary", "store": True},
+    "description": {"type": "html", "store": True},
+    "qty_available": {"type": "float", "store": False},
+    "list_price": {"type": "float", "store": True},
+}
+
+
+class TestLeanFields:
+    """Test the default field selection."""
+
+    def test_heavy_fields_are_excluded(self) -> None:
+        """Test that binary, html and non-stored fields are left out."""
+        included, excluded = lean_fields(FIELDS_META)
+        assert included == ["display_name", "id", "list_price", "name"]
+        assert excluded == ["description", "image_1920", "qty_available"]
+
+
+class TestProjectFields:
+    """Test resolving requested fields."""
+
+    async def test_default_uses_fields_get(self) -> None:
+        """Test that no field list selects the lean set."""
+        client = MagicMock()
+        client.execute_kw = AsyncMock(return_value=FIELDS_META)
+
+        fields, excluded = await project_fields(client, "product.product", None)
+
+        assert fields == ["display_name", "id", "list_price", "name"]
+        assert excluded == ["description", "image_1920", "qty_available"]
+        client.execute_kw.assert_called_once_with(
+            "product.product", "fields_get", [], {"attributes": ["type", "store"]}
+        )
+
+    async def test_explicit_and_all_skip_metadata(self) -> None:
+        """Test that explicit lists and 'all' are used as given."""
+        client = MagicMock()
+        client.execute_kw = AsyncMock()
+
+        assert await project_fields(client, "product.product", ["name"]) == (["name"], [])
+        assert await project_fields(client, "product.product", ["all"]) == (None, [])
+        client.execute_kw.assert_not_called()
@@ -0,0 +1,165 @@
+"""Unit tests for prompt data prefetching."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List
+from unittest.mock import MagicMock
+
+from fastmcp import FastMCP
+
+from odoo_mcp.errors import PermissionError
+from odoo_mcp.prompts import PromptRegistry, Query, prefetch
+
+
+def make_pool(execute_kw: Any) -> MagicMock:
+    """Create a pool mock whose clients delegate to execute_kw."""
+    client = MagicMock()
+    client.execute_kw = execute_kw
+
+    @asynccontextmanager
+    async def get_connection(instance_id: str) -> AsyncIterator[MagicMock]:
+        yield client
+
+    pool = MagicMock()
+    pool.get_connection = get_connection
+    return pool
+
+
+class TestPrefetch:
+    """Test concurrent fetching of prompt data."""
+
+    async def test_queries_run_concurrently(self) -> None:
+        """Test that independent queries overlap."""
+        in_flight = 0
+        peak = 0
+
+        async def execute_kw(model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return model
+
+        result = await prefetch(make_pool(execute_kw), "default", {
+            "a": Query("res.partner", "search_count", [[]]),
+            "b": Query("sale.order", "search_count", [[]]),
+        })
+
+        assert result.data == {"a": "res.partner", "b": "sale.order"}
+        assert result.errors == {}
+        assert peak == 2
+
+    async def test_failures_and_timeouts_use_defaults(self) -> None:
+        """Test partial results when one query fails and one is too slow."""
+        async def execute_kw(model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> int:
+            if model == "purchase.order":
+                raise PermissionError("Access denied")
+            if model == "account.move":
+                raise KeyError("amount_residual")
+            if model == "stock.quant":
+                await asyncio.sleep(1)
+            return 3
+
+        result = await prefetch(make_pool(execute_kw), "default", {
+            "ok": Query("res.partner", "search_count", [[]]),
+            "denied": Query("purchase.order", "search_count", [[]], default=0),
+            "broken": Query("account.move", "search_count", [[]], default=0),
+            "slow": Query("stock.quant", "search_count", [[]], default=0),
+        }, timeout=0.05)
+
+        assert result.data == {"ok": 3, "denied": 0, "broken": 0, "slow": 0}
+        assert result.errors["denied"] == "Access denied"
+        assert result.errors["broken"] == "'amount_residual'"
+        assert "timed out" in result.errors["slow"]
+        assert result.unavailable("ok", "Partners") == ""
+
+
+class TestPromptRendering:
+    """Test rendering with partial data."""
+
+    async def test_procurement_renders_without_purchase_data(self) -> None:
+        """Test that a failed query is reported instead of failing the prompt."""
+        async def execute_kw(model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+            if model == "purchase.order":
+                raise PermissionError("Access denied")
+            return [{"name": "Desk", "qty_available": 2, "virtual_available": 1, "reordering_max_qty": 50}]
+
+        mcp = FastMCP("test")
+        PromptRegistry(mcp, make_pool(execute_kw))
+
+        result = await mcp.render_prompt("optimize_procurement", {"instance_id": "default"})
+        text = result.messages[0].content.text
+
+        assert "| Desk | 2 | 1 | 48 |" in text
+        assert "_Purchase order count unavailable: Access denied_" in text
+
+    async def test_inventory_uses_aggregates(self) -> None:
+        """Test that the inventory report is built from grouped stock data."""
+        calls: List[tuple[str, str]] = []
+
+        async def execute_kw(model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+            calls.append((model, method))
+            if model == "stock.quant":
+                return [
+                    {"product_id": [1, "Desk"], "location_id": [8, "WH/Stock"], "quantity": 3.0},
+                    {"product_id": [1, "Desk"], "location_id": [9, "SHOP/Stock"], "quantity": 2.0},
+                    {"product_id": [2, "Chair"], "location_id": [8, "WH/Stock"], "quantity": 40.0},
+                ]
+            if model == "stock.location":
+                return [
+                    {"id": 8, "warehouse_id": [1, "Main"]},
+                    {"id": 9, "warehouse_id": [2, "Shop"]},
+                ]
+            if model == "product.product":
+                return 5
+            if args[0][1][0] == "location_dest_id.usage":
+                return [{"product_id": [2, "Chair"], "product_qty": 10.0}]
+            return [{"product_id": [1, "Desk"], "product_qty": 8.0}]
+
+        mcp = FastMCP("test")
+        PromptRegistry(mcp, make_pool(execute_kw))
+
+        result = await mcp.render_prompt("analyze_inventory", {"instance_id": "default", "warehouse": "Main"})
+        text = result.messages[0].content.text
+
+        assert len(calls) == 5
+        assert all(method != "search_read" or model == "stock.location" for model, method in calls)
+        assert "| Main | 2 | 43 |" in text
+        assert "| Shop | 1 | 2 |" in text
+        assert "| Desk | 5 | -3 |" in text
+        assert "**3 storable products** have no stock on hand" in text
+        assert "**1 products** will have negative stock" in text
+
+    async def test_sales_summary_groups_period_server_side(self) -> None:
+        """Test that sales totals come from read_group over the period and are cached."""
+        calls: List[tuple[str, List[Any]]] = []
+
+        async def execute_kw(model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+            calls.append((method, args))
+            if method == "read_group":
+                return [
+                    {"date_order:day": "01 Mar 2024", "__count": 3, "amount_total": 300.0},
+                    {"date_order:day": "02 Mar 2024", "__count": 1, "amount_total": 100.0},
+                ]
+            return [{"name": "S001", "partner_id": [1, "Acme"], "amount_total": 100.0, "state": "sale"}]
+
+        mcp = FastMCP("test")
+        PromptRegistry(mcp, make_pool(execute_kw))
+        arguments = {"instance_id": "default", "report_type": "sales_summary", "period": "2024-03-01..2024-03-31"}
+
+        result = await mcp.render_prompt("generate_report", arguments)
+        text = result.messages[0].content.text
+
+        method, args = calls[0]
+        assert method == "read_group"
+        assert ["date_order", ">=", "2024-03-01 00:00:00"] in args[0]
+        assert ["date_order", "<", "2024-04-01 00:00:00"] in args[0]
+        assert args[2] == ["date_order:day"]
+        assert "(2024-03-01 to 2024-03-31)" in text
+        assert "**Total Orders**: 4" in text
+        assert "**Total Revenue**: $400.00" in text
+        assert "| 01 Mar 2024 | 3 | $300.00 |" in text
+
+        await mcp.render_prompt("generate_report", arguments)
+        assert len(calls) == 2
@@ -0,0 +1,129 @@
+"""Unit tests for MCP resources."""
+
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+from unittest.mock import MagicMock
+from urllib.parse import quote
+
+import pytest
+from fastmcp import FastMCP
+
+from odoo_mcp.cache import RecordCache
+from odoo_mcp.resources import ResourceHandler
+
+
+class FakePartners:
+    """Client stand-in serving partners 1..250."""
+
+    def __init__(self) -> None:
+        self.calls: List[tuple[str, List[Any], Dict[str, Any]]] = []
+
+    async def execute_kw(
+        self, model: str, method: str, args: List[Any], kwargs: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        kwargs = kwargs or {}
+        self.calls.append((method, args, kwargs))
+        if method == "search_count":
+            return 250
+        if method == "fields_get":
+            return {
+                "id": {"type": "integer", "store": True},
+                "name": {"type": "char", "store": True},
+                "image_1920": {"type": "binary", "store": True},
+            }
+        if model == "ir.model":
+            return [
+                {"id": 1, "model": "res.partner", "name": "Contact"},
+                {"id": 2, "model": "sale.order", "name": "Sales Order"},
+            ]
+        if method == "read":
+            return [{"id": args[0][0], "name": "Acme", "write_date": "2024-01-01 00:00:00"}]
+        upper = next((c[2] for c in args[0] if c[0] == "id"), 251)
+        ids = range(upper - 1, max(upper - 1 - kwargs["limit"], 0), -1)
+        return [{"id": i, "display_name": f"Partner {i}"} for i in ids]
+
+
+@pytest.fixture
+def client() -> FakePartners:
+    return FakePartners()
+
+
+@pytest.fixture
+def mcp(client: FakePartners) -> FastMCP:
+    @asynccontextmanager
+    async def get_connection(instance_id: str) -> AsyncIterator[FakePartners]:
+        yield client
+
+    pool = MagicMock()
+    pool.get_connection = get_connection
+    pool.get_record_cache.return_value = RecordCache()
+    server = FastMCP("test")
+    ResourceHandler(server, pool)
+    return server
+
+
+async def read_json(mcp: FastMCP, uri: str) -> Dict[str, Any]:
+    result = await mcp.read_resource(uri)
+    return json.loads(result.contents[0].content)
+
+
+class TestListRecords:
+    """Test the paginated model listing."""
+
+    async def test_first_page_with_total(self, mcp: FastMCP, client: FakePartners) -> None:
+        """Test one search_read plus a search_count per page."""
+        data = (await read_json(mcp, "odoo://default/res.partner?limit=100"))["data"]
+
+        assert data["count"] == 100
+        assert data["total"] == 250
+        assert data["records"][0]["id"] == 250
+        assert [call[0] for call in client.calls] == ["search_read", "search_count"]
+
+    async def test_next_uri_walks_all_records(self, mcp: FastMCP) -> None:
+        """Test following next URIs until the model is exhausted."""
+        uri: Optional[str] = "odoo://default/res.partner?limit=100&count=false"
+        seen: List[int] = []
+        while uri:
+            data = (await read_json(mcp, uri))["data"]
+            seen.extend(record["id"] for record in data["records"])
+            uri = data["next"]
+
+        assert seen == list(range(250, 0, -1))
+
+    async def test_domain_and_fields_are_passed(self, mcp: FastMCP, client: FakePartners) -> None:
+        """Test that query parameters reach the search_read call."""
+        domain = quote(json.dumps([["is_company", "=", True]]))
+        await read_json(mcp, f"odoo://default/res.partner?domain={domain}&fields=name,email&count=false")
+
+        method, args, kwargs = client.calls[0]
+        assert args == [[["is_company", "=", True]]]
+        assert kwargs["fields"] == ["email", "id", "name"]
+
+    async def test_invalid_domain_is_rejected(self, mcp: FastMCP, client: FakePartners) -> None:
+        """Test that a malformed domain fails before calling Odoo."""
+        with pytest.raises(Exception, match="Invalid search domain"):
+            await mcp.read_resource("odoo://default/res.partner?domain=not-json")
+        assert client.calls == []
+
+
+class TestGetRecord:
+    """Test single-record reads."""
+
+    async def test_lean_default_fields(self, mcp: FastMCP, client: FakePartners) -> None:
+        """Test that heavy fields are left out and reported."""
+        result = await read_json(mcp, "odoo://default/res.partner/7")
+
+        assert result["excluded_fields"] == ["image_1920"]
+        assert client.calls[-1] == ("read", [[7]], {"fields": ["id", "name", "write_date"]})
+
+
+class TestListModels:
+    """Test the model catalog resource."""
+
+    async def test_search_with_counts(self, mcp: FastMCP, client: FakePartners) -> None:
+        """Test that matches come from ir.model with their record counts."""
+        data = (await read_json(mcp, "odoo://default?q=contact"))["data"]
+
+        assert data["models"] == [{"model": "res.partner", "name": "Contact", "count": 250}]
+        assert [call[0] for call in client.calls] == ["search_read", "search_count"]
@@ -0,0 +1,86 @@
+"""Unit tests for MCP tool cache invalidation."""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+
+from odoo_mcp.metrics import Metrics
+from odoo_mcp.tools import ToolRegistry
+
+
+@pytest.fixture
+def pool() -> MagicMock:
+    client = MagicMock()
+    client.execute_kw = AsyncMock(return_value=True)
+
+    @asynccontextmanager
+    async def get_connection(instance_id: str) -> AsyncIterator[Any]:
+        yield client
+
+    pool = MagicMock()
+    pool.metrics = Metrics()
+    pool.get_connection = get_connection
+    pool.get_config.return_value.max_connections = 4
+    return pool
+
+
+@pytest.fixture
+def mcp(pool: MagicMock) -> FastMCP:
+    server = FastMCP("test")
+    ToolRegistry(server, pool)
+    return server
+
+
+class TestWriteInvalidation:
+    """Test that generic calls drop cached records they may have changed."""
+
+    async def test_execute_write_invalidates_model(self, mcp: FastMCP, pool: MagicMock) -> None:
+        """Test that a write through odoo_execute invalidates its model."""
+        await mcp.call_tool(
+            "odoo_execute",
+            {"instance_id": "default", "model": "res.partner", "method": "write", "args": [[1], {"name": "X"}]},
+        )
+
+        pool.invalidate_records.assert_called_once_with("default", "res.partner", None)
+
+    async def test_execute_read_keeps_cache(self, mcp: FastMCP, pool: MagicMock) -> None:
+        """Test that read-only calls leave the cache alone."""
+        await mcp.call_tool(
+            "odoo_execute",
+            {"instance_id": "default", "model": "res.partner", "method": "read", "args": [[1]]},
+        )
+
+        pool.invalidate_records.assert_not_called()
+
+    async def test_batch_invalidates_written_models(self, mcp: FastMCP, pool: MagicMock) -> None:
+        """Test that a batch invalidates each model it wrote to, once."""
+        await mcp.call_tool(
+            "odoo_batch",
+            {
+                "instance_id": "default",
+                "operations": [
+                    {"model": "res.partner", "method": "search", "args": [[]]},
+                    {"model": "sale.order", "method": "unlink", "args": [[3]]},
+                    {"model": "sale.order", "method": "write", "args": [[4], {"note": "x"}]},
+                ],
+            },
+        )
+
+        pool.invalidate_records.assert_called_once_with("default", "sale.order", None)
+
+    async def test_failed_write_still_invalidates(self, mcp: FastMCP, pool: MagicMock) -> None:
+        """Test that a write lost on the network still drops cached records."""
+        async with pool.get_connection("default") as client:
+            client.execute_kw.side_effect = ConnectionError("Connection reset")
+
+        with pytest.raises(ToolError):
+            await mcp.call_tool(
+                "odoo_update",
+                {"instance_id": "default", "model": "res.partner", "ids": [1], "values": {"name": "X"}},
+            )
+
+        pool.invalidate_records.assert_called_once_with("default", "res.partner", [1])
@@ -0,0 +1,139 @@
+"""Unit tests for Odoo wire protocols."""
+
+import json
+import xmlrpc.client
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from odoo_mcp.connection import OdooAsyncClient, OdooConnectionConfig
+from odoo_mcp.errors import AuthenticationError, PermissionError, parse_odoo_error
+from odoo_mcp.transport import (
+    JsonRpcTransport,
+    RpcFault,
+    XmlRpcTransport,
+    get_transport,
+)
+
+
+def json_response(payload: dict[str, Any]) -> MagicMock:
+    """Create a response mock streaming a JSON body in small chunks."""
+    body = json.dumps(payload).encode()
+
+    async def iter_chunked(size: int) -> AsyncIterator[bytes]:
+        for start in range(0, len(body), 7):
+            yield body[start:start + 7]
+
+    response = MagicMock()
+    response.content.iter_chunked = iter_chunked
+    return response
+
+
+class TestTransports:
+    """Test request encoding and response decoding."""
+
+    def test_get_transport(self) -> None:
+        """Test transport lookup by protocol name."""
+        assert isinstance(get_transport("xmlrpc"), XmlRpcTransport)
+        assert isinstance(get_transport("jsonrpc"), JsonRpcTransport)
+        with pytest.raises(ValueError, match="Unknown Odoo protocol"):
+            get_transport("soap")
+
+    def test_jsonrpc_encode(self) -> None:
+        """Test JSON-RPC request layout."""
+        transport = JsonRpcTransport()
+        body = json.loads(transport.encode("object", "execute_kw", ("db", 2, "pw")))
+
+        assert transport.endpoint("https://odoo.example.com", "object") == "https://odoo.example.com/jsonrpc"
+        assert body["method"] == "call"
+        assert body["params"] == {
+            "service": "object",
+            "method": "execute_kw",
+            "args": ["db", 2, "pw"],
+        }
+
+    async def test_jsonrpc_decode_streamed_result(self) -> None:
+        """Test decoding a result delivered in several chunks."""
+        rows = [{"id": i, "name": f"Partner {i}"} for i in range(50)]
+        response = json_response({"jsonrpc": "2.0", "id": 1, "result": rows})
+
+        assert await JsonRpcTransport().decode(response) == rows
+
+    async def test_errors_map_identically_on_both_transports(self) -> None:
+        """Test that the same Odoo error maps to the same exception."""
+        message = "You are not allowed to access 'Contact' (res.partner) records."
+
+        xml_response = AsyncMock()
+        xml_response.read.return_value = xmlrpc.client.dumps(
+            xmlrpc.client.Fault(4, message)
+        ).encode()
+        json_resp = json_response({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "error": {
+                "code": 200,
+                "message": "Odoo Server Error",
+                "data": {
+                    "name": "odoo.exceptions.AccessError",
+                    "debug": "Traceback ...",
+                    "message": message,
+                },
+            },
+        })
+
+        with pytest.raises(RpcFault) as xml_fault:
+            await XmlRpcTransport().decode(xml_response)
+        with pytest.raises(RpcFault) as json_fault:
+            await JsonRpcTransport().decode(json_resp)
+
+        assert xml_fault.value.error_data == json_fault.value.error_data
+        xml_error = parse_odoo_error(xml_fault.value.error_data)
+        json_error = parse_odoo_error(json_fault.value.error_data)
+        assert isinstance(xml_error, PermissionError)
+        assert type(json_error) is type(xml_error)
+        assert json_error.details == xml_error.details
+
+
+class TestJsonRpcClient:
+    """Test the client over JSON-RPC."""
+
+    async def test_execute_kw_over_jsonrpc(self) -> None:
+        """Test that the client posts to /jsonrpc when configured."""
+        config = OdooConnectionConfig(
+            url="https://odoo.example.com",
+            database="testdb",
+            username="admin",
+            password="secret",
+            protocol="jsonrpc",
+        )
+        session = MagicMock()
+        session.post.return_value.__aenter__ = AsyncMock(side_effect=[
+            json_response({"jsonrpc": "2.0", "id": 1, "result": 2}),
+            json_response({"jsonrpc": "2.0", "id": 2, "result": [1, 2, 3]}),
+        ])
+        session.post.return_value.__aexit__ = AsyncMock(return_value=False)
+        client = OdooAsyncClient(session=session, config=config)
+
+        assert await client.execute_kw("res.partner", "search", [[]]) == [1, 2, 3]
+        assert session.post.call_args.args[0] == "https://odoo.example.com/jsonrpc"
+        assert session.post.call_args.kwargs["headers"]["Content-Type"] == "application/json"
+
+    async def test_invalid_credentials_over_jsonrpc(self) -> None:
+        """Test that a false uid raises AuthenticationError."""
+        config = OdooConnectionConfig(
+            url="https://odoo.example.com",
+            database="testdb",
+            username="admin",
+            password="wrong",
+            protocol="jsonrpc",
+        )
+        session = MagicMock()
+        session.post.return_value.__aenter__ = AsyncMock(
+            return_value=json_response({"jsonrpc": "2.0", "id": 1, "result": False})
+        )
+        session.post.return_value.__aexit__ = AsyncMock(return_value=False)
+        client = OdooAsyncClient(session=session, config=config)
+
+        with pytest.raises(AuthenticationError):
+            await client.authenticate()